@@ -0,0 +1,73 @@
+"""Compares Schema.parse with adaptive mode on high reject traffic, where half of the payloads miss a required
+field which is checked after an expensive date and regular expression, and on valid payloads where the int
+fields are specialized. Adaptive mode is measured while sampling and with its profile frozen.
+
+    python benchmarks/bench_adaptive.py
+"""
+
+import timeit
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField, IntField, DateTimeField
+
+
+class EventSchema(Schema):
+
+    created = DateTimeField(date_format="%d %B %Y %H:%M")
+    email = StringField(regex=r"^[\w.+-]+@[\w-]+\.[\w.]+$")
+    count = IntField(min_val=0, max_val=1000)
+    retries = IntField(min_val=0, max_val=10)
+    session = StringField(required=True, max_len=64)
+
+
+class SampledEventSchema(EventSchema):
+    pass
+
+
+class FrozenEventSchema(EventSchema):
+    pass
+
+
+VALID = {
+    "created": "9 October 2021 08:30",
+    "email": "foo@bar.com",
+    "count": 10,
+    "retries": 1,
+    "session": "abc",
+}
+MISSING = dict(VALID, session=None)
+
+
+def run(schema, payloads):
+    for payload in payloads:
+        try:
+            schema.parse(payload)
+        except ValidationError:
+            pass
+
+
+def main():
+    rejected = [VALID, MISSING] * 500
+    valid = [VALID] * 1000
+    SampledEventSchema.enable_adaptive(sample_rate=100, min_samples=100)
+    FrozenEventSchema.enable_adaptive(sample_rate=1, min_samples=1000)
+    run(SampledEventSchema, rejected * 20)
+    run(FrozenEventSchema, rejected)
+    FrozenEventSchema.freeze_profile()
+    print("adapted order:", ", ".join(FrozenEventSchema.get_profile().order))
+
+    for name, payloads in (("50% rejected", rejected), ("valid", valid)):
+        results = [
+            min(timeit.repeat(lambda: run(schema, payloads), number=5, repeat=5))
+            / 5
+            / len(payloads)
+            for schema in (EventSchema, SampledEventSchema, FrozenEventSchema)
+        ]
+        plain, sampled, frozen = (r * 1e6 for r in results)
+        print(
+            f"{name:<13} parse: {plain:5.2f}µs  adaptive: {sampled:5.2f}µs  frozen: {frozen:5.2f}µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
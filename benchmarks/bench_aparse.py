@@ -0,0 +1,93 @@
+"""Compares Schema.aparse, which runs async validators concurrently, with awaiting each validator in turn,
+against an in-process fake datastore with a fixed lookup latency.
+
+    python benchmarks/bench_aparse.py
+"""
+
+import asyncio
+import time
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField, IntField
+
+LATENCY = 0.005
+
+
+class FakeStore:
+    def __init__(self):
+        self.rows = {
+            "users": {"admin"},
+            "emails": set(),
+            "teams": {"core"},
+            "tags": set(),
+        }
+
+    async def exists(self, table, value):
+        await asyncio.sleep(LATENCY)
+        return value in self.rows[table]
+
+
+store = FakeStore()
+
+
+def unique_in(table):
+    async def validator(field, key, value):
+        if await store.exists(table, value):
+            raise ValidationError(f"'{value}' already exists for '{key}'")
+        return value
+
+    return validator
+
+
+def exists_in(table):
+    async def validator(field, key, value):
+        if not await store.exists(table, value):
+            raise ValidationError(f"Unknown value '{value}' for '{key}'")
+        return value
+
+    return validator
+
+
+class SignupSchema(Schema):
+
+    username = StringField(required=True, validator=unique_in("users"))
+    email = StringField(required=True, validator=unique_in("emails"))
+    team = StringField(required=True, validator=exists_in("teams"))
+    tag = StringField(validator=unique_in("tags"))
+    age = IntField(min_val=18)
+
+
+PAYLOAD = {
+    "username": "foo",
+    "email": "foo@bar.com",
+    "team": "core",
+    "tag": "new",
+    "age": 30,
+}
+
+
+async def sequential(data):
+    values = {}
+    for key, field in SignupSchema._get_fields():
+        value = field.validate(key, data.get(key))
+        values[key] = await value if asyncio.iscoroutine(value) else value
+    return values
+
+
+async def measure(label, func, n=50):
+    start = time.perf_counter()
+    for _ in range(n):
+        await func(PAYLOAD)
+    elapsed = (time.perf_counter() - start) / n
+    print(f"{label:<12} {elapsed * 1000:.2f}ms per payload")
+    return elapsed
+
+
+async def main():
+    slow = await measure("sequential", sequential)
+    fast = await measure("aparse", SignupSchema.aparse)
+    print(f"speedup {slow / fast:.2f}x with {LATENCY * 1000:.0f}ms lookups")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Compares the memory use and lookup time of an allow-list of 1,000,000 SKUs loaded from a file into a set
+(the default for `choices`), a SortedTable and a MappedTable, with and without a Bloom prefilter. Memory is
+the Python heap held by the loaded table, measured with tracemalloc. A MappedTable's file is in the page
+cache, shared by every process mapping it, rather than on the heap.
+
+    python benchmarks/bench_choices.py
+"""
+
+import os
+import random
+import tempfile
+import timeit
+import tracemalloc
+
+from liaison import Schema
+from liaison.exceptions import ValidationError
+from liaison.fields import StringField
+from liaison.choices import SortedTable, MappedTable
+
+SIZE = 1_000_000
+
+
+def load(path):
+    with open(path) as f:
+        return f.read().split()
+
+
+def measure(build):
+    tracemalloc.start()
+    table = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return table, size
+
+
+def main():
+    rng = random.Random(0)
+    skus = [f"SKU-{value:010d}" for value in rng.sample(range(10**10), SIZE)]
+    hits = rng.sample(skus, 1000)
+    misses = [f"SKU-{rng.randrange(10 ** 10):010d}" for _ in range(1000)]
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "skus.txt")
+    SortedTable(skus).save(path)
+
+    cases = [
+        ("set", lambda: set(load(path))),
+        ("SortedTable", lambda: SortedTable.from_file(path)),
+        ("SortedTable prefilter", lambda: SortedTable.from_file(path, prefilter=True)),
+        ("MappedTable", lambda: MappedTable(path)),
+        ("MappedTable prefilter", lambda: MappedTable(path, prefilter=True)),
+    ]
+    print(f"{'':<22} {'memory':>9} {'hit':>9} {'miss':>9} {'parse miss':>11}")
+    for name, build in cases:
+        table, size = measure(build)
+        hit = (
+            min(
+                timeit.repeat(
+                    lambda: [sku in table for sku in hits], number=10, repeat=5
+                )
+            )
+            / 10_000
+        )
+        miss = (
+            min(
+                timeit.repeat(
+                    lambda: [sku in table for sku in misses], number=10, repeat=5
+                )
+            )
+            / 10_000
+        )
+
+        class OrderSchema(Schema):
+            sku = StringField(required=True, choices=table)
+
+        def parse_misses():
+            for sku in misses:
+                try:
+                    OrderSchema.parse({"sku": sku})
+                except ValidationError:
+                    pass
+
+        parse = min(timeit.repeat(parse_misses, number=10, repeat=5)) / 10_000
+        print(
+            f"{name:<22} {size / 2 ** 20:7.1f}MB {hit * 1e9:7.0f}ns {miss * 1e9:7.0f}ns {parse * 1e9:9.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compares DateTimeField parsing with datetime.strptime for common formats, with and without the cache.
+
+python benchmarks/bench_datetime.py
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from liaison import Schema
+from liaison.fields import DateTimeField
+
+FORMATS = [
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%d %b %Y",
+]
+
+
+def make_values(date_format, n, distinct):
+    start = datetime(2021, 1, 1)
+    return [
+        (start + timedelta(seconds=3607 * (i % distinct))).strftime(date_format)
+        for i in range(n)
+    ]
+
+
+def main():
+    n = 50_000
+    for date_format in FORMATS:
+        values = make_values(date_format, n, distinct=n)
+        repeated = make_values(date_format, n, distinct=100)
+
+        class EventSchema(Schema):
+            at = DateTimeField(date_format=date_format)
+
+        class CachedEventSchema(Schema):
+            at = DateTimeField(date_format=date_format, cache_size=1024)
+
+        strptime = datetime.strptime
+        baseline = min(
+            timeit.repeat(
+                lambda: [strptime(v, date_format) for v in values], number=1, repeat=3
+            )
+        )
+        records = [{"at": v} for v in values]
+        field = min(
+            timeit.repeat(lambda: EventSchema.parse_many(records), number=1, repeat=3)
+        )
+        records = [{"at": v} for v in repeated]
+        cached = min(
+            timeit.repeat(
+                lambda: CachedEventSchema.parse_many(records), number=1, repeat=3
+            )
+        )
+        print(
+            f"{date_format:<22} strptime: {baseline / n * 1e6:.2f}us  "
+            f"parse: {field / n * 1e6:.2f}us ({baseline / field:.1f}x)  "
+            f"cached parse (100 distinct): {cached / n * 1e6:.2f}us ({baseline / cached:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
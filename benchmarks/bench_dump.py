@@ -0,0 +1,90 @@
+"""Compares Schema.dump_json with `Namespace.to_dict` followed by `json.dumps` with a `default` hook for
+datetimes, sets and UUIDs, for a single result and for writing 10,000 results with Schema.dump_many.
+dump_json uses orjson if it's installed.
+
+    python benchmarks/bench_dump.py
+"""
+
+import datetime
+import io
+import json
+import timeit
+import uuid
+
+from liaison import Schema
+from liaison.encoding import orjson
+from liaison.fields import (
+    StringField,
+    IntField,
+    FloatField,
+    BoolField,
+    SetField,
+    DateTimeField,
+    UUIDField,
+)
+
+
+class OrderSchema(Schema):
+
+    id = UUIDField(as_uuid=True)
+    customer = StringField()
+    quantity = IntField()
+    total = FloatField()
+    paid = BoolField()
+    tags = SetField()
+    created = DateTimeField(date_format="%Y-%m-%dT%H:%M:%S")
+    shipped = DateTimeField(date_format="%Y-%m-%dT%H:%M:%S")
+
+
+def default(value):
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%dT%H:%M:%S")
+    if isinstance(value, set):
+        return list(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(value)
+
+
+def main():
+    print(f"orjson: {'installed' if orjson is not None else 'not installed'}")
+    result = OrderSchema.parse(
+        {
+            "id": "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c",
+            "customer": "foo",
+            "quantity": 3,
+            "total": 29.97,
+            "paid": True,
+            "tags": ["gift"],
+            "created": "2021-10-09T08:30:00",
+        }
+    )
+    results = [result] * 10_000
+
+    def to_dict_json():
+        return json.dumps(result.to_dict(), default=default)
+
+    def dump_many_baseline():
+        f = io.StringIO()
+        for r in results:
+            f.write(json.dumps(r.to_dict(), default=default))
+            f.write("\n")
+
+    def dump_many():
+        OrderSchema.dump_many(results, io.BytesIO(), ndjson=True)
+
+    cases = [
+        ("single result", to_dict_json, lambda: OrderSchema.dump_json(result), 10_000),
+        ("10,000 results", dump_many_baseline, dump_many, 5),
+    ]
+    for name, baseline, dump, number in cases:
+        before = min(timeit.repeat(baseline, number=number, repeat=5)) / number
+        after = min(timeit.repeat(dump, number=number, repeat=5)) / number
+        print(
+            f"{name:<15} to_dict + json.dumps: {before * 1e6:9.1f}µs  liaison: {after * 1e6:9.1f}µs  "
+            f"({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
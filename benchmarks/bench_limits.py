@@ -0,0 +1,68 @@
+"""Times adversarial payloads against a schema without limits and the same schema with limits: a JSON
+document with 100,000 junk keys, a 4,000 digit numeric string, and a string triggering catastrophic
+backtracking in a regex. With limits each payload is rejected in time independent of its size.
+
+    python benchmarks/bench_limits.py
+"""
+
+import json
+import timeit
+
+from liaison import Schema
+from liaison.exceptions import ValidationError
+from liaison.fields import IntField, StringField
+from liaison.limits import Limits
+
+# Nested quantifiers backtrack exponentially on a run of "a" not followed by "b"
+PATTERN = "(a+)+b"
+
+
+class OpenSchema(Schema):
+    id = IntField()
+    code = StringField(regex=PATTERN)
+
+
+class LimitedSchema(Schema):
+    __limits__ = Limits(max_keys=20, max_size=16 * 1024, unknown_keys="forbid")
+
+    id = IntField(max_digits=20)
+    code = StringField(max_len=12, regex=PATTERN)
+
+
+def attempt(parse, payload):
+    def run():
+        try:
+            parse(payload)
+        except ValidationError:
+            pass
+
+    return run
+
+
+def main():
+    junk = json.dumps({f"key_{i}": i for i in range(100_000)}).encode()
+    cases = [
+        (
+            "100k junk keys (parse_json)",
+            lambda schema: attempt(schema.parse_json, junk),
+            10,
+        ),
+        (
+            "4000 digit number",
+            lambda schema: attempt(schema.parse, {"id": "9" * 4000}),
+            1_000,
+        ),
+        (
+            "backtracking regex, 22 chars",
+            lambda schema: attempt(schema.parse, {"code": "a" * 22}),
+            1,
+        ),
+    ]
+    for name, case, number in cases:
+        for schema in (OpenSchema, LimitedSchema):
+            elapsed = min(timeit.repeat(case(schema), number=number, repeat=3)) / number
+            print(f"{name:<30} {schema.__name__:<14} {elapsed * 1e6:12.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compares a custom validator with and without `cache=`, validating records whose values repeat, as
+country codes or tags do.
+
+    python benchmarks/bench_memoized_validator.py
+"""
+
+import random
+import re
+import timeit
+import unicodedata
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField
+
+COUNTRIES = [f"Country {i}" for i in range(200)]
+_WORDS = re.compile(r"[^\w]+")
+
+
+def normalize_country(field, key, value):
+    # Normalization and a linear lookup, the kind of work custom validators do
+    value = _WORDS.sub(" ", unicodedata.normalize("NFKC", value)).strip().title()
+    if value not in COUNTRIES:
+        raise ValidationError(f"Unknown country '{value}'")
+    return value
+
+
+class PlainSchema(Schema):
+    country = StringField(validator=normalize_country)
+
+
+class MemoizedSchema(Schema):
+    country = StringField()
+
+    @country.validator(cache=256)
+    def validate_country(self, key, value):
+        return normalize_country(self, key, value)
+
+
+def main():
+    random.seed(0)
+    records = [{"country": random.choice(COUNTRIES).lower()} for _ in range(100_000)]
+    n = len(records)
+    plain = min(
+        timeit.repeat(lambda: PlainSchema.parse_many(records), number=1, repeat=5)
+    )
+    memoized = min(
+        timeit.repeat(lambda: MemoizedSchema.parse_many(records), number=1, repeat=5)
+    )
+    print(
+        f"validator: {plain / n * 1e9:.0f}ns/record  cache=256: {memoized / n * 1e9:.0f}ns/record  "
+        f"({plain / memoized:.1f}x)"
+    )
+    print(MemoizedSchema.country.validator_cache_info())
+
+
+if __name__ == "__main__":
+    main()
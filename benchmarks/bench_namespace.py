@@ -0,0 +1,73 @@
+"""Compares the argparse based Namespace with the slotted namespace classes generated for each Schema:
+memory held by parsed records, construction time and to_dict time.
+
+    python benchmarks/bench_namespace.py [records]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from liaison import Schema
+from liaison.namespace import Namespace
+from liaison.fields import StringField, IntField, FloatField, BoolField
+
+
+class ProductSchema(Schema):
+
+    name = StringField()
+    category = StringField()
+    price = FloatField()
+    stock = IntField()
+    in_stock = BoolField()
+    rating = FloatField()
+
+
+VALUES = {
+    "name": "shoe",
+    "category": "shoes",
+    "price": 9.99,
+    "stock": 10,
+    "in_stock": True,
+    "rating": 4.5,
+}
+
+
+def held_memory(build, n):
+    tracemalloc.start()
+    records = [build() for _ in range(n)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cls = ProductSchema._get_plan().result
+    values = [VALUES[name] for name in cls._fields]
+
+    cases = {
+        "Namespace": (lambda: Namespace(**VALUES), Namespace(**VALUES)),
+        cls.__name__: (lambda: cls(*values), cls(*values)),
+    }
+    for label, (build, instance) in cases.items():
+        memory = held_memory(build, n)
+        construct = min(timeit.repeat(build, number=n, repeat=5)) / n
+        to_dict = min(timeit.repeat(instance.to_dict, number=n, repeat=5)) / n
+        exclude = (
+            min(
+                timeit.repeat(
+                    lambda: instance.to_dict(exclude=["name"]), number=n, repeat=5
+                )
+            )
+            / n
+        )
+        print(
+            f"{label:<24} {memory / n:>6.0f} bytes/record  construct {construct * 1e9:>5.0f}ns  "
+            f"to_dict {to_dict * 1e9:>5.0f}ns  to_dict(exclude) {exclude * 1e9:>5.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Compares nested parsing with SchemaField against parsing nested dictionaries by hand, on wide documents
+(many nested records) and deep documents (long chains of nested records).
+
+    python benchmarks/bench_nested.py
+"""
+
+import sys
+import timeit
+
+from liaison import Schema
+from liaison.fields import (
+    StringField,
+    IntField,
+    FloatField,
+    ListField,
+    DictField,
+    SchemaField,
+)
+
+
+class AddressSchema(Schema):
+    city = StringField(required=True)
+    zip_code = StringField(max_len=8)
+
+
+class OrderSchema(Schema):
+    order_id = IntField(required=True)
+    total = FloatField(min_val=0)
+    address = SchemaField(AddressSchema, required=True)
+
+
+class CustomerSchema(Schema):
+    name = StringField()
+    orders = ListField(of=SchemaField(OrderSchema))
+
+
+class NodeSchema(Schema):
+    value = IntField()
+    child = SchemaField(lambda: NodeSchema)
+
+
+# The same schemas, with the nested records parsed by hand
+class ManualOrderSchema(Schema):
+    order_id = IntField(required=True)
+    total = FloatField(min_val=0)
+    address = DictField(required=True)
+
+
+class ManualCustomerSchema(Schema):
+    name = StringField()
+    orders = ListField()
+
+
+class ManualNodeSchema(Schema):
+    value = IntField()
+    child = DictField()
+
+
+def parse_customer_by_hand(data):
+    customer = ManualCustomerSchema.parse(data)
+    orders = []
+    for order in customer.orders or []:
+        order = ManualOrderSchema.parse(order)
+        order.address = AddressSchema.parse(order.address)
+        orders.append(order)
+    customer.orders = orders
+    return customer
+
+
+def parse_node_by_hand(data):
+    node = ManualNodeSchema.parse(data)
+    if node.child is not None:
+        node.child = parse_node_by_hand(node.child)
+    return node
+
+
+def main():
+    for width in (10, 1000):
+        document = {
+            "name": "foo",
+            "orders": [
+                {
+                    "order_id": i,
+                    "total": 9.99,
+                    "address": {"city": "London", "zip_code": "N1"},
+                }
+                for i in range(width)
+            ],
+        }
+        manual = (
+            min(
+                timeit.repeat(
+                    lambda: parse_customer_by_hand(document), number=20, repeat=5
+                )
+            )
+            / 20
+        )
+        nested = (
+            min(
+                timeit.repeat(
+                    lambda: CustomerSchema.parse(document), number=20, repeat=5
+                )
+            )
+            / 20
+        )
+        print(
+            f"wide, {width:>4} orders  by hand: {manual * 1e6:8.1f}us  SchemaField: {nested * 1e6:8.1f}us  "
+            f"({manual / nested:.2f}x)"
+        )
+
+    for depth in (10, 500, 50_000):
+        document = None
+        for value in range(depth):
+            document = {"value": value, "child": document}
+        nested = (
+            min(timeit.repeat(lambda: NodeSchema.parse(document), number=5, repeat=3))
+            / 5
+        )
+        if depth < sys.getrecursionlimit() // 2:
+            manual = (
+                min(
+                    timeit.repeat(
+                        lambda: parse_node_by_hand(document), number=5, repeat=3
+                    )
+                )
+                / 5
+            )
+            by_hand = f"{manual * 1e6:8.1f}us"
+            ratio = f"({manual / nested:.2f}x)"
+        else:
+            by_hand, ratio = "RecursionError".rjust(10), ""
+        print(
+            f"deep, depth {depth:>5}  by hand: {by_hand}  SchemaField: {nested * 1e6:8.1f}us  {ratio}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compares Schema.parse with and without a ParseCache, for a repeated small query payload (hits), unique
+payloads (misses) and a repeated invalid payload with `cache_errors`.
+
+    python benchmarks/bench_parse_cache.py
+"""
+
+import timeit
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField, IntField, BoolField, DateTimeField, UUIDField
+
+
+class QuerySchema(Schema):
+
+    offset = IntField(min_val=0, default=0)
+    limit = IntField(max_val=100)
+    search = StringField(max_len=64, regex=r"^[\w ]+$")
+    product_id = UUIDField(as_uuid=True)
+    category = StringField()
+    since = DateTimeField(date_format="%d/%m/%Y %H:%M")
+    in_stock = BoolField()
+
+
+class CachedQuerySchema(QuerySchema):
+    pass
+
+
+def _reject(schema, payload):
+    try:
+        schema.parse(payload)
+    except ValidationError:
+        pass
+
+
+def main():
+    CachedQuerySchema.enable_cache(maxsize=10_000, cache_errors=True)
+    payload = {
+        "offset": 10,
+        "limit": 20,
+        "search": "running shoes",
+        "product_id": "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c",
+        "category": "footwear",
+        "since": "9/10/2021 8:30",
+        "in_stock": True,
+    }
+    invalid = dict(payload, limit=500)
+    unique = [dict(payload, offset=i) for i in range(100_000)]
+
+    cases = [
+        ("repeated payload", lambda s: s.parse(payload), 100_000),
+        ("repeated invalid payload", lambda s: _reject(s, invalid), 100_000),
+        ("unique payloads", lambda s: [s.parse(p) for p in unique], 1),
+    ]
+    for name, func, number in cases:
+        operations = number if number > 1 else len(unique)
+        plain = (
+            min(timeit.repeat(lambda: func(QuerySchema), number=number, repeat=5))
+            / operations
+        )
+        cached = (
+            min(timeit.repeat(lambda: func(CachedQuerySchema), number=number, repeat=5))
+            / operations
+        )
+        print(
+            f"{name:<26} parse: {plain * 1e9:6.0f}ns  cached: {cached * 1e9:6.0f}ns  ({plain / cached:.2f}x)"
+        )
+    print(CachedQuerySchema.get_cache().cache_info())
+
+
+if __name__ == "__main__":
+    main()
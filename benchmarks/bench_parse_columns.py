@@ -0,0 +1,64 @@
+"""Compares Schema.parse_columns with converting the columns to records for Schema.parse_many.
+
+pip install numpy
+python benchmarks/bench_parse_columns.py
+"""
+
+import timeit
+
+import numpy as np
+
+from liaison import Schema
+from liaison.fields import IntField, FloatField, BoolField
+
+
+class ReadingSchema(Schema):
+
+    sensor = IntField(required=True, min_val=1, max_val=1000)
+    value = FloatField(min_val=-50.0, max_val=150.0)
+    calibrated = BoolField(default=True)
+
+
+def make_columns(n):
+    rng = np.random.default_rng(0)
+    value = rng.uniform(-60.0, 160.0, n)
+    value[::50] = np.nan
+    return {
+        "sensor": rng.integers(0, 1000, n),
+        "value": value,
+        "calibrated": np.ma.masked_array(rng.random(n) > 0.5, mask=rng.random(n) > 0.9),
+    }
+
+
+def as_records(columns):
+    names = list(columns)
+    values = []
+    for column in columns.values():
+        # tolist returns None for masked entries, NaN is converted to None
+        values.append([None if v != v else v for v in column.tolist()])
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def main():
+    for n in (100_000, 1_000_000):
+        columns = make_columns(n)
+        rows = min(
+            timeit.repeat(
+                lambda: ReadingSchema.parse_many(as_records(columns)),
+                number=1,
+                repeat=3,
+            )
+        )
+        vector = min(
+            timeit.repeat(
+                lambda: ReadingSchema.parse_columns(columns), number=1, repeat=3
+            )
+        )
+        print(
+            f"{n:>9} rows  parse_many: {rows / n * 1e9:.0f}ns/row  "
+            f"parse_columns: {vector / n * 1e9:.1f}ns/row  speedup: {rows / vector:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
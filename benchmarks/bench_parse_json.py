@@ -0,0 +1,62 @@
+"""Compares Schema.parse_json with `json.loads` followed by `Schema.parse`, for a small payload and for
+large payloads where most keys aren't declared by the schema. parse_json uses orjson if it's installed.
+
+    python benchmarks/bench_parse_json.py
+"""
+
+import json
+import timeit
+
+from liaison import Schema
+from liaison.decoding import orjson
+from liaison.fields import StringField, IntField, FloatField, BoolField
+
+
+class EventSchema(Schema):
+
+    id = IntField(required=True)
+    name = StringField(max_len=64)
+    score = FloatField(min_val=0)
+    active = BoolField()
+
+
+def make_payload(unknown: int) -> bytes:
+    payload = {"id": 1, "name": "signup", "score": 9.5, "active": True}
+    for i in range(unknown):
+        payload[f"extra_{i}"] = {
+            "source": "web",
+            "tags": ["a", "b", "c"],
+            "value": i * 1.5,
+        }
+    return json.dumps(payload).encode()
+
+
+def main():
+    print(f"orjson: {'installed' if orjson is not None else 'not installed'}")
+    for unknown in (0, 100, 1_000):
+        raw = make_payload(unknown)
+        number = max(10, 20_000 // (unknown + 1))
+        stdlib = (
+            min(
+                timeit.repeat(
+                    lambda: EventSchema.parse(json.loads(raw)), number=number, repeat=5
+                )
+            )
+            / number
+        )
+        parse_json = (
+            min(
+                timeit.repeat(
+                    lambda: EventSchema.parse_json(raw), number=number, repeat=5
+                )
+            )
+            / number
+        )
+        print(
+            f"{unknown:>5} unknown keys ({len(raw):>7} bytes)  json.loads + parse: {stdlib * 1e6:8.1f}µs  "
+            f"parse_json: {parse_json * 1e6:8.1f}µs  ({stdlib / parse_json:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
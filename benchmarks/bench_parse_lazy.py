@@ -0,0 +1,61 @@
+"""Compares Schema.parse with Schema.parse_lazy for a schema of 120 optional fields where only 5 fields are
+read, every field is read, and the result is converted with `to_dict`.
+
+    python benchmarks/bench_parse_lazy.py
+"""
+
+import timeit
+
+from liaison import Schema
+from liaison.fields import StringField, IntField, FloatField, BoolField, DateTimeField
+
+FIELD_TYPES = (
+    lambda: IntField(min_val=0),
+    lambda: FloatField(),
+    lambda: StringField(max_len=64, regex=r"^[\w ]+$"),
+    lambda: BoolField(),
+    lambda: DateTimeField(date_format="%Y-%m-%d"),
+)
+VALUES = (7, 1.5, "foo bar", True, "2021-10-09")
+SIZE = 120
+
+WideSchema = type(
+    "WideSchema", (Schema,), {f"field_{i}": FIELD_TYPES[i % 5]() for i in range(SIZE)}
+)
+READ = [f"field_{i}" for i in range(0, SIZE, SIZE // 5)]
+
+
+def read(result, names):
+    for name in names:
+        getattr(result, name)
+
+
+def main():
+    payload = {f"field_{i}": VALUES[i % 5] for i in range(SIZE)}
+    names = list(payload)
+    cases = [
+        ("read 5 fields", lambda parse: read(parse(payload), READ)),
+        (f"read {SIZE} fields", lambda parse: read(parse(payload), names)),
+        ("to_dict", lambda parse: parse(payload).to_dict()),
+    ]
+    number = 2_000
+    for name, func in cases:
+        eager = (
+            min(timeit.repeat(lambda: func(WideSchema.parse), number=number, repeat=5))
+            / number
+        )
+        lazy = (
+            min(
+                timeit.repeat(
+                    lambda: func(WideSchema.parse_lazy), number=number, repeat=5
+                )
+            )
+            / number
+        )
+        print(
+            f"{name:<16} parse: {eager * 1e6:7.1f}µs  parse_lazy: {lazy * 1e6:7.1f}µs  ({eager / lazy:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
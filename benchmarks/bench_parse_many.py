@@ -0,0 +1,64 @@
+"""Compares Schema.parse_many with calling Schema.parse in a loop.
+
+python benchmarks/bench_parse_many.py
+"""
+
+import timeit
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField, IntField, FloatField, BoolField, UUIDField
+
+
+class ProductSchema(Schema):
+
+    product_id = UUIDField()
+    name = StringField(required=True, max_len=64)
+    category = StringField()
+    price = FloatField(min_val=0.01)
+    stock = IntField(min_val=1, max_val=10000)
+    in_stock = BoolField()
+
+
+def make_records(n, reject_every=10):
+    records = []
+    for i in range(n):
+        record = {
+            "product_id": "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c",
+            "name": f"Product {i}",
+            "category": "shoes",
+            "price": 9.99,
+            "stock": i % 500 + 1,
+            "in_stock": True,
+        }
+        if i % reject_every == 0:
+            del record["name"]
+        records.append(record)
+    return records
+
+
+def parse_loop(records):
+    results, errors = [], []
+    for index, record in enumerate(records):
+        try:
+            results.append(ProductSchema.parse(record))
+        except ValidationError as e:
+            results.append(None)
+            errors.append((index, e))
+    return results, errors
+
+
+def main():
+    for n in (10_000, 100_000):
+        records = make_records(n)
+        loop = min(timeit.repeat(lambda: parse_loop(records), number=1, repeat=5))
+        batch = min(
+            timeit.repeat(lambda: ProductSchema.parse_many(records), number=1, repeat=5)
+        )
+        print(
+            f"{n:>7} records  parse loop: {loop / n * 1e6:.2f}us/record  "
+            f"parse_many: {batch / n * 1e6:.2f}us/record  speedup: {loop / batch:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
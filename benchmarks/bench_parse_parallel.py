@@ -0,0 +1,70 @@
+"""Measures Schema.parse_parallel scaling from 1 to N worker processes on a CPU bound schema, against
+Schema.parse_many in the current process.
+
+    python benchmarks/bench_parse_parallel.py [max workers] [records]
+"""
+
+import os
+import sys
+import time
+
+from liaison import Schema, ValidationError
+from liaison.fields import StringField, IntField, FloatField, BoolField, DateTimeField
+
+
+def check_sku(field, key, value):
+    # Stands in for an expensive custom validator
+    if value is not None and sum(ord(c) for c in value * 20) % 97 == 0:
+        raise ValidationError(f"Invalid checksum for '{key}'")
+    return value
+
+
+class OrderSchema(Schema):
+
+    sku = StringField(required=True, validator=check_sku)
+    email = StringField(regex=r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$")
+    created = DateTimeField(date_format="%Y-%m-%d %H:%M:%S")
+    quantity = IntField(min_val=1, max_val=1000)
+    price = FloatField(min_val=0.01)
+    gift = BoolField()
+
+
+def make_records(n):
+    return [
+        {
+            "sku": f"SKU-{i:08d}",
+            "email": f"user{i}@example.com",
+            "created": "2021-10-09 12:30:00",
+            "quantity": i % 1000 + 1,
+            "price": 9.99,
+            "gift": i % 2 == 0,
+        }
+        for i in range(n)
+    ]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    records = make_records(n)
+
+    baseline = timed(lambda: OrderSchema.parse_many(records))
+    print(f"parse_many      {baseline:.2f}s  {n / baseline:>10,.0f} records/s")
+    for workers in range(1, max_workers + 1):
+        elapsed = timed(
+            lambda: OrderSchema.parse_parallel(records, workers=workers, chunksize=5000)
+        )
+        print(
+            f"{workers:>2} worker(s)    {elapsed:.2f}s  {n / elapsed:>10,.0f} records/s  "
+            f"speedup {baseline / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
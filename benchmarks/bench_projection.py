@@ -0,0 +1,39 @@
+"""Compares parsing every field of a 100 field schema with parsing a projection of 5 fields, with
+`Schema.parse(data, only=...)` and with `exclude` dropping the other 95.
+
+    python benchmarks/bench_projection.py
+"""
+
+import timeit
+
+from liaison import Schema
+from liaison.fields import StringField, IntField, FloatField, BoolField
+
+SIZE = 100
+FIELD_TYPES = (IntField, FloatField, StringField, BoolField)
+VALUES = (7, 1.5, "foo", True)
+
+WideSchema = type(
+    "WideSchema",
+    (Schema,),
+    {f"field_{i}": FIELD_TYPES[i % 4](required=True) for i in range(SIZE)},
+)
+
+
+def main():
+    payload = {f"field_{i}": VALUES[i % 4] for i in range(SIZE)}
+    only = [f"field_{i}" for i in range(0, SIZE, SIZE // 5)]
+    exclude = [name for name in payload if name not in only]
+    cases = [
+        ("every field", lambda: WideSchema.parse(payload)),
+        ("only 5 fields", lambda: WideSchema.parse(payload, only=only)),
+        ("exclude 95 fields", lambda: WideSchema.parse(payload, exclude=exclude)),
+    ]
+    number = 10_000
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{name:<18} {elapsed * 1e6:7.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures the throughput of parsing a frozen schema from a thread pool of 1 to 16 threads. On a free-threaded
+build of Python (e.g. 3.13t) throughput scales with the number of cores, with the GIL it stays flat.
+
+    python benchmarks/bench_threads.py
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from liaison import Schema
+from liaison.fields import (
+    StringField,
+    IntField,
+    FloatField,
+    BoolField,
+    ListField,
+    SchemaField,
+)
+
+
+class ItemSchema(Schema):
+    sku = StringField(required=True, max_len=12)
+    quantity = IntField(required=True, min_val=1)
+
+
+class OrderSchema(Schema):
+    id = IntField(required=True)
+    customer = StringField(min_len=2)
+    total = FloatField(min_val=0)
+    gift = BoolField()
+    items = ListField(of=SchemaField(ItemSchema))
+    tags = ListField(of=StringField())
+
+
+PAYLOAD = {
+    "id": 1,
+    "customer": "alice",
+    "total": 31.5,
+    "gift": False,
+    "items": [{"sku": "ABC-1", "quantity": 2}, {"sku": "DEF-2", "quantity": 1}],
+    "tags": ["new", "priority"],
+}
+PARSES = 200_000
+
+
+def run(threads: int) -> float:
+    parse = OrderSchema.parse
+    per_thread = PARSES // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work(_):
+        barrier.wait()
+        for _ in range(per_thread):
+            parse(PAYLOAD)
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(work, i) for i in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def main():
+    OrderSchema.freeze()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs"
+    )
+    baseline = None
+    for threads in (1, 2, 4, 8, 16):
+        throughput = run(threads)
+        baseline = baseline or throughput
+        print(
+            f"{threads:>2} threads {throughput:>12,.0f} parses/s {throughput / baseline:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
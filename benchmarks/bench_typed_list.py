@@ -0,0 +1,79 @@
+"""Compares validating the items of homogeneous lists with the fast path against validating them one by one,
+and the memory used by lists and arrays of the validated items.
+
+    python benchmarks/bench_typed_list.py
+"""
+
+import sys
+import timeit
+
+from liaison import Schema
+from liaison.fields import ListField, IntField, FloatField, StringField
+
+
+class IdsSchema(Schema):
+    ids = ListField(of=IntField(min_val=0))
+
+
+class IdsArraySchema(Schema):
+    ids = ListField(of=IntField(min_val=0), as_array=True)
+
+
+class ValuesSchema(Schema):
+    values = ListField(of=FloatField())
+
+
+class ValuesArraySchema(Schema):
+    values = ListField(of=FloatField(), as_array=True)
+
+
+class TagsSchema(Schema):
+    tags = ListField(of=StringField())
+
+
+def _size(value) -> int:
+    # The container and, for lists, the boxed items it references
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(map(sys.getsizeof, value))
+    return sys.getsizeof(value)
+
+
+def main():
+    n = 1_000_000
+    ids = list(range(n))
+    values = [float(i) for i in range(n)]
+    tags = [f"tag{i % 1000}" for i in range(n)]
+    cases = [
+        ("ints", IdsSchema, IdsArraySchema, "ids", ids, 1.0),
+        ("floats", ValuesSchema, ValuesArraySchema, "values", values, 1),
+        ("strings", TagsSchema, None, "tags", tags, 1),
+    ]
+    for name, schema, array_schema, key, items, other in cases:
+        # A trailing item of another type fails the fast path, so every item is validated one by one
+        mixed = items[:-1] + [other]
+        fast = min(
+            timeit.repeat(lambda: schema.parse({key: items}), number=1, repeat=3)
+        )
+        slow = min(
+            timeit.repeat(lambda: schema.parse({key: mixed}), number=1, repeat=3)
+        )
+        print(
+            f"{name:<8} one by one: {slow / n * 1e9:6.1f}ns/item  fast path: {fast / n * 1e9:6.1f}ns/item  "
+            f"({slow / fast:.1f}x)"
+        )
+        if array_schema is not None:
+            as_array = min(
+                timeit.repeat(
+                    lambda: array_schema.parse({key: items}), number=1, repeat=3
+                )
+            )
+            list_size = _size(getattr(schema.parse({key: items}), key))
+            array_size = _size(getattr(array_schema.parse({key: items}), key))
+            print(
+                f"{'':<8} as_array: {as_array / n * 1e9:6.1f}ns/item  memory: list {list_size / 1e6:.1f}MB, "
+                f"array {array_size / 1e6:.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compares UUIDField validation with the previous uuid.UUID based check.
+
+python benchmarks/bench_uuid.py
+"""
+
+import timeit
+import uuid
+
+from liaison.fields import UUIDField, StringField
+
+
+def previous_validate(values):
+    # The previous UUIDField.validate: construct a UUID object for each value, discard it and run the
+    # StringField checks
+    string = StringField()
+    for value in values:
+        uuid.UUID(value)
+        string.validate("id", value)
+
+
+def main():
+    n = 100_000
+    values = [str(uuid.uuid4()) for _ in range(n)]
+    field = UUIDField()
+    as_uuid = UUIDField(as_uuid=True)
+
+    baseline = min(timeit.repeat(lambda: previous_validate(values), number=1, repeat=5))
+    results = [
+        ("validate", lambda: [field.validate("id", v) for v in values]),
+        ("validate_many", lambda: field.validate_many("id", values)),
+        ("validate_many as_uuid", lambda: as_uuid.validate_many("id", values)),
+    ]
+    print(f"{'previous validate':<22} {baseline / n * 1e9:.0f}ns/value")
+    for name, func in results:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print(
+            f"{name:<22} {elapsed / n * 1e9:.0f}ns/value  ({baseline / elapsed:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compares Schema.parse_query and Schema.parse_headers with converting the values in a separate pass
+before calling Schema.parse, for a parse_qs dict and a list of ASGI (bytes) headers.
+
+    python benchmarks/bench_web.py
+"""
+
+import timeit
+from urllib.parse import parse_qs
+
+from liaison import Schema
+from liaison.fields import StringField, IntField, FloatField, BoolField, ListField
+
+BOOLS = {"true": True, "false": False, "1": True, "0": False}
+
+
+class QuerySchema(Schema):
+
+    page = IntField(default=1, min_val=1)
+    per_page = IntField(default=20, max_val=100)
+    search = StringField(max_len=64)
+    in_stock = BoolField()
+    min_price = FloatField(min_val=0)
+    category_ids = ListField(of=IntField())
+
+
+class HeaderSchema(Schema):
+
+    user_agent = StringField(required=True)
+    accept = ListField()
+    content_length = IntField(min_val=0)
+    x_request_id = StringField()
+
+
+def convert_query(query: dict) -> dict:
+    """The conversion pass parse_query replaces"""
+    data = {}
+    for key in ("page", "per_page"):
+        if key in query:
+            data[key] = int(query[key][-1])
+    if "search" in query:
+        data["search"] = query["search"][-1]
+    if "in_stock" in query:
+        data["in_stock"] = BOOLS[query["in_stock"][-1].lower()]
+    if "min_price" in query:
+        data["min_price"] = float(query["min_price"][-1])
+    if "category_ids" in query:
+        data["category_ids"] = [int(value) for value in query["category_ids"]]
+    return data
+
+
+def convert_headers(headers: list) -> dict:
+    """The conversion pass parse_headers replaces"""
+    data = {}
+    for key, value in headers:
+        key = key.decode("latin-1").lower().replace("-", "_")
+        value = value.decode("latin-1")
+        if key == "accept":
+            data.setdefault("accept", []).extend(
+                item.strip() for item in value.split(",")
+            )
+        elif key == "content_length":
+            data[key] = int(value)
+        else:
+            data[key] = value
+    return data
+
+
+def main():
+    query = parse_qs(
+        "page=2&per_page=50&search=shoes&in_stock=true&min_price=9.5&category_ids=1&category_ids=7"
+    )
+    headers = [
+        (b"host", b"example.com"),
+        (b"user-agent", b"Mozilla/5.0"),
+        (b"accept", b"text/html,application/json"),
+        (b"accept-encoding", b"gzip"),
+        (b"content-length", b"128"),
+        (b"x-request-id", b"6f1d5d6c"),
+    ]
+    cases = [
+        (
+            "query",
+            lambda: QuerySchema.parse(convert_query(query)),
+            lambda: QuerySchema.parse_query(query),
+        ),
+        (
+            "headers",
+            lambda: HeaderSchema.parse(convert_headers(headers)),
+            lambda: HeaderSchema.parse_headers(headers),
+        ),
+    ]
+    number = 20_000
+    for name, manual, builtin in cases:
+        before = min(timeit.repeat(manual, number=number, repeat=5)) / number
+        after = min(timeit.repeat(builtin, number=number, repeat=5)) / number
+        print(
+            f"{name:<8} convert + parse: {before * 1e6:6.2f}µs  parse_{name}: {after * 1e6:6.2f}µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
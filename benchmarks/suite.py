@@ -0,0 +1,222 @@
+"""Benchmark suite covering each field type, schema sizes, inherited schemas, valid and rejected payloads,
+batch sizes and `Namespace.to_dict`. Runs offline, writes the results as JSON and optionally compares them
+with a baseline, exiting with status 1 if any benchmark is slower by more than the threshold.
+
+    # Record a baseline, e.g. on the main branch
+    python benchmarks/suite.py --output baseline.json
+
+    # Compare a change with it, failing on a slowdown of more than 10%
+    python benchmarks/suite.py --output results.json --baseline baseline.json --threshold 10
+
+Results are the best time per operation (in nanoseconds) of several repeats. Timings are only comparable
+between runs on the same machine.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from liaison import Schema, ValidationError
+from liaison.fields import (
+    StringField,
+    IntField,
+    FloatField,
+    BoolField,
+    ListField,
+    SetField,
+    DictField,
+    DateTimeField,
+    UUIDField,
+)
+
+# (name, function, operations per call)
+Benchmark = Tuple[str, Callable[[], object], int]
+
+# (field, valid value, rejected value) for each field type
+FIELDS = {
+    "StringField": (StringField(max_len=32), "foo bar", "x" * 64),
+    "StringField regex": (
+        StringField(regex=r"^[a-z]+@[a-z]+\.com$"),
+        "foo@bar.com",
+        "foo",
+    ),
+    "IntField": (IntField(min_val=1, max_val=100), 42, 0),
+    "FloatField": (FloatField(min_val=0.5), 9.99, 0.1),
+    "BoolField": (BoolField(), True, "yes"),
+    "ListField": (ListField(max_len=8), [1, 2, 3], "foo"),
+    "SetField": (SetField(max_len=8), [1, 2, 2, 3], "foo"),
+    "DictField": (DictField(min_len=1), {"a": 1}, {}),
+    "DateTimeField": (
+        DateTimeField(date_format="%Y-%m-%d"),
+        "2021-10-09",
+        "09-10-2021",
+    ),
+    "UUIDField": (UUIDField(), "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c", "foo"),
+}
+
+
+def _rejecting(parse: Callable, payload: dict) -> Callable[[], object]:
+    def run():
+        try:
+            parse(payload)
+        except ValidationError:
+            pass
+
+    return run
+
+
+def make_schema(name: str, size: int, base: type = Schema, offset: int = 0) -> type:
+    """Returns a schema of `size` fields, cycling through int, float, string and bool fields"""
+    fields = {}
+    for i in range(offset, offset + size):
+        fields[f"field_{i}"] = (IntField, FloatField, StringField, BoolField)[i % 4](
+            required=True
+        )
+    return type(name, (base,), fields)
+
+
+def make_payload(size: int) -> dict:
+    """Returns a valid payload for a schema built by `make_schema`"""
+    return {f"field_{i}": (7, 1.5, "foo", True)[i % 4] for i in range(size)}
+
+
+def field_benchmarks() -> Iterator[Benchmark]:
+    for name, (field, valid, rejected) in FIELDS.items():
+        schema = type(f"{name.replace(' ', '')}Schema", (Schema,), {"value": field})
+        yield f"field/{name}/valid", lambda s=schema, v=valid: s.parse({"value": v}), 1
+        yield f"field/{name}/rejected", _rejecting(schema.parse, {"value": rejected}), 1
+
+
+def schema_benchmarks() -> Iterator[Benchmark]:
+    for size in (5, 50, 500):
+        schema = make_schema(f"Schema{size}", size)
+        payload = make_payload(size)
+        # The last field checked is rejected, so every check runs. Fields are checked in the order of the
+        # plan, which sorts them by name (field_9 comes after field_10)
+        rejected = dict(payload, **{schema._get_plan().names[-1]: None})
+        yield f"schema/{size} fields/valid", lambda s=schema, p=payload: s.parse(p), 1
+        yield f"schema/{size} fields/rejected", _rejecting(schema.parse, rejected), 1
+        namespace = schema.parse(payload)
+        yield f"to_dict/{size} fields", namespace.to_dict, 1
+
+    # 50 fields declared across a chain of 10 schemas
+    schema = Schema
+    for level in range(10):
+        schema = make_schema(f"Inherited{level}", 5, base=schema, offset=level * 5)
+    payload = make_payload(50)
+    yield "schema/50 fields inherited/valid", lambda: schema.parse(payload), 1
+
+
+def batch_benchmarks() -> Iterator[Benchmark]:
+    schema = make_schema("BatchSchema", 5)
+    for size in (1, 100, 10_000):
+        records = [make_payload(5) for _ in range(size)]
+        for record in records[::10]:
+            record["field_0"] = None
+        yield f"parse_many/{size} records", lambda r=records: schema.parse_many(r), size
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    yield from field_benchmarks()
+    yield from schema_benchmarks()
+    yield from batch_benchmarks()
+
+
+def measure(
+    func: Callable[[], object], operations: int, min_time: float, repeat: int
+) -> float:
+    """Returns the best time per operation of `func` in nanoseconds, each repeat running for at least
+    `min_time` seconds
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number / operations * 1e9
+
+
+def run(pattern: str = "", min_time: float = 0.05, repeat: int = 5) -> Dict[str, float]:
+    results = {}
+    for name, func, operations in benchmarks():
+        if pattern in name:
+            results[name] = measure(func, operations, min_time, repeat)
+            print(f"{name:<45} {results[name]:>12.1f}ns", file=sys.stderr)
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """Prints the change of each benchmark against the baseline and returns the names of the benchmarks
+    slower by more than `threshold` percent
+    """
+    regressions = []
+    print(f"{'benchmark':<45} {'baseline':>14} {'current':>14} {'change':>9}")
+    for name, elapsed in results.items():
+        if name not in baseline:
+            continue
+        change = (elapsed / baseline[name] - 1) * 100
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        flag = "  !" if regressed else ""
+        print(
+            f"{name:<45} {baseline[name]:>12.1f}ns {elapsed:>12.1f}ns {change:>+8.1f}%{flag}"
+        )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Maximum slowdown in percent (default: 10)",
+    )
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains this"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Minimum seconds per repeat"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of repeats (default: 5)"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.min_time, args.repeat)
+    if args.output:
+        document = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(
+                f"{len(regressions)} benchmark(s) slower by more than {args.threshold}%: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
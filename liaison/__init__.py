@@ -1,4 +1,4 @@
 from .schema import Schema
-from .exceptions import ValidationError
+from .exceptions import ValidationError, FieldError, ValidationErrors, RowError
 from .fields import StringField, NumberField, IntField, FloatField
 from .decorators import strict_types
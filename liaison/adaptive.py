@@ -0,0 +1,161 @@
+from typing import Any, Callable, Container, Dict, Optional, Sequence, Tuple
+from itertools import count
+
+from .exceptions import ValidationErrors
+from .instrumentation import FieldMetrics, SchemaMetrics, DEFAULT_BUCKETS
+
+# The share of the values of a field which must be of the same type for the field to be specialized
+DOMINANT_SHARE = 0.9
+
+
+class FieldProfile(FieldMetrics):
+    """The metrics of a field in sampled parses, with the count of each type of incoming value"""
+
+    __slots__ = ("types",)
+
+    record_types = True
+
+    def reset(self):
+        super().reset()
+        self.types: Dict[type, int] = {}
+
+    def record(self, type_: type):
+        self.types[type_] = self.types.get(type_, 0) + 1
+
+    @property
+    def rejection_rate(self) -> float:
+        return sum(self.rejections.values()) / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def dominant_type(self) -> Optional[type]:
+        """Returns the type of at least `DOMINANT_SHARE` of the values, None if there's no such type"""
+        total = sum(self.types.values())
+        for type_, n in self.types.items():
+            if n >= total * DOMINANT_SHARE:
+                return type_
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["rejection_rate"] = self.rejection_rate
+        result["mean_ns"] = self.mean_ns
+        result["types"] = {type_.__name__: n for type_, n in self.types.items()}
+        return result
+
+
+class SchemaProfile(SchemaMetrics):
+    """The profile of a schema in adaptive mode, see `Schema.enable_adaptive`. Every `sample_rate`th parse
+    is sampled: every field is validated, timed and its value type recorded. After each `min_samples`
+    samples the plan is adapted: fields are checked in decreasing order of rejection rate per nanosecond, so
+    cheap checks likely to fail run first, and fields whose values are mostly of the field's own type skip
+    their checks for values passing a guard (see `liaison.compiler.value_guard`).
+
+    :param schema: The name of the schema
+    :param sample_rate: Sample one parse out of this many
+    :param min_samples: The number of samples between adaptations
+    :param buckets: The upper bounds of the latency histogram buckets, in nanoseconds
+    """
+
+    def __init__(
+        self,
+        schema: str,
+        sample_rate: int = 100,
+        min_samples: int = 1000,
+        buckets: Sequence[int] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(schema, buckets)
+        self.sample_rate = sample_rate
+        self.min_samples = min_samples
+        self.samples = 0
+        self.frozen = False
+        # The adapted plan, None until enough parses are sampled
+        self.order: Optional[Tuple[str, ...]] = None
+        self.specialized: Dict[str, type] = {}
+
+    def field(self, name: str) -> FieldProfile:
+        metrics = self.fields.get(name)
+        if metrics is None:
+            metrics = self.fields[name] = FieldProfile(self.bounds)
+        return metrics
+
+    def adapt(self, fields: Sequence[Tuple[str, Any]], guarded: Container[str]):
+        """Computes the check order and specialized fields from the samples so far
+
+        :param fields: The (name, field) table of the schema
+        :param guarded: The names of the fields which have a value guard
+        """
+        scores = {}
+        specialized = {}
+        for name, field in fields:
+            profile = self.fields.get(name)
+            if profile is None or not profile.calls:
+                continue
+            # At least 1ns, timings of cheap checks may round down to 0
+            scores[name] = profile.rejection_rate / max(profile.mean_ns, 1.0)
+            if name in guarded and profile.dominant_type() is field.type:
+                specialized[name] = field.type
+        # Stable, so fields which are never rejected keep their order
+        self.order = tuple(
+            sorted(
+                (name for name, _ in fields), key=lambda name: -scores.get(name, 0.0)
+            )
+        )
+        self.specialized = specialized
+
+    def reset(self):
+        """Discards the samples, keeping the adapted plan"""
+        super().reset()
+        self.samples = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the samples, adapted plan and the metrics of each field"""
+        return {
+            "samples": self.samples,
+            "frozen": self.frozen,
+            "order": list(self.order) if self.order is not None else None,
+            "specialized": {
+                name: type_.__name__ for name, type_ in self.specialized.items()
+            },
+            "fields": super().to_dict(),
+        }
+
+
+def adaptive_parse(
+    profile: SchemaProfile,
+    fields: Sequence[Tuple[str, Any]],
+    build: Callable[[], Callable],
+    sample: Callable,
+    guarded: Container[str],
+) -> Callable:
+    """Returns a parse function sampling parses with `sample`, a parse function collecting the errors of
+    every field instrumented with the profile, and parsing the others with the function returned by `build`,
+    rebuilt after each `min_samples` samples
+
+    :param profile: The profile of the schema
+    :param fields: The (name, field) table of the schema
+    :param build: Compiles the parse function for the current plan of the profile
+    :param sample: The sampling parse function
+    :param guarded: The names of the fields which have a value guard
+    """
+    current = [build()]
+    calls = count(1)
+    sample_rate = profile.sample_rate
+
+    def parse(data):
+        if next(calls) % sample_rate:
+            return current[0](data)
+        try:
+            return sample(data)
+        except ValidationErrors as e:
+            # Like parse, the first error is raised
+            raise e.errors[0] from None
+        finally:
+            profile.samples += 1
+            if profile.samples % profile.min_samples == 0:
+                profile.adapt(fields, guarded)
+                current[0] = build()
+
+    return parse
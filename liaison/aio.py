@@ -0,0 +1,44 @@
+from typing import Any, Callable, List, Optional, Tuple
+import asyncio
+
+from .exceptions import FieldError
+
+
+async def resolve(
+    values: List[Any],
+    pending: List[Tuple[int, str, Callable, tuple]],
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+):
+    """Runs the pending async validator calls of a prepared parse concurrently, storing their results in
+    `values`. If any fail, the error of the first failing field (in field order) is raised once all calls
+    have completed.
+
+    :param values: The values of the parse, in field order
+    :param pending: The (index, key, func, args) calls returned by a prepare function
+    :param concurrency: An optional maximum number of validators to run at once
+    :param timeout: An optional timeout in seconds, applied to each validator call
+    """
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def run(func: Callable, args: tuple):
+        if semaphore is None:
+            return await _call(func, args, timeout)
+        async with semaphore:
+            return await _call(func, args, timeout)
+
+    outcomes = await asyncio.gather(
+        *(run(func, args) for _, _, func, args in pending), return_exceptions=True
+    )
+    for (index, key, _, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            raise FieldError("timeout", key, None, {"timeout": timeout}) from outcome
+        if isinstance(outcome, BaseException):
+            raise outcome
+        values[index] = outcome
+
+
+async def _call(func: Callable, args: tuple, timeout: Optional[float]):
+    if timeout is None:
+        return await func(*args)
+    return await asyncio.wait_for(func(*args), timeout)
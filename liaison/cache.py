@@ -0,0 +1,275 @@
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Sequence
+from collections import OrderedDict
+from functools import lru_cache
+from inspect import iscoroutinefunction
+from threading import Lock
+from array import array
+import time
+
+from .exceptions import ValidationError, SchemaException
+from .namespace import SchemaNamespace
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a ParseCache"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidatorCacheInfo(NamedTuple):
+    """Statistics of a MemoizedValidator"""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class MemoizedValidator:
+    """A validator memoizing its result, or the ValidationError it raises, for each value in an LRU cache.
+    Cached errors are raised as a new instance on each call. Values of different types are cached
+    separately, unhashable values are validated without the cache.
+    Created by `@field.validator(cache=N)`, or passed as a validator:
+
+        StringField(validator=MemoizedValidator(normalize_country, maxsize=256))
+
+    :param func: The validator, called as `func(field, key, value)`
+    :param maxsize: The maximum number of values to keep
+    """
+
+    def __init__(self, func: Callable, maxsize: int):
+        if iscoroutinefunction(func):
+            raise SchemaException("async validators can't be memoized")
+        if getattr(func, "non_deterministic", False):
+            raise SchemaException("non-deterministic validators can't be memoized")
+        self.func = func
+        self.maxsize = maxsize
+
+        def lookup(field, key: str, value: Any) -> tuple:
+            try:
+                return func(field, key, value), None
+            except ValidationError as e:
+                return None, e
+
+        self._lookup = lru_cache(maxsize=maxsize, typed=True)(lookup)
+
+    def __call__(self, field, key: str, value: Any) -> Any:
+        try:
+            hash(value)
+        except TypeError:
+            return self.func(field, key, value)
+        result, error = self._lookup(field, key, value)
+        if error is not None:
+            raise _copy_error(error)
+        return result
+
+    def __reduce__(self):
+        return MemoizedValidator, (self.func, self.maxsize)
+
+    def cache_info(self) -> ValidatorCacheInfo:
+        info = self._lookup.cache_info()
+        # Every miss adds a value, the values no longer cached were evicted
+        return ValidatorCacheInfo(
+            info.hits,
+            info.misses,
+            info.misses - info.currsize,
+            info.maxsize,
+            info.currsize,
+        )
+
+    def cache_clear(self):
+        self._lookup.cache_clear()
+
+
+def non_deterministic(func: Callable) -> Callable:
+    """Marks a validator as non-deterministic: its result may differ for the same value, e.g. because it
+    reads a clock or a datastore. Parse results of schemas with non-deterministic validators are never
+    cached.
+
+        @name.validator
+        @non_deterministic
+        def validate_name(self, key, value):
+            ...
+    """
+    func.non_deterministic = True
+    return func
+
+
+def is_deterministic(fields: Sequence) -> bool:
+    """Returns True if parsing the fields gives the same result for the same input, so it can be cached.
+    Validators are deterministic unless marked with `non_deterministic`. Callable defaults are only
+    deterministic if they're types (e.g. `default=list`), as functions such as `datetime.now` can't be
+    marked. Nested schemas which aren't compiled into the parent aren't cached either
+
+    :param fields: The fields, including the fields compiled with them (see `Field._compiled_fields`)
+    """
+    for field in fields:
+        if field._nested or getattr(field._validator, "non_deterministic", False):
+            return False
+        if callable(field.default) and not isinstance(field.default, type):
+            return False
+    return True
+
+
+def _freeze(value: Any) -> Hashable:
+    """Returns a hashable key for a value, including the type of the value and, for lists, tuples and
+    dicts, of their items. Raises TypeError for other unhashable values
+    """
+    type_ = type(value)
+    if type_ is list or type_ is tuple:
+        return type_, tuple(map(_freeze, value))
+    if type_ is dict:
+        return type_, frozenset((key, _freeze(item)) for key, item in value.items())
+    hash(value)
+    return type_, value
+
+
+def _copy_error(error: ValidationError) -> ValidationError:
+    """Returns a new instance of a cached error, without a traceback. Cached errors are never raised
+    themselves, as the callers catching an error may change it (e.g. setting its key)
+    """
+    copied = BaseException.__new__(type(error), *error.args)
+    copied.__dict__.update(vars(error))
+    copied.__cause__ = error.__cause__
+    copied.__context__ = error.__context__
+    copied.__suppress_context__ = error.__suppress_context__
+    return copied
+
+
+def _copy(value: Any) -> Any:
+    """Returns a copy of the mutable containers in a parsed value, lists, dicts, sets, arrays and the
+    namespaces of nested schemas, at any depth. Other values are returned as they are
+    """
+    type_ = type(value)
+    if type_ is list:
+        return [_copy(item) for item in value]
+    if type_ is dict:
+        return {key: _copy(item) for key, item in value.items()}
+    if type_ is set:
+        return set(value)
+    if type_ is array:
+        return array(value.typecode, value)
+    if isinstance(value, SchemaNamespace):
+        return type_(*map(_copy, value._values()))
+    return value
+
+
+def _is_shallow(result: SchemaNamespace) -> bool:
+    """Returns True if no value of a result is a mutable container, so the result can be shared as it is"""
+    return all(_copy(value) is value for value in result._values())
+
+
+class ParseCache:
+    """A cache of parse results, keyed by the values of the fields of a schema in the input. See
+    `Schema.enable_cache`. Results are immutable, and the mutable containers in them (lists, dicts, sets,
+    arrays and nested results) are copied when stored and on each hit, so changing the values of a result
+    or its input doesn't change later results.
+
+    :param maxsize: The maximum number of results to keep, the least recently used are evicted first
+    :param ttl: An optional number of seconds after which results expire
+    :param cache_errors: Cache ValidationErrors too, so invalid inputs are rejected without validation
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        cache_errors: bool = False,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_errors = cache_errors
+        self.hits = 0
+        self.misses = 0
+        # key: (result, error, expiry time, True if the result holds containers copied on each hit)
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Removes every result and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def wrap(
+        self,
+        key: Callable[[Any], tuple],
+        names: Sequence[str],
+        parse: Callable,
+        check_limits: Optional[Callable[[Any], None]] = None,
+    ) -> Callable:
+        """Returns `parse` with caching. Keys are built by `key`, a function returning a tuple of the types
+        and values of the fields in the input. Inputs with unhashable values (such as lists) are keyed
+        with `_freeze`, inputs which can't be frozen aren't cached
+
+        :param key: The key function of the schema, see `liaison.compiler.compile_key`
+        :param names: The field names of the schema
+        :param parse: The parse function to cache
+        :param check_limits: An optional function checking the limits of the schema, see
+            `liaison.compiler.compile_limits`. Limits cover keys which aren't fields, and so aren't part of
+            the cache key, so they're checked on every call before the lookup and their errors aren't cached
+        :returns: The cached parse function
+        """
+        entries = self._entries
+        get = entries.get
+        move_to_end = entries.move_to_end
+        ttl = self.ttl
+        monotonic = time.monotonic
+
+        def slow_key(data) -> Optional[Hashable]:
+            try:
+                return tuple(_freeze(data.get(name)) for name in names)
+            except TypeError:
+                return None
+
+        def cached_parse(data):
+            if check_limits is not None:
+                check_limits(data)
+            k = key(data)
+            try:
+                entry = get(k)
+            except TypeError:
+                k = slow_key(data)
+                if k is None:
+                    return parse(data)
+                entry = get(k)
+            if entry is not None and (ttl is None or entry[2] > monotonic()):
+                self.hits += 1
+                try:
+                    move_to_end(k)
+                except KeyError:  # pragma: no cover - evicted by another thread
+                    pass
+                if entry[1] is not None:
+                    raise _copy_error(entry[1])
+                return _copy(entry[0]) if entry[3] else entry[0]
+            self.misses += 1
+            try:
+                result = parse(data)
+            except ValidationError as e:
+                if self.cache_errors:
+                    self._store(
+                        k, (None, _copy_error(e), ttl and monotonic() + ttl, False)
+                    )
+                raise
+            if _is_shallow(result):
+                self._store(k, (result, None, ttl and monotonic() + ttl, False))
+            else:
+                self._store(k, (_copy(result), None, ttl and monotonic() + ttl, True))
+            return result
+
+        return cached_parse
+
+    def _store(self, key: Hashable, entry: tuple):
+        with self._lock:
+            # Re-inserted, so a replaced (expired) entry moves to the end
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,346 @@
+from typing import Any, Iterable, Iterator, Optional, Union
+from bisect import bisect_right
+from zlib import adler32, crc32
+from array import array
+import mmap
+import os
+
+from .exceptions import SchemaException
+
+# The number of entries of a SortedTable between two keys of its index
+BLOCK_SIZE = 32
+# The size of the chunks read when scanning a MappedTable
+CHUNK_SIZE = 1 << 20
+
+_KINDS = (str, int)
+
+
+def _encode(kind: type, value: Any) -> Optional[bytes]:
+    """Returns the bytes stored in a table for a value of the table's kind, None for other values. Strings
+    are converted with `int` for tables of ints, like IntField does, so "007" and "7" are the same value
+    """
+    if kind is str:
+        if type(value) is not str:
+            return None
+        try:
+            return value.encode("utf-8")
+        except UnicodeEncodeError:
+            return None
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            return None
+    if isinstance(value, int):
+        # A bool is stored as the int it equals, like in a set
+        return b"%d" % value
+    return None
+
+
+def _decode(kind: type, key: bytes) -> Any:
+    return key.decode("utf-8") if kind is str else int(key)
+
+
+def _check_kind(kind: type):
+    if kind not in _KINDS:
+        raise SchemaException(
+            f"choice tables store str or int values, not '{kind.__name__}'"
+        )
+
+
+def _sorted_keys(kind: type, values: Iterable) -> list:
+    """Returns the sorted, unique keys of the values of a table"""
+    keys = set()
+    for value in values:
+        key = _encode(kind, value)
+        if key is None:
+            raise SchemaException(
+                f"choice table of {kind.__name__} can't store {value!r}"
+            )
+        if b"\n" in key:
+            raise SchemaException(
+                f"choice table values can't contain a newline, {value!r} does"
+            )
+        keys.add(key)
+    return sorted(keys)
+
+
+class BloomFilter:
+    """A probabilistic set of keys, used by choice tables to reject most values which aren't choices without
+    searching the table. A key which was added is always found, a key which wasn't is found with a
+    probability of about 3% with the default 8 bits per key. Keys are hashed with CRC-32 and Adler-32, so a
+    filter gives the same answers in every process.
+
+    :param keys: The keys, as bytes
+    :param count: The number of keys
+    :param bits_per_key: The size of the filter in bits per key
+    """
+
+    def __init__(self, keys: Iterable[bytes], count: int, bits_per_key: int = 8):
+        self.size = size = max(count * bits_per_key, 64)
+        bits = bytearray((size + 7) // 8)
+        for key in keys:
+            first, step = crc32(key), adler32(key) | 1
+            for position in (
+                first % size,
+                (first + step) % size,
+                (first + 2 * step) % size,
+            ):
+                bits[position >> 3] |= 1 << (position & 7)
+        self.bits = bytes(bits)
+
+    def __contains__(self, key: bytes) -> bool:
+        # Three hashes, derived from the two checksums (Kirsch and Mitzenmacher)
+        bits, size = self.bits, self.size
+        first, step = crc32(key), adler32(key) | 1
+        position = first % size
+        if not bits[position >> 3] & (1 << (position & 7)):
+            return False
+        position = (first + step) % size
+        if not bits[position >> 3] & (1 << (position & 7)):
+            return False
+        position = (first + 2 * step) % size
+        return bits[position >> 3] & (1 << (position & 7)) != 0
+
+
+class ChoiceTable:
+    """Base class of the read-only choice tables accepted by the `choices` parameter of fields. Unlike a
+    set, the values are stored as bytes in one buffer rather than as a Python object each, for allow-lists of
+    hundreds of thousands of values or more. Tables store either str or int values
+    """
+
+    kind: type = str
+    prefilter: Optional[BloomFilter] = None
+
+    def _find(self, key: bytes) -> bool:  # pragma: no cover - implemented by each table
+        raise NotImplementedError
+
+    def _keys(self) -> Iterator[bytes]:  # pragma: no cover - implemented by each table
+        raise NotImplementedError
+
+    def _build_prefilter(self, bits_per_key: int):
+        self.prefilter = BloomFilter(self._keys(), len(self), bits_per_key)
+
+    def __contains__(self, value: Any) -> bool:
+        key = _encode(self.kind, value)
+        if key is None:
+            return False
+        prefilter = self.prefilter
+        if prefilter is not None and key not in prefilter:
+            return False
+        return self._find(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        kind = self.kind
+        return (_decode(kind, key) for key in self._keys())
+
+    def save(self, path: Union[str, os.PathLike]):
+        """Writes the table to a file, one value per line in sorted order, which can be opened as a
+        MappedTable or loaded with `SortedTable.from_file`
+        """
+        with open(path, "wb") as f:
+            for key in self._keys():
+                f.write(key + b"\n")
+
+
+class SortedTable(ChoiceTable):
+    """A choice table keeping its values sorted in a single bytes buffer. A lookup bisects a sparse index
+    holding every `BLOCK_SIZE`th value, then searches one block of the buffer.
+
+        SKUS = SortedTable.from_file("skus.txt")
+
+        class OrderSchema(Schema):
+            sku = StringField(choices=SKUS)
+
+    :param values: The str or int values
+    :param kind: The type of the values, str or int
+    :param prefilter: If True, values which aren't choices are mostly rejected by a BloomFilter first
+    :param bits_per_key: The size of the prefilter in bits per value
+    """
+
+    def __init__(
+        self,
+        values: Iterable[Any],
+        kind: type = str,
+        prefilter: bool = False,
+        bits_per_key: int = 8,
+    ):
+        _check_kind(kind)
+        self.kind = kind
+        keys = _sorted_keys(kind, values)
+        self._init(keys)
+        if prefilter:
+            self._build_prefilter(bits_per_key)
+
+    def _init(self, keys: list):
+        self.count = len(keys)
+        # Each key is preceded and followed by a newline, so a block is searched for b"\n" + key + b"\n"
+        self.buffer = b"\n" + b"".join(key + b"\n" for key in keys)
+        self.index = keys[::BLOCK_SIZE]
+        offsets = array("Q", [0])
+        for start in range(0, len(keys), BLOCK_SIZE):
+            offsets.append(
+                offsets[-1]
+                + sum(len(key) + 1 for key in keys[start : start + BLOCK_SIZE])
+            )
+        self.offsets = offsets
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, os.PathLike],
+        kind: type = str,
+        prefilter: bool = False,
+        bits_per_key: int = 8,
+    ) -> "SortedTable":
+        """Loads a table from a UTF-8 file holding one value per line. Blank lines are ignored"""
+        with open(path, "rb") as f:
+            keys = [line.rstrip(b"\r\n") for line in f]
+        values = [_decode(kind, key) for key in keys if key]
+        return cls(values, kind, prefilter, bits_per_key)
+
+    def _find(self, key: bytes) -> bool:
+        block = bisect_right(self.index, key) - 1
+        if block < 0:
+            return False
+        offsets = self.offsets
+        return (
+            self.buffer.find(
+                b"\n" + key + b"\n", offsets[block], offsets[block + 1] + 1
+            )
+            >= 0
+        )
+
+    def _keys(self) -> Iterator[bytes]:
+        return iter(self.buffer[1:-1].split(b"\n")) if self.count else iter(())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"SortedTable({self.count} {self.kind.__name__} values)"
+
+
+class MappedTable(ChoiceTable):
+    """A choice table searching a memory-mapped file holding one value per line in sorted order, as written
+    by `ChoiceTable.save`. The file is mapped read-only, so its pages are loaded on demand and shared by
+    every process mapping it, including forked workers. A lookup is a binary search of the file.
+
+    Lines must be sorted by their UTF-8 bytes, not by value: `10` comes before `9` in a file of ints, as with
+    `sort` under `LC_ALL=C`. Lines may end with LF or CRLF, and can't be blank. Ints are written without
+    leading zeros or a sign for positive values. The file is checked when it's opened, which reads it once,
+    and a SchemaException is raised if it isn't sorted.
+
+    :param path: The path of the table file
+    :param kind: The type of the values, str or int
+    :param prefilter: If True, values which aren't choices are mostly rejected by a BloomFilter first. The
+        prefilter is built by reading the whole file
+    :param bits_per_key: The size of the prefilter in bits per value
+    :param check: If False, the file isn't checked when it's opened. Lookups in a file which isn't sorted
+        miss values which are in it
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        kind: type = str,
+        prefilter: bool = False,
+        bits_per_key: int = 8,
+        check: bool = True,
+    ):
+        _check_kind(kind)
+        self.kind = kind
+        self.path = os.fspath(path)
+        self._count: Optional[int] = None
+        self._bits_per_key = bits_per_key if prefilter else None
+        self._check = check
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # An empty file can't be mapped
+            self.map = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            )
+        if check:
+            self._check_sorted()
+        if prefilter:
+            self._build_prefilter(bits_per_key)
+
+    def _check_sorted(self):
+        """Checks that the lines of the file are sorted and unique, which the binary search relies on"""
+        previous = None
+        count = 0
+        for count, key in enumerate(self._lines(), 1):
+            if not key:
+                raise SchemaException(
+                    f"choice table file {self.path!r} has a blank line at line {count}"
+                )
+            if self.kind is int and _encode(int, key.decode("utf-8", "replace")) != key:
+                raise SchemaException(
+                    f"choice table file {self.path!r} has {key!r} at line {count}, which isn't an int written "
+                    f"like `ChoiceTable.save` writes it"
+                )
+            if previous is not None and key <= previous:
+                raise SchemaException(
+                    f"choice table file {self.path!r} isn't sorted by bytes: line {count} {key!r} follows "
+                    f"{previous!r}. Sort it with `LC_ALL=C sort -u` or write it with ChoiceTable.save"
+                )
+            previous = key
+        self._count = count
+
+    def _find(self, key: bytes) -> bool:
+        data = self.map
+        low, high = 0, len(data)
+        while low < high:
+            middle = (low + high) // 2
+            newline = data.rfind(b"\n", low, middle)
+            start = low if newline < 0 else newline + 1
+            end = data.find(b"\n", start, high)
+            if end < 0:
+                end = high
+            line = data[start:end]
+            if line[-1:] == b"\r":
+                line = line[:-1]
+            if line == key:
+                return True
+            if line < key:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+    def _keys(self) -> Iterator[bytes]:
+        return filter(None, self._lines())
+
+    def _lines(self) -> Iterator[bytes]:
+        """Yields the lines of the file without their line ending"""
+        data = self.map
+        rest = b""
+        for start in range(0, len(data), CHUNK_SIZE):
+            lines = (rest + data[start : start + CHUNK_SIZE]).split(b"\n")
+            rest = lines.pop()
+            for line in lines:
+                yield line[:-1] if line[-1:] == b"\r" else line
+        if rest:
+            yield rest[:-1] if rest[-1:] == b"\r" else rest
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self._keys())
+        return self._count
+
+    def __bool__(self) -> bool:
+        return len(self.map) > 0
+
+    def __reduce__(self):
+        # A memory map can't be pickled, the file is mapped again by the unpickling process
+        prefilter = self._bits_per_key is not None
+        return MappedTable, (
+            self.path,
+            self.kind,
+            prefilter,
+            self._bits_per_key or 8,
+            self._check,
+        )
+
+    def __repr__(self) -> str:
+        return f"MappedTable({self.path!r}, {self.kind.__name__})"
@@ -0,0 +1,178 @@
+from typing import Any, Dict, Mapping, NamedTuple
+
+from .compiler import is_inlinable
+from .exceptions import ValidationError
+from .fields.base import Field
+from .fields.mixins import NumericFieldMixin
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+# numpy dtype kinds handled with vectorized checks, mapped to the Python type of their elements
+_KINDS = {"b": bool, "i": int, "u": int, "f": float}
+_VECTOR_TYPES = (int, float, bool)
+_INT64_LIMIT = 2.0**63
+
+
+class ColumnResult(NamedTuple):
+    """The result of `Schema.parse_columns`
+
+    :param columns: The validated columns by field name. Columns with missing values left after applying
+        defaults are returned as numpy masked arrays
+    :param mask: A boolean array, True for every row which failed validation
+    :param failures: The indexes of the rows which failed validation
+    """
+
+    columns: Dict[str, Any]
+    mask: Any
+    failures: Any
+
+
+def _is_vectorizable(field: Field) -> bool:
+    """Only fields using the built in numeric and boolean checks, without a custom validator, are vectorized"""
+    cls = type(field)
+    return (
+        field.type in _VECTOR_TYPES
+        and not field._validator
+        and is_inlinable(field)
+        and cls._compile in (Field._compile, NumericFieldMixin._compile)
+        and cls._compile_cast is Field._compile_cast
+    )
+
+
+def _split_nulls(column):
+    """Returns the column data and a boolean array of missing values. Missing values are masked entries
+    of a masked array and NaNs in a float array
+    """
+    if isinstance(column, np.ma.MaskedArray):
+        data = column.data
+        nulls = np.ma.getmaskarray(column).copy()
+    else:
+        data = column
+        nulls = np.zeros(len(column), dtype=bool)
+    if data.dtype.kind == "f":
+        nulls |= np.isnan(data)
+    return data, nulls
+
+
+def _overflows(field: Field, column) -> bool:
+    """Returns True if a float column has finite values too large for the int64 array of an int field.
+    `parse` accepts them as Python ints, so the column is validated one value at a time instead
+    """
+    if field.type is not int or column.dtype.kind != "f":
+        return False
+    data, nulls = _split_nulls(column)
+    values = np.abs(data[~nulls])
+    return bool(((values >= _INT64_LIMIT) & ~np.isinf(values)).any())
+
+
+def _validate_vector(field: Field, column, invalid):
+    """Validates a numeric or boolean column with vectorized operations, the scalar equivalent being
+    `field.validate`. Marks failing rows in `invalid` and returns the validated column
+    """
+    data, nulls = _split_nulls(column)
+    present = ~nulls
+    input_type = _KINDS[data.dtype.kind]
+
+    if isinstance(field, NumericFieldMixin):
+        # The scalar check is int(value), which only fails for NaN (a missing value here) and infinity
+        if input_type is float:
+            invalid |= present & np.isinf(data)
+        if field.min_val:
+            invalid |= present & (data < field.min_val)
+        if field.max_val:
+            invalid |= present & (data > field.max_val)
+
+    if field.required:
+        invalid |= nulls
+
+    if not issubclass(input_type, field.type):
+        if input_type not in field.input_types or field.strict_type:
+            invalid |= present
+            # Every present row is rejected, keep the field's dtype for defaults filling missing rows
+            data = np.zeros(len(data), dtype=field.type)
+        elif field.type is int:
+            # Columns with values outside of int64 are validated one value at a time, see `_overflows`
+            data = np.where(present & ~np.isinf(data), data, 0).astype(np.int64)
+        else:
+            data = data.astype(field.type)
+
+    if field.choices:
+        numeric = [
+            choice for choice in field.choices if isinstance(choice, (int, float))
+        ]
+        invalid |= present & ~np.isin(data, numeric)
+        if None not in field.choices:
+            invalid |= nulls
+
+    if field.default and nulls.any():
+        rows = np.flatnonzero(nulls)
+        if callable(field.default):
+            defaults = [field.default() for _ in rows]
+        else:
+            defaults = [field.default] * len(rows)
+        if all(type(value) in _VECTOR_TYPES for value in defaults):
+            data = data.copy()
+            data[rows] = defaults
+        else:
+            data = data.astype(object)
+            data[rows] = defaults
+        nulls[:] = False
+
+    if nulls.any():
+        return np.ma.masked_array(data, mask=nulls)
+    return data
+
+
+def _validate_values(check, column, invalid):
+    """Validates a column one value at a time, for fields and dtypes which can't be vectorized"""
+    if isinstance(column, np.ndarray) and column.dtype.kind == "f":
+        # NaNs are missing values, like in `_split_nulls`
+        values = [None if value != value else value for value in column.tolist()]
+    elif isinstance(column, np.ndarray):
+        values = column.tolist()
+    else:
+        values = list(column)
+    result = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        try:
+            result[index] = check(value)
+        except ValidationError:
+            invalid[index] = True
+    return result
+
+
+def parse_columns(schema, columns: Mapping[str, Any]) -> ColumnResult:
+    """Validates columnar data. See `Schema.parse_columns`"""
+    if np is None:  # pragma: no cover
+        raise ImportError(
+            "parse_columns requires numpy, install it with `pip install liaison[numpy]`"
+        )
+
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValidationError("All columns must have the same length")
+    size = lengths.pop() if lengths else 0
+
+    plan = schema._get_plan()
+    invalid = np.zeros(size, dtype=bool)
+    validated = {}
+    for name, field in plan.fields:
+        column = columns.get(name)
+        if column is None:
+            column = np.full(size, None, dtype=object)
+        elif (
+            not isinstance(column, np.ndarray)
+            and len({type(value) for value in column}) == 1
+        ):
+            # Only homogeneous sequences, numpy would otherwise coerce [1, "a"] to strings
+            column = np.asarray(column)
+        vectorize = isinstance(column, np.ndarray) and column.dtype.kind in _KINDS
+        if vectorize and _is_vectorizable(field) and not _overflows(field, column):
+            validated[name] = _validate_vector(field, column, invalid)
+        else:
+            validated[name] = _validate_values(plan.get_check(name), column, invalid)
+
+    return ColumnResult(validated, invalid, np.flatnonzero(invalid))
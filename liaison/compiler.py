@@ -0,0 +1,848 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from contextlib import contextmanager
+from inspect import iscoroutinefunction
+from itertools import count
+from keyword import iskeyword
+import linecache
+import time
+
+from .exceptions import ValidationError, FieldError, ValidationErrors, SchemaException
+from .namespace import namespace_class, frozen_class, lazy_class
+from .cache import is_deterministic
+from .web import make_parse_query, make_parse_headers, normalize_header
+from .adaptive import adaptive_parse
+from .limits import UNKNOWN_KEYS
+
+_filenames = count()
+
+# The maximum number of projections kept by a SchemaPlan, see `SchemaPlan.get_projection`
+MAX_PROJECTIONS = 256
+
+try:
+    perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # pragma: no cover - Python < 3.7
+
+    def perf_counter_ns() -> int:
+        return int(time.perf_counter() * 1e9)
+
+
+# Pairs of (runtime method, compile method). A field is only inlined when every runtime method it uses is
+# defined on the same class as, or a base class of, the class defining the matching compile method. This
+# means a user subclass overriding `validate` (see the README's PasswordField) falls back to calling it.
+_COMPILE_HOOKS = (
+    ("validate", "_compile"),
+    ("_check_type", "_compile"),
+    ("_cast_type", "_compile_cast"),
+)
+
+
+def _defined_at(cls: type, name: str) -> int:
+    for depth, klass in enumerate(cls.__mro__):
+        if name in vars(klass):
+            return depth
+    return len(cls.__mro__)
+
+
+def is_inlinable(field) -> bool:
+    """Returns True if the fields checks can be inlined into a generated parse function"""
+    cls = type(field)
+    return all(
+        _defined_at(cls, compiled) <= _defined_at(cls, runtime)
+        for runtime, compiled in _COMPILE_HOOKS
+        if hasattr(cls, runtime)
+    )
+
+
+def _guard(gen, field, hook: str, arg: str) -> Optional[str]:
+    cls = type(field)
+    guard = _defined_at(cls, hook)
+    if guard > _defined_at(cls, "_compile") or guard > _defined_at(
+        cls, "_compile_cast"
+    ):
+        return None
+    if not is_inlinable(field) or field._validator or field.choices:
+        return None
+    return getattr(field, hook)(gen, arg)
+
+
+def items_guard(gen, field, items: str) -> Optional[str]:
+    """Returns the fields `_compile_items_guard` expression for the sequence `items`, or None if the field has
+    no guard or it may not match the checks of the field (they are customised, or changed by a subclass)
+    """
+    return _guard(gen, field, "_compile_items_guard", items)
+
+
+def value_guard(gen, field, value: str) -> Optional[str]:
+    """Returns the fields `_compile_value_guard` expression for `value`, or None like `items_guard`"""
+    return _guard(gen, field, "_compile_value_guard", value)
+
+
+class CodeGenerator:
+    """Accumulates the source of a generated function.
+
+    Field classes emit their checks through a CodeGenerator in their `_compile` methods. Checks operate
+    on the local variable `v` and must leave the validated value in `v`.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "ValidationError": ValidationError,
+            "FieldError": FieldError,
+            "SchemaException": SchemaException,
+        }
+        self.key: str = ""
+        self.name: str = ""
+        # Set while compiling a prepare function, async calls are appended to the `pending` list as
+        # (index, key, func, args) instead of being called
+        self.deferred = False
+        self.index = 0
+        # A liaison.instrumentation.SchemaMetrics, if the checks of each field are timed
+        self.metrics = None
+        self._bound: Dict[int, str] = {}
+        self._variables = count()
+        self._indent = 0
+
+    def bind(self, obj: Any) -> str:
+        """Makes `obj` available to the generated code, returning the name it is bound to"""
+        name = self._bound.get(id(obj))
+        if name is None:
+            name = self._bound[id(obj)] = f"_c{len(self._bound)}"
+            self.namespace[name] = obj
+        return name
+
+    def variable(self, prefix: str) -> str:
+        """Returns a new local variable name, for checks which need more than `v`"""
+        return f"_{prefix}{next(self._variables)}"
+
+    def line(self, source: str):
+        self.lines.append("    " * self._indent + source)
+
+    @contextmanager
+    def indent(self):
+        self._indent += 1
+        try:
+            yield
+        finally:
+            self._indent -= 1
+
+    @contextmanager
+    def block(self, header: str):
+        self.line(header)
+        with self.indent():
+            yield
+
+    def fail(self, code: str, **params: str):
+        """Emits a `raise FieldError(...)` with the error code, for the current key and value. `params` maps
+        the parameters of the error to source expressions
+        """
+        args = ", ".join(f"{name!r}: {expr}" for name, expr in params.items())
+        self.line(f"raise FieldError({code!r}, {self.key}, v, {{{args}}})")
+
+    def call(self, func: str, args: str, is_async: bool = False):
+        """Emits `v = func(args)`. Async functions are deferred to the caller of a prepare function, and
+        rejected in synchronous functions
+        """
+        if not is_async:
+            self.line(f"v = {func}({args})")
+        elif self.deferred:
+            self.line(f"pending.append(({self.index}, {self.key}, {func}, ({args},)))")
+        else:
+            message = self.bind(
+                "Field {key!r} runs async validators, use Schema.aparse"
+            )
+            self.line(f"raise SchemaException({message}.format(key={self.key}))")
+
+    def function(self, name: str, args: str, label: str) -> Callable:
+        """Compiles the accumulated lines as the body of a function and returns it"""
+        source = (
+            "\n".join([f"def {name}({args}):"] + ["    " + line for line in self.lines])
+            + "\n"
+        )
+        filename = f"<liaison {label} #{next(_filenames)}>"
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+        exec(compile(source, filename, "exec"), self.namespace)
+        return self.namespace[name]
+
+
+def emit_field(gen: CodeGenerator, name: str, field):
+    """Emits the checks for a single field, reading from and writing to `v`. If the generator has metrics,
+    the checks are timed and rejections counted
+    """
+    gen.name = name
+    gen.key = gen.bind(name)
+    if gen.metrics is None:
+        _emit_checks(gen, field)
+        return
+    field_metrics = gen.metrics.field(name)
+    metrics = gen.bind(field_metrics)
+    if field_metrics.record_types:
+        gen.line(f"{metrics}.record(type(v))")
+    clock = gen.bind(perf_counter_ns)
+    start = gen.variable("t")
+    gen.line(f"{start} = {clock}()")
+    with gen.block("try:"):
+        _emit_checks(gen, field)
+    with gen.block("except ValidationError as e:"):
+        gen.line(f"{metrics}.reject(e, {clock}() - {start})")
+        gen.line("raise")
+    gen.line(f"{metrics}.observe({clock}() - {start})")
+
+
+def _emit_checks(gen: CodeGenerator, field):
+    if is_inlinable(field):
+        field._compile(gen)
+    else:
+        is_async = iscoroutinefunction(getattr(field, "_validator", None))
+        gen.call(f"{gen.bind(field)}.validate", f"{gen.key}, v", is_async)
+
+
+def _call(func: str, values: Sequence[str]) -> str:
+    return f"{func}({', '.join(values)})"
+
+
+def emit_schema(gen: CodeGenerator, plan):
+    """Emits the parse of a nested schema, converting the dict in `v` to a result of the schema. Errors are
+    keyed by their path from the current field, e.g. `address.city`
+    """
+    name, key = gen.name, gen.key
+    get = gen.variable("get")
+    values = []
+    if plan.limits is not None:
+        _emit_limits(
+            gen,
+            compile_limits(plan.schema.__name__, plan.limits, plan.known, name),
+            "v",
+        )
+    gen.line(f"{get} = v.get")
+    for field_name, field in plan.fields:
+        gen.line(f"v = {get}({gen.bind(field_name)})")
+        with gen.block("try:"):
+            emit_field(gen, f"{name}.{field_name}" if name else field_name, field)
+        with gen.block("except ValidationError as e:"):
+            with gen.block("if e.key is None:"):
+                gen.line(f"e.key = {gen.key}")
+            gen.line("raise")
+        values.append(gen.variable("n"))
+        gen.line(f"{values[-1]} = v")
+    gen.line(f"v = {_call(gen.bind(plan.result), values)}")
+    gen.name, gen.key = name, key
+
+
+def compile_limits(
+    label: str, limits, known: Sequence[str], path: Optional[str] = None
+) -> Optional[Callable]:
+    """Compiles a function checking the number of keys of a payload, and that every key is a field if
+    unknown keys are forbidden. See `liaison.limits.Limits`. None if the limits don't restrict payloads
+
+    :param label: The name of the schema
+    :param limits: The Limits of the schema
+    :param known: The field names of the schema
+    :param path: The key of the payload in a parent document, which errors are keyed by
+    """
+    gen = CodeGenerator()
+    if limits.max_keys is not None:
+        max_keys = gen.bind(limits.max_keys)
+        with gen.block(f"if len(data) > {max_keys}:"):
+            params = f"{{'max_keys': {max_keys}, 'count': len(data)}}"
+            gen.line(f"raise FieldError('max_keys', {gen.bind(path)}, None, {params})")
+    if limits.unknown_keys == "forbid":
+        known = gen.bind(frozenset(known))
+        with gen.block(f"if not {known}.issuperset(data):"):
+            gen.line(f"k = next(k for k in data if k not in {known})")
+            key = f"{gen.bind(path + '.')} + str(k)" if path else "k"
+            gen.line(f"raise FieldError('unknown', {key}, data[k], {{}})")
+    if not gen.lines:
+        return None
+    return gen.function("check_limits", "data", f"{label}.limits")
+
+
+def _emit_limits(gen: CodeGenerator, limits: Optional[Callable], data: str = "data"):
+    if limits is not None:
+        gen.line(f"{gen.bind(limits)}({data})")
+
+
+def compile_check(name: str, field) -> Callable[[Any], Any]:
+    """Compiles a function validating a single value for the field"""
+    gen = CodeGenerator()
+    emit_field(gen, name, field)
+    gen.line("return v")
+    return gen.function("check", "v", f"{type(field).__name__} {name}")
+
+
+def compile_self_check(field) -> Callable[[Any], Any]:
+    """Compiles a function validating a value with the checks of a nested field itself, see
+    `liaison.nested.validate_nested`. Errors have no key
+    """
+    gen = CodeGenerator()
+    gen.key = gen.bind(None)
+    field._compile_self(gen)
+    gen.line("return v")
+    return gen.function("check", "v", f"{type(field).__name__} self")
+
+
+def compile_parse(
+    label: str,
+    fields: Sequence[Tuple[str, Any]],
+    result: Callable,
+    metrics=None,
+    order: Optional[Sequence[str]] = None,
+    specialized: Optional[Dict[str, type]] = None,
+    limits: Optional[Callable] = None,
+) -> Callable:
+    """Compiles a straight-line parse function for the given fields. The function accepts a dict or dict
+    like object and returns `result(*values)`, with the values in field order
+
+    :param order: The names of the fields in the order they are checked, other fields are checked after
+        them in field order. See `liaison.adaptive.SchemaProfile`
+    :param specialized: Maps field names to the type of most of their values. Values of a field's own type
+        which pass its `value_guard` skip its checks
+    :param limits: An optional function checking the payload first, see `compile_limits`
+    """
+    gen = CodeGenerator()
+    gen.metrics = metrics
+    _emit_limits(gen, limits)
+    gen.line("get = data.get")
+    indexes = list(range(len(fields)))
+    if order:
+        position = {name: i for i, name in enumerate(order)}
+        indexes.sort(key=lambda index: position.get(fields[index][0], len(position)))
+    for index in indexes:
+        name, field = fields[index]
+        gen.line(f"v = get({gen.bind(name)})")
+        guard = None
+        if specialized and specialized.get(name) is field.type:
+            guard = value_guard(gen, field, "v")
+        if guard is None:
+            emit_field(gen, name, field)
+        else:
+            with gen.block(f"if not ({guard}):"):
+                emit_field(gen, name, field)
+        gen.line(f"_r{index} = v")
+    gen.line(
+        "return " + _call(gen.bind(result), [f"_r{i}" for i in range(len(fields))])
+    )
+    return gen.function("parse", "data", f"{label}.parse")
+
+
+def compile_parse_collect(
+    label: str,
+    fields: Sequence[Tuple[str, Any]],
+    result: Callable,
+    metrics=None,
+    limits=None,
+) -> Callable:
+    """Compiles a parse function which validates every field before raising. The errors of all failed
+    fields are raised together as a ValidationErrors. A payload exceeding the limits isn't validated
+    """
+    gen = CodeGenerator()
+    gen.metrics = metrics
+    _emit_limits(gen, limits)
+    gen.line("get = data.get")
+    gen.line("errors = []")
+    for index, (name, field) in enumerate(fields):
+        gen.line(f"v = get({gen.bind(name)})")
+        with gen.block("try:"):
+            emit_field(gen, name, field)
+        with gen.block("except ValidationError as e:"):
+            # Errors raised by custom validators may not set the key
+            with gen.block("if e.key is None:"):
+                gen.line(f"e.key = {gen.key}")
+            gen.line("errors.append(e)")
+        gen.line(f"_r{index} = v")
+    with gen.block("if errors:"):
+        gen.line(f"raise {gen.bind(ValidationErrors)}(errors)")
+    gen.line(
+        "return " + _call(gen.bind(result), [f"_r{i}" for i in range(len(fields))])
+    )
+    return gen.function("parse_collect", "data", f"{label}.parse_collect")
+
+
+def compile_prepare(
+    label: str, fields: Sequence[Tuple[str, Any]], metrics=None, limits=None
+) -> Callable:
+    """Compiles the synchronous part of an async parse. The function returns a list of values in field
+    order and a list of pending (index, key, func, args) calls to async validators, whose results replace
+    the values at their index
+    """
+    gen = CodeGenerator()
+    gen.metrics = metrics
+    gen.deferred = True
+    _emit_limits(gen, limits)
+    gen.line("get = data.get")
+    gen.line("pending = []")
+    for index, (name, field) in enumerate(fields):
+        gen.index = index
+        gen.line(f"v = get({gen.bind(name)})")
+        emit_field(gen, name, field)
+        gen.line(f"_r{index} = v")
+    gen.line(f"return [{', '.join(f'_r{i}' for i in range(len(fields)))}], pending")
+    return gen.function("prepare", "data", f"{label}.prepare")
+
+
+def compile_values(
+    label: str, fields: Sequence[Tuple[str, Any]], metrics=None, limits=None
+) -> Callable:
+    """Compiles a function returning a list of values in field order, used to walk nested documents. Nested
+    fields are not validated, their values are left for `liaison.nested.validate_nested`. The key of every
+    error raised is the field name
+    """
+    gen = CodeGenerator()
+    gen.metrics = metrics
+    _emit_limits(gen, limits)
+    gen.line("get = data.get")
+    for index, (name, field) in enumerate(fields):
+        gen.line(f"v = get({gen.bind(name)})")
+        if not field._nested:
+            with gen.block("try:"):
+                emit_field(gen, name, field)
+            with gen.block("except ValidationError as e:"):
+                with gen.block("if e.key is None:"):
+                    gen.line(f"e.key = {gen.key}")
+                gen.line("raise")
+        gen.line(f"_r{index} = v")
+    gen.line(f"return [{', '.join(f'_r{i}' for i in range(len(fields)))}]")
+    return gen.function("values", "data", f"{label}.values")
+
+
+def compile_dump(
+    label: str, fields: Sequence[Tuple[str, Any]], skip_none: bool, walk: bool = False
+) -> Callable:
+    """Compiles a function serializing a result to a dict of JSON compatible values, with the
+    `_compile_dump` expression of each field. None values are kept, or left out with `skip_none`
+
+    :param walk: Leave the values of nested fields as they are, for `liaison.nested.dump_nested` to serialize
+    """
+    gen = CodeGenerator()
+    if skip_none:
+        gen.line("out = {}")
+    items = []
+    for name, field in fields:
+        var = gen.variable("v")
+        attribute = name.isidentifier() and not iskeyword(name)
+        gen.line(f"{var} = r.{name}" if attribute else f"{var} = getattr(r, {name!r})")
+        expr = (
+            var if walk and field._nested else field._compile_dump(gen, var, skip_none)
+        )
+        key = repr(name)
+        if skip_none:
+            with gen.block(f"if {var} is not None:"):
+                gen.line(f"out[{key}] = {expr}")
+        else:
+            if expr != var:
+                with gen.block(f"if {var} is not None:"):
+                    gen.line(f"{var} = {expr}")
+            items.append(f"{key}: {var}")
+    gen.line("return out" if skip_none else f"return {{{', '.join(items)}}}")
+    return gen.function("dump", "r", f"{label}.dump")
+
+
+def compile_parse_lazy(
+    label: str,
+    fields: Sequence[Tuple[str, Any]],
+    result: Callable,
+    limits: Optional[Callable] = None,
+) -> Callable:
+    """Compiles a lazy parse function, which only checks required fields are present before returning
+    `result(data)`. Required fields of fields with custom validators or validate methods aren't checked, as
+    they may not enforce `required`
+    """
+    gen = CodeGenerator()
+    _emit_limits(gen, limits)
+    gen.line("get = data.get")
+    for name, field in fields:
+        if field.required and not field._validator and is_inlinable(field):
+            gen.key = gen.bind(name)
+            with gen.block(f"if get({gen.key}) is None:"):
+                gen.line("v = None")
+                gen.fail("required")
+    gen.line(f"return {gen.bind(result)}(data)")
+    return gen.function("parse_lazy", "data", f"{label}.parse_lazy")
+
+
+def compile_key(label: str, names: Sequence[str]) -> Callable:
+    """Compiles a function returning the cache key of an input, a tuple of the type and value of each field.
+    Types are included as equal values of different types (e.g. 1 and True) may parse differently
+    """
+    gen = CodeGenerator()
+    gen.line("get = data.get")
+    for index, name in enumerate(names):
+        gen.line(f"_k{index} = get({gen.bind(name)})")
+    gen.line(f"return ({''.join(f'type(_k{i}), _k{i}, ' for i in range(len(names)))})")
+    return gen.function("key", "data", f"{label}.key")
+
+
+def compile_build(label: str, size: int, result: Callable) -> Callable:
+    """Compiles a function building a result from a list of values in field order"""
+    gen = CodeGenerator()
+    gen.line(f"return {_call(gen.bind(result), [f'values[{i}]' for i in range(size)])}")
+    return gen.function("build", "values", f"{label}.build")
+
+
+def compile_parse_many(
+    label: str,
+    fields: Sequence[Tuple[str, Any]],
+    result: Optional[Callable],
+    metrics=None,
+    limits=None,
+) -> Callable:
+    """Compiles a batch parse function: the parse function inlined into a single loop over the records,
+    so the per record cost is only the checks themselves. The function returns a list of results aligned
+    with the records (None for rejected rows) and a dict mapping row indexes to their error. If `result`
+    is None, rows are returned as tuples of values in field order
+    """
+    gen = CodeGenerator()
+    gen.metrics = metrics
+    gen.line("errors = {}")
+    gen.line("results = []")
+    gen.line("append = results.append")
+    with gen.block("for i, record in enumerate(records):"):
+        gen.line("get = record.get")
+        with gen.block("try:"):
+            _emit_limits(gen, limits, "record")
+            for index, (name, field) in enumerate(fields):
+                gen.line(f"v = get({gen.bind(name)})")
+                emit_field(gen, name, field)
+                gen.line(f"_r{index} = v")
+            values = [f"_r{i}" for i in range(len(fields))]
+            if result is None:
+                gen.line(f"append(({''.join(value + ', ' for value in values)}))")
+            else:
+                gen.line(f"append({_call(gen.bind(result), values)})")
+        with gen.block("except ValidationError as e:"):
+            gen.line("errors[i] = e")
+            gen.line("append(None)")
+    gen.line("return results, errors")
+    return gen.function("parse_many", "records", f"{label}.parse_many")
+
+
+def compile_build_rows(label: str, size: int, result: Callable) -> Callable:
+    """Compiles a function building `n` results from `size` columns of values, skipping rows in `errors`"""
+    gen = CodeGenerator()
+    values = [f"_a{i}" for i in range(size)]
+    build = _call(gen.bind(result), values)
+    if not size:
+        gen.line(f"return [None if i in errors else {build} for i in range(n)]")
+        return gen.function("build_rows", "columns, errors, n", f"{label}.build_rows")
+    gen.line(
+        f"return [None if errors and i in errors else {build} "
+        f"for i, ({''.join(value + ', ' for value in values)}) in enumerate(zip(*columns))]"
+    )
+    return gen.function("build_rows", "columns, errors, n", f"{label}.build_rows")
+
+
+class SchemaPlan:
+    """The validation plan of a Schema class, built once per class and rebuilt when one of its fields
+    changes.
+
+    :param schema: The Schema class
+    :param fields: The ordered (name, field) table of the schema, including inherited fields
+    :param projection: The plan parses a subset of the fields, see `get_projection`. Projections don't use
+        the ParseCache of the schema
+    :param known: The names of every field of the schema, which unknown keys are checked against. Defaults
+        to the names of `fields`
+    """
+
+    def __init__(
+        self,
+        schema: type,
+        fields: Sequence[Tuple[str, Any]],
+        projection: bool = False,
+        known: Optional[Sequence[str]] = None,
+    ):
+        self.schema = schema
+        self.fields = tuple(fields)
+        self.names = tuple(name for name, _ in self.fields)
+        self.by_name = dict(self.fields)
+        self.known = self.names if known is None else tuple(known)
+        # The Limits of the schema, see `liaison.limits`. Limits which restrict payloads are checked by a
+        # function called first by every parse function
+        self.limits = getattr(schema, "__limits__", None)
+        if self.limits is not None and self.limits.unknown_keys not in UNKNOWN_KEYS:
+            raise SchemaException(
+                f"unknown_keys must be one of {', '.join(UNKNOWN_KEYS)}, not '{self.limits.unknown_keys}'"
+            )
+        self.check_limits = None
+        if self.limits is not None:
+            self.check_limits = compile_limits(schema.__name__, self.limits, self.known)
+        # The metrics of the schema if instrumentation is enabled, see `Schema.enable_instrumentation`.
+        # Parse functions of instrumented schemas time each field, others are unchanged
+        self.metrics = vars(schema).get("_metrics")
+        # (index, name, liaison.nested.Node) of the nested fields
+        self.nested = tuple(
+            (index, name, field._make_node())
+            for index, (name, field) in enumerate(self.fields)
+            if field._nested
+        )
+        # The values function is called for every nested record, so it's kept as an attribute
+        self.values: Optional[Callable] = None
+        self.result = namespace_class(schema, self.names)
+        # True if a field of the schema itself has an async validator, see `is_async`
+        self.has_async_validators = any(
+            iscoroutinefunction(getattr(field, "_validator", None))
+            for _, field in self.fields
+        )
+        self._is_async: Optional[bool] = None
+        # The SchemaProfile of the schema if adaptive mode is enabled, see `Schema.enable_adaptive`
+        self.profile = None if projection else vars(schema).get("_profile")
+        self.parse = self._compile_parse(self.result)
+        # The ParseCache of the schema if caching is enabled, see `Schema.enable_cache`. Cached results are
+        # shared, so they are frozen
+        self.cache = None if projection else vars(schema).get("_cache")
+        if self.cache is not None:
+            self.cache.clear()
+            compiled = [f for _, field in self.fields for f in field._compiled_fields()]
+            if is_deterministic(compiled):
+                # The limits cover keys which aren't fields, so they're checked before the cache lookup
+                parse = self._compile_parse(
+                    frozen_class(self.result), check_limits=False
+                )
+                key = compile_key(schema.__name__, self.names)
+                self.parse = self.cache.wrap(key, self.names, parse, self.check_limits)
+        self._compiled: Dict[Any, Callable] = {}
+        # Plans of the projections parsed so far, by (only, exclude)
+        self.projections: Dict[tuple, "SchemaPlan"] = {}
+
+    @property
+    def is_async(self) -> bool:
+        """True if parsing the schema runs async validators, its own or those of the schemas nested in it.
+        Computed on first use, as nested schemas declared with a function can't be resolved before
+        """
+        if self._is_async is None:
+            # Nested schemas are walked with a stack, as they may nest each other
+            seen, stack = {self.schema}, [self]
+            while stack and self._is_async is None:
+                plan = stack.pop()
+                if plan.has_async_validators:
+                    self._is_async = True
+                for _, field in plan.fields:
+                    for schema in field._nested_schemas():
+                        if schema not in seen:
+                            seen.add(schema)
+                            stack.append(schema._get_plan())
+            self._is_async = bool(self._is_async)
+        return self._is_async
+
+    def _compile_parse(self, result: Callable, check_limits: bool = True) -> Callable:
+        label = self.schema.__name__
+        profile = self.profile
+        limits = self.check_limits if check_limits else None
+        if profile is None:
+            return compile_parse(
+                label, self.fields, result, self.metrics, limits=limits
+            )
+
+        def build():
+            return compile_parse(
+                label,
+                self.fields,
+                result,
+                self.metrics,
+                profile.order,
+                profile.specialized,
+                limits,
+            )
+
+        if profile.frozen:
+            return build()
+        sample = compile_parse_collect(label, self.fields, result, profile, limits)
+        guarded = {
+            name
+            for name, field in self.fields
+            if value_guard(CodeGenerator(), field, "v") is not None
+        }
+        return adaptive_parse(profile, self.fields, build, sample, guarded)
+
+    def _get_compiled(self, name: Any, build: Callable[[], Callable]) -> Callable:
+        func = self._compiled.get(name)
+        if func is None:
+            func = self._compiled[name] = build()
+        return func
+
+    def get_parse_collect(self) -> Callable:
+        """Returns the parse function collecting the errors of every field, compiled on first use"""
+        return self._get_compiled(
+            "parse_collect",
+            lambda: compile_parse_collect(
+                self.schema.__name__,
+                self.fields,
+                self.result,
+                self.metrics,
+                self.check_limits,
+            ),
+        )
+
+    def get_parse_many(self) -> Callable:
+        """Returns the batch parse function, compiled on first use"""
+        return self._get_compiled(
+            "parse_many",
+            lambda: compile_parse_many(
+                self.schema.__name__,
+                self.fields,
+                self.result,
+                self.metrics,
+                self.check_limits,
+            ),
+        )
+
+    def get_parse_rows(self) -> Callable:
+        """Returns a batch parse function returning rows as tuples of values, compiled on first use"""
+        return self._get_compiled(
+            "parse_rows",
+            lambda: compile_parse_many(
+                self.schema.__name__, self.fields, None, self.metrics, self.check_limits
+            ),
+        )
+
+    def get_build_rows(self) -> Callable:
+        """Returns a function building results from columns of values, compiled on first use"""
+        return self._get_compiled(
+            "build_rows",
+            lambda: compile_build_rows(
+                self.schema.__name__, len(self.names), self.result
+            ),
+        )
+
+    def get_prepare(self) -> Callable:
+        """Returns the synchronous part of an async parse, compiled on first use"""
+        return self._get_compiled(
+            "prepare",
+            lambda: compile_prepare(
+                self.schema.__name__, self.fields, self.metrics, self.check_limits
+            ),
+        )
+
+    def get_values(self) -> Callable:
+        """Returns the function used by `liaison.nested.validate_nested` to parse nested documents, compiled
+        on first use
+        """
+        if self.values is None:
+            self.values = compile_values(
+                self.schema.__name__, self.fields, self.metrics, self.check_limits
+            )
+        return self.values
+
+    def get_build(self) -> Callable:
+        """Returns a function building a result from a list of values, compiled on first use"""
+        return self._get_compiled(
+            "build",
+            lambda: compile_build(self.schema.__name__, len(self.names), self.result),
+        )
+
+    def get_parse_lazy(self) -> Callable:
+        """Returns the lazy parse function, compiled on first use"""
+        return self._get_compiled(
+            "parse_lazy",
+            lambda: compile_parse_lazy(
+                self.schema.__name__,
+                self.fields,
+                lazy_class(self.result, self.get_check),
+                self.check_limits,
+            ),
+        )
+
+    def get_dump(self, names: Optional[Tuple[str, ...]], skip_none: bool) -> Callable:
+        """Returns the function serializing results with the named fields, or every field if None, compiled
+        on first use. Names of fields the schema doesn't have are ignored
+        """
+
+        def build():
+            fields = self.fields
+            if names is not None:
+                fields = [
+                    (name, self.by_name[name]) for name in names if name in self.by_name
+                ]
+            return compile_dump(self.schema.__name__, fields, skip_none)
+
+        return self._get_compiled(("dump", names, skip_none), build)
+
+    def get_dump_walk(
+        self, names: Optional[Tuple[str, ...]], skip_none: bool
+    ) -> Tuple[Callable, tuple]:
+        """Returns the function serializing results with the named fields, leaving the values of nested
+        fields as they are, and the (name, Node) pairs of the nested fields. See
+        `liaison.nested.dump_nested`
+        """
+
+        def build():
+            fields = self.fields
+            if names is not None:
+                fields = [
+                    (name, self.by_name[name]) for name in names if name in self.by_name
+                ]
+            nested = tuple(
+                (name, field._make_node(compiled=False))
+                for name, field in fields
+                if field._nested
+            )
+            return (
+                compile_dump(self.schema.__name__, fields, skip_none, walk=True),
+                nested,
+            )
+
+        return self._get_compiled(("dump walk", names, skip_none), build)
+
+    def get_parse_query(self) -> Callable:
+        """Returns the query string parse function, built on first use"""
+        max_size = None if self.limits is None else self.limits.max_size
+        return self._get_compiled(
+            "parse_query",
+            lambda: make_parse_query(
+                self.fields, self.parse, max_size, self.check_limits
+            ),
+        )
+
+    def get_parse_headers(self) -> Callable:
+        """Returns the header parse function, built on first use"""
+
+        def build():
+            check_limits = None
+            if self.limits is not None:
+                known = [normalize_header(name) for name in self.known]
+                check_limits = compile_limits(self.schema.__name__, self.limits, known)
+            return make_parse_headers(self.fields, self.parse, check_limits)
+
+        return self._get_compiled("parse_headers", build)
+
+    def get_projection(
+        self, only: Optional[Sequence[str]], exclude: Optional[Sequence[str]]
+    ) -> "SchemaPlan":
+        """Returns the plan parsing only the fields in `only` (or every field if None) which aren't in
+        `exclude`, built on first use. Unknown names are ignored. At most `MAX_PROJECTIONS` plans are kept,
+        the oldest is discarded first
+
+        :param only: The names of the fields to parse
+        :param exclude: The names of the fields not to parse
+        :returns: The plan of the projection
+        """
+        if isinstance(only, (str, bytes)) or isinstance(exclude, (str, bytes)):
+            name, names = (
+                ("only", only)
+                if isinstance(only, (str, bytes))
+                else ("exclude", exclude)
+            )
+            raise TypeError(
+                f"{name} must be a sequence of field names, not a string: use [{names!r}]"
+            )
+        key = (None if only is None else tuple(only), tuple(exclude) if exclude else ())
+        plan = self.projections.get(key)
+        if plan is None:
+            selected = set(self.names if only is None else only).difference(key[1])
+            fields = [(name, field) for name, field in self.fields if name in selected]
+            plan = SchemaPlan(self.schema, fields, projection=True, known=self.known)
+            if len(self.projections) >= MAX_PROJECTIONS:
+                # Another thread may have emptied the dict since its length was read
+                self.projections.pop(next(iter(self.projections), None), None)
+            self.projections[key] = plan
+        return plan
+
+    def get_check(self, name: str) -> Callable[[Any], Any]:
+        """Returns a function validating a single value for the named field, compiled on first use"""
+        return self._get_compiled(
+            f"check {name}", lambda: compile_check(name, self.by_name[name])
+        )
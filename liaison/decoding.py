@@ -0,0 +1,64 @@
+from typing import Any, Callable, Optional, Union
+import json
+
+from .exceptions import ValidationError, FieldError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+
+def _stdlib_loads(raw: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    return json.loads(raw)
+
+
+# The default JSON decoder of `Schema.parse_json`, orjson if it's installed
+loads: Callable[[Any], Any] = orjson.loads if orjson is not None else _stdlib_loads
+
+
+def size(raw: Union[bytes, bytearray, memoryview, str], limit: int) -> int:
+    """Returns the size of a JSON document in bytes. The UTF-8 size of a string is only computed if it may
+    exceed `limit`, otherwise its length is returned
+    """
+    if isinstance(raw, str):
+        # A character is at most 4 bytes
+        if len(raw) <= limit // 4:
+            return len(raw)
+        return len(raw.encode("utf-8", "surrogatepass"))
+    if isinstance(raw, memoryview):
+        return raw.nbytes
+    return len(raw)
+
+
+def check_size(raw: Union[bytes, bytearray, memoryview, str], max_size: int):
+    """Raises a FieldError if the raw payload is larger than `max_size` bytes"""
+    length = size(raw, max_size)
+    if length > max_size:
+        raise FieldError("max_size", None, None, {"size": length, "max_size": max_size})
+
+
+def decode(
+    raw: Union[bytes, bytearray, memoryview, str],
+    max_bytes: Optional[int] = None,
+    decoder: Optional[Callable[[Any], Any]] = None,
+) -> dict:
+    """Decodes a JSON object, raising a ValidationError for documents larger than `max_bytes`, invalid
+    JSON or JSON values other than objects
+
+    :param raw: The JSON document
+    :param max_bytes: An optional maximum size of the document in bytes, checked before decoding
+    :param decoder: The JSON decoder, defaults to `loads`
+    :returns: The decoded object
+    """
+    if max_bytes is not None:
+        check_size(raw, max_bytes)
+    try:
+        data = (decoder or loads)(raw)
+    except ValueError as e:
+        raise ValidationError(f"Invalid JSON: {e}") from None
+    if not isinstance(data, dict):
+        raise ValidationError("Expected a JSON object")
+    return data
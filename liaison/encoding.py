@@ -0,0 +1,75 @@
+from typing import Any, Callable, IO, Iterable, Optional
+from io import TextIOBase
+import json
+
+from .decoding import orjson
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_TOO_DEEP = "Value is nested too deeply to be encoded as JSON"
+
+# The default JSON encoder of `Schema.dump_json` and `Schema.dump_many`, orjson if it's installed
+dumps: Callable[[Any], bytes] = orjson.dumps if orjson is not None else _stdlib_dumps
+
+
+def encode(value: Any, encoder: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encodes a value as UTF-8 JSON with `encoder` (which may return bytes or a string), or `dumps`.
+
+    JSON encoders recurse once per level of nesting: orjson encodes at most 254 levels, the json module
+    about as many as the recursion limit allows. Values nested deeper raise a ValueError
+    """
+    try:
+        if encoder is None:
+            return dumps(value)
+        result = encoder(value)
+    except RecursionError:
+        raise ValueError(_TOO_DEEP) from None
+    except TypeError as e:
+        # orjson raises a JSONEncodeError, a TypeError
+        if (
+            orjson is not None
+            and isinstance(e, orjson.JSONEncodeError)
+            and "Recursion limit" in str(e)
+        ):
+            raise ValueError(_TOO_DEEP) from None
+        raise
+    return result.encode("utf-8") if isinstance(result, str) else result
+
+
+def write_many(
+    dump: Callable[[Any], dict],
+    results: Iterable[Any],
+    fileobj: IO,
+    ndjson: bool = False,
+    encoder: Optional[Callable[[Any], Any]] = None,
+) -> int:
+    """Writes results serialized by `dump` to a text or binary file object one at a time, as a JSON array or
+    as JSON Lines
+
+    :param dump: The function serializing a result to a dict
+    :param results: The results to write
+    :param fileobj: A text or binary file object
+    :param ndjson: Write one JSON object per line rather than a JSON array
+    :param encoder: An optional JSON encoder, see `encode`
+    :returns: The number of results written
+    """
+    text = isinstance(fileobj, TextIOBase)
+    write = fileobj.write
+    separator = b"\n" if ndjson else b","
+    count = 0
+    if not ndjson:
+        write("[" if text else b"[")
+    for result in results:
+        chunk = encode(dump(result), encoder)
+        if ndjson:
+            chunk += separator
+        elif count:
+            chunk = separator + chunk
+        write(chunk.decode("utf-8") if text else chunk)
+        count += 1
+    if not ndjson:
+        write("]" if text else b"]")
+    return count
@@ -1,6 +1,130 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
 class SchemaException(Exception):
     """Base exception"""
 
 
+# Messages of the errors raised by the built in checks, by error code. Besides the params of the error,
+# messages can use `key`, `value` and `type` (the type name of the value)
+ERROR_MESSAGES = {
+    "required": "Missing required value for '{key}'",
+    "choice": "Invalid choice '{value}' for '{key}'",
+    "type": "Incorrect type '{type}' for '{key}', expecting '{expected}'",
+    "cast": "Invalid type '{type}' for '{key}', expecting '{expected}'",
+    "sized": "Invalid value for '{key}', expecting '{expected}'",
+    "min_len": "Value for '{key}' did not meet required length of {min_len}",
+    "max_len": "Value for '{key}' exceeded maximum length of {max_len}",
+    "number": "Incorrect type '{type}' for '{key}', expecting a number",
+    "min_val": "Value for '{key}' must be at least {min_val}",
+    "max_val": "Value for '{key}' must be less than {max_val}",
+    "pattern": "Invalid pattern for '{key}', must match pattern '{pattern}'",
+    "date_format": "Invalid value for '{key}', must match format '{date_format}'",
+    "uuid": "Invalid value for '{key}'. Expecting a valid UUID not '{value}' ",
+    "timeout": "Validation of '{key}' timed out after {timeout}s",
+    "array": "Items of '{key}' can't be stored in an array of type '{typecode}'",
+    "max_digits": "Value for '{key}' exceeded maximum length of {max_digits} digits",
+    "max_keys": "Payload has {count} keys, more than the maximum of {max_keys}",
+    "max_size": "Payload of {size} bytes exceeds the maximum of {max_size} bytes",
+    "unknown": "Unknown key '{key}'",
+}
+
+
 class ValidationError(Exception):
-    """Raised when validation of a field fails"""
+    """Raised when validation of a field fails. The errors of the built in checks are FieldErrors, which
+    also identify the check which failed, the field and the offending value
+    """
+
+    code: Optional[str] = None
+    key: Optional[str] = None
+    value: Any = None
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return {}
+
+    @property
+    def message(self) -> str:
+        return str(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the error as a dictionary of its code, key, message and params"""
+        return {
+            "code": self.code,
+            "key": self.key,
+            "message": self.message,
+            "params": self.params,
+        }
+
+
+class FieldError(ValidationError):
+    """A structured ValidationError, raised by the built in checks. The message is only formatted when
+    it is read.
+
+    :param code: The error code, a key of `ERROR_MESSAGES`
+    :param key: The key of the field
+    :param value: The offending value
+    :param params: The parameters of the failed check, e.g. `{"min_len": 2}`
+    """
+
+    def __init__(self, code: str, key: str, value: Any, params: Dict[str, Any]):
+        super().__init__(code, key, value, params)
+
+    @property
+    def code(self) -> str:
+        return self.args[0]
+
+    @property
+    def key(self) -> str:
+        return self.args[1]
+
+    @property
+    def value(self) -> Any:
+        return self.args[2]
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self.args[3]
+
+    def __str__(self) -> str:
+        code, key, value, params = self.args
+        return ERROR_MESSAGES[code].format(
+            key=key, value=value, type=type(value).__name__, **params
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+class ValidationErrors(ValidationError):
+    """Raised by `Schema.parse(data, collect_errors=True)`, holding the errors of every failed field
+
+    :param errors: The errors, in field order
+    """
+
+    def __init__(self, errors: List[ValidationError]):
+        super().__init__(errors)
+
+    @property
+    def errors(self) -> List[ValidationError]:
+        return self.args[0]
+
+    def __str__(self) -> str:
+        return "; ".join(str(error) for error in self.errors)
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the errors as a dictionary with an `errors` list of the `to_dict` of each error"""
+        return {"errors": [error.to_dict() for error in self.errors]}
+
+
+class RowError(NamedTuple):
+    """A validation error for a single record of a batch"""
+
+    index: int
+    error: ValidationError
@@ -4,3 +4,4 @@ from .bool import BoolField
 from .sequence import ListField, SetField
 from .dict import DictField
 from .datetime import DateTimeField
+from .nested import SchemaField
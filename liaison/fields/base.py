@@ -1,12 +1,28 @@
 from typing import Any, Optional, Callable, Sequence, Tuple
-from inspect import signature
+from inspect import signature, iscoroutinefunction
+from weakref import WeakSet
 
-from liaison.exceptions import SchemaException, ValidationError
+from liaison.exceptions import SchemaException, FieldError
+from liaison.cache import MemoizedValidator, ValidatorCacheInfo
+from liaison.choices import ChoiceTable
 
 
 class Field:
     """Base class for all Field types"""
 
+    # True for fields validated by `liaison.nested.validate_nested`
+    _nested = False
+    # True for fields reading every value of a repeated query string key or header, see `liaison.web`
+    _multi_valued = False
+
+    def _compiled_fields(self) -> tuple:
+        """Returns the fields compiled into a plan with this field, which must invalidate it when changed"""
+        return (self,)
+
+    def _nested_schemas(self) -> tuple:
+        """Returns the schemas the field parses values with, which are frozen with a schema owning the field"""
+        return ()
+
     def __init__(
         self,
         type: type,
@@ -17,16 +33,43 @@ class Field:
         validator: Optional[Callable] = None,
         strict_type: Optional[bool] = False,
     ):
+        self._schemas = WeakSet()
         self.type = type
         self.required = required
         self.default = default
-        self.choices = set(choices) if choices else None
+        # Choice tables are read-only and shared, see `liaison.choices`
+        if isinstance(choices, ChoiceTable):
+            self.choices = choices or None
+        else:
+            self.choices = set(choices) if choices else None
         if validator:
             self._check_validator_signature(validator)
         self._validator = validator
         self.strict_type = strict_type
         self.input_types = input_types
 
+    def __setattr__(self, name: str, value: Any):
+        schemas = tuple(getattr(self, "_schemas", ()))
+        for schema in schemas:
+            if schema.is_frozen():
+                raise SchemaException(
+                    f"fields of the frozen schema {schema.__name__} can't be changed"
+                )
+        super().__setattr__(name, value)
+        # Schemas compile their fields, any change must invalidate the compiled plans of the owning schemas
+        for schema in schemas:
+            schema._invalidate()
+
+    def __getstate__(self) -> dict:
+        # Owning schemas are re-registered when the schema is compiled in the unpickling process
+        state = self.__dict__.copy()
+        del state["_schemas"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.__dict__["_schemas"] = WeakSet()
+
     def _check_validator_signature(self, func: Callable):
         if not callable(func):
             raise TypeError(f"validators must be callable, not '{type(func)}'")
@@ -35,10 +78,27 @@ class Field:
                 f"validator method signature must match (self, key, value)"
             )
 
-    def validator(self, func: Callable):
-        """Validation decorator"""
+    def validator(
+        self, func: Optional[Callable] = None, cache: Optional[int] = None
+    ) -> Callable:
+        """Validation decorator. Returns the function, so validators defined in a schema body remain
+        attributes of the schema and can be pickled by reference. `async def` validators are supported by
+        `Schema.aparse`.
+
+        Use `@field.validator(cache=N)` to memoize the result of the validator for up to N values, see
+        `liaison.cache.MemoizedValidator`
+        """
+        if func is None:
+            return lambda func: self.validator(func, cache=cache)
         self._check_validator_signature(func)
-        self._validator = func
+        self._validator = MemoizedValidator(func, cache) if cache else func
+        return func
+
+    def validator_cache_info(self) -> Optional[ValidatorCacheInfo]:
+        """Returns the statistics of the memoized validator of the field, None if it isn't memoized"""
+        if isinstance(self._validator, MemoizedValidator):
+            return self._validator.cache_info()
+        return None
 
     def _cast_type(self, key, value: Any):
 
@@ -46,21 +106,15 @@ class Field:
             return value
 
         if type(value) not in self.input_types:
-            raise ValidationError(
-                f"Incorrect type '{type(value).__name__}' for '{key}', expecting '{self.type.__name__}'"
-            )
+            raise FieldError("type", key, value, {"expected": self.type.__name__})
 
         if self.strict_type and not isinstance(value, self.type):
-            raise ValidationError(
-                f"Incorrect type '{type(value).__name__}' for '{key}', expecting '{self.type.__name__}'"
-            )
+            raise FieldError("type", key, value, {"expected": self.type.__name__})
 
         try:
             value = self.type(value)
         except (TypeError, ValueError):
-            raise ValidationError(
-                f"Invalid type '{type(value).__name__}' for '{key}', expecting '{self.type.__name__}'"
-            )
+            raise FieldError("cast", key, value, {"expected": self.type.__name__})
         return value
 
     def validate(self, key: str, value: Any) -> Any:
@@ -70,13 +124,13 @@ class Field:
             return self._validator(self, key, value)
 
         if self.required and value is None:
-            raise ValidationError(f"Missing required value for '{key}'")
+            raise FieldError("required", key, value, {})
 
         if value is not None:
             value = self._cast_type(key, value)
 
         if self.choices and value not in self.choices:
-            raise ValidationError(f"Invalid choice '{value}' for '{key}'")
+            raise FieldError("choice", key, value, {})
 
         if value is None and self.default:
             if callable(self.default):
@@ -84,3 +138,77 @@ class Field:
             return self.default
 
         return value
+
+    def _compile(self, gen):
+        """Emits the checks performed by `validate`. See `liaison.compiler.CodeGenerator`"""
+
+        if self._validator:
+            gen.call(
+                gen.bind(self._validator),
+                f"{gen.bind(self)}, {gen.key}, v",
+                iscoroutinefunction(self._validator),
+            )
+            return
+
+        if self.required:
+            with gen.block("if v is None:"):
+                gen.fail("required")
+
+        with gen.block("if v is not None:"):
+            self._compile_cast(gen)
+
+        if self.choices:
+            with gen.block(f"if v not in {gen.bind(self.choices)}:"):
+                gen.fail("choice")
+
+        if self.default:
+            default = gen.bind(self.default)
+            with gen.block("if v is None:"):
+                gen.line(
+                    f"v = {default}()" if callable(self.default) else f"v = {default}"
+                )
+
+    def _compile_items_guard(self, gen, items: str) -> Optional[str]:
+        """Returns a source expression which is only true if every value in the sequence `items` passes the
+        checks of the field unchanged, used to skip validating the items of homogeneous sequences one by one.
+        See `liaison.compiler.items_guard`. None if the field has no such check
+        """
+        return None
+
+    def _compile_value_guard(self, gen, value: str) -> Optional[str]:
+        """Returns a source expression which is only true if `value` passes the checks of the field unchanged,
+        used by the adaptive parse functions to skip the checks of values of the expected type. See
+        `liaison.compiler.value_guard`. None if the field has no such check
+        """
+        return None
+
+    def _compile_dump(self, gen, value: str, skip_none: bool) -> str:
+        """Returns a source expression serializing `value`, a parsed value of the field which isn't None, to
+        a JSON compatible value. See `liaison.compiler.compile_dump`
+        """
+        return value
+
+    def _string_converter(self) -> Optional[Callable[[str], Any]]:
+        """Returns a function converting a string from a query string, form or header to the input type of
+        the field, raising ValueError if it can't. See `liaison.web`. None if strings are validated as they
+        are
+        """
+        return None
+
+    def _compile_cast(self, gen):
+        """Emits the checks performed by `_cast_type`"""
+        type_ = gen.bind(self.type)
+        expected = gen.bind(self.type.__name__)
+
+        with gen.block(f"if not isinstance(v, {type_}):"):
+            with gen.block(f"if type(v) not in {gen.bind(self.input_types)}:"):
+                gen.fail("type", expected=expected)
+
+            if self.strict_type:
+                gen.fail("type", expected=expected)
+                return
+
+            with gen.block("try:"):
+                gen.line(f"v = {type_}(v)")
+            with gen.block("except (TypeError, ValueError):"):
+                gen.fail("cast", expected=expected)
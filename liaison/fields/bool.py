@@ -3,6 +3,25 @@ from typing import Optional, Any, Sequence, Callable
 from .base import Field
 from liaison.exceptions import ValidationError
 
+# Booleans in query strings, forms and headers, compared in lower case
+_BOOL_STRINGS = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    try:
+        return _BOOL_STRINGS[value.lower()]
+    except KeyError:
+        raise ValueError(value) from None
+
 
 class BoolField(Field):
     """Field for declaring booleans"""
@@ -22,3 +41,12 @@ class BoolField(Field):
             choices=choices,
             validator=validator,
         )
+
+    def _string_converter(self) -> Optional[Callable[[str], Any]]:
+        return _parse_bool
+
+    def _compile_value_guard(self, gen, value: str) -> Optional[str]:
+        return f"type({value}) is {gen.bind(bool)}"
+
+    def _compile_items_guard(self, gen, items: str) -> Optional[str]:
+        return f"set(map(type, {items})) == {{{gen.bind(bool)}}}"
@@ -1,8 +1,138 @@
 from typing import Optional, Any, Sequence, Callable
 from datetime import datetime
+from functools import lru_cache
+import re
 
 from .base import Field
-from ..exceptions import ValidationError
+from ..exceptions import FieldError
+
+# Directives parsed by the fixed width fast path, mapped to their width and datetime argument position
+_FIXED_WIDTH = {
+    "Y": (4, 0),
+    "m": (2, 1),
+    "d": (2, 2),
+    "H": (2, 3),
+    "M": (2, 4),
+    "S": (2, 5),
+    "f": (6, 6),
+}
+# strptime's defaults for the datetime arguments not in the format
+_DEFAULTS = (1900, 1, 1, 0, 0, 0, 0)
+_ISO_DEFAULTS = ("1900", "01", "01", "00", "00", "00", "000000")
+# Formats whose fixed width values are accepted as is by datetime.fromisoformat
+_ISO_FORMATS = {
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+}
+
+
+def _fixed_width_parser(date_format: str) -> Optional[Callable[[str], datetime]]:
+    """Returns a parser for values of the format with every field zero padded to its full width, or None if
+    the format has directives other than %Y, %m, %d, %H, %M, %S and %f. The parser returns None for values
+    which don't have the fixed width shape and raises ValueError for invalid dates
+    """
+    pattern = []
+    # The (start, end) slice of each datetime argument in a matching value
+    slices = {}
+    offset = 0
+    for token in re.split(r"(%.)", date_format):
+        if token == "%%":
+            pattern.append("%")
+            offset += 1
+        elif token.startswith("%"):
+            width, position = _FIXED_WIDTH.get(token[1:], (None, None))
+            if width is None or position in slices:
+                return None
+            pattern.append(f"[0-9]{{{width}}}")
+            slices[position] = (offset, offset + width)
+            offset += width
+        else:
+            pattern.append(re.escape(token))
+            offset += len(token)
+    if not slices:
+        return None
+
+    namespace = {
+        "fullmatch": re.compile("".join(pattern)).fullmatch,
+        "datetime": datetime,
+    }
+    if not hasattr(datetime, "fromisoformat"):  # pragma: no cover - Python < 3.7
+        args = [
+            (
+                f"int(value[{slices[position][0]}:{slices[position][1]}])"
+                if position in slices
+                else str(default)
+            )
+            for position, default in enumerate(_DEFAULTS)
+        ]
+        build = f"datetime({', '.join(args)})"
+    elif date_format in _ISO_FORMATS:
+        build = "datetime.fromisoformat(value)"
+    else:
+        # Reassemble the fields as an ISO 8601 string, fromisoformat is faster than int() on each field
+        parts = [
+            (
+                f"value[{slices[position][0]}:{slices[position][1]}]"
+                if position in slices
+                else repr(default)
+            )
+            for position, default in enumerate(_ISO_DEFAULTS)
+        ]
+        if max(slices) < 3:
+            # Date only formats
+            parts = parts[:3]
+        iso = parts[0] + "".join(
+            f' + "{sep}" + {part}' for sep, part in zip("--T::.", parts[1:])
+        )
+        build = f"datetime.fromisoformat({iso})"
+    exec(
+        "def parse(value):\n"
+        "    if fullmatch(value) is None:\n"
+        "        return None\n"
+        f"    return {build}\n",
+        namespace,
+    )
+    return namespace["parse"]
+
+
+def make_parser(
+    date_format: str, cache_size: Optional[int] = None
+) -> Callable[[str], datetime]:
+    """Returns a function equivalent to `datetime.strptime(value, date_format)`. Values in the fixed width
+    shape of common formats (e.g. "%Y-%m-%d", "%d-%m-%Y", "%Y-%m-%dT%H:%M:%S") are parsed without strptime,
+    anything else (including values strptime rejects) falls back to strptime.
+
+    :param date_format: The strptime format
+    :param cache_size: An optional maximum number of values to keep in an LRU cache of parsed values
+    :returns: The parser, raising ValueError for values not matching the format
+    """
+    strptime = datetime.strptime
+    fast = _fixed_width_parser(date_format)
+
+    if fast is None:
+
+        def parse(value: str) -> datetime:
+            return strptime(value, date_format)
+
+    else:
+
+        def parse(value: str) -> datetime:
+            try:
+                result = fast(value)
+            except ValueError:
+                result = None
+            if result is None:
+                return strptime(value, date_format)
+            return result
+
+    if cache_size:
+        parse = lru_cache(maxsize=cache_size)(parse)
+    return parse
 
 
 class DateTimeField(Field):
@@ -15,6 +145,7 @@ class DateTimeField(Field):
         default: Optional[Any] = None,
         choices: Optional[Sequence[str]] = None,
         validator: Optional[Callable] = None,
+        cache_size: Optional[int] = None,
     ):
         super().__init__(
             type=datetime,
@@ -24,13 +155,47 @@ class DateTimeField(Field):
             choices=choices,
             validator=validator,
         )
+        self.cache_size = cache_size
         self.date_format = date_format
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in ("date_format", "cache_size") and "date_format" in self.__dict__:
+            super().__setattr__(
+                "_parse", make_parser(self.date_format, self.cache_size)
+            )
+
+    def __getstate__(self) -> dict:
+        # The parser is rebuilt from the date format when unpickled
+        state = super().__getstate__()
+        del state["_parse"]
+        return state
+
+    def __setstate__(self, state: dict):
+        super().__setstate__(state)
+        self.__dict__["_parse"] = make_parser(self.date_format, self.cache_size)
+
+    def cache_info(self):
+        """Returns the hit and miss statistics of the parse cache, or None if `cache_size` is not set"""
+        return self._parse.cache_info() if self.cache_size else None
+
     def _cast_type(self, key, value: Any):
+        if isinstance(value, datetime):
+            return value
         try:
-            value = datetime.strptime(value, self.date_format)
+            value = self._parse(value)
         except ValueError:
-            raise ValidationError(
-                f"Invalid value for '{key}', must match format '{self.date_format}'"
+            raise FieldError(
+                "date_format", key, value, {"date_format": self.date_format}
             )
         return value
+
+    def _compile_dump(self, gen, value: str, skip_none: bool) -> str:
+        return f"{value}.strftime({gen.bind(self.date_format)})"
+
+    def _compile_cast(self, gen):
+        with gen.block(f"if not isinstance(v, {gen.bind(datetime)}):"):
+            with gen.block("try:"):
+                gen.line(f"v = {gen.bind(self._parse)}(v)")
+            with gen.block("except ValueError:"):
+                gen.fail("date_format", date_format=gen.bind(self.date_format))
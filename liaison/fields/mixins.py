@@ -1,7 +1,7 @@
 from typing import Optional, Any
 from numbers import Number
 
-from liaison.exceptions import ValidationError
+from liaison.exceptions import FieldError
 
 
 class FieldMixin:
@@ -24,23 +24,39 @@ class SizedFieldMixin(FieldMixin):
         self.max_len = max_len
         super().__init__(**kwargs)
 
+    def _check_size(self, key, value: Any):
+        if any((self.min_len, self.max_len)) and not hasattr(value, "__len__"):
+            raise FieldError("sized", key, value, {"expected": self.type.__name__})
+
+        if self.min_len and len(value) < self.min_len:
+            raise FieldError("min_len", key, value, {"min_len": self.min_len})
+        if self.max_len and len(value) > self.max_len:
+            raise FieldError("max_len", key, value, {"max_len": self.max_len})
+
     def validate(self, key, value: Any):
         if value is not None:
-            if any((self.min_len, self.max_len)) and not hasattr(value, "__len__"):
-                raise ValidationError(
-                    f"Invalid value for '{key}', expecting '{self.type.__name__}'"
-                )
-
-            if self.min_len and len(value) < self.min_len:
-                raise ValidationError(
-                    f"Value for '{key}' did not meet required length of {self.min_len}"
-                )
-            if self.max_len and len(value) > self.max_len:
-                raise ValidationError(
-                    f"Value for '{key}' exceeded maximum length of {self.max_len}"
-                )
+            self._check_size(key, value)
         return super().validate(key, value)
 
+    def _compile_size(self, gen):
+        """Emits the checks performed by `_check_size`, for a value which isn't None"""
+        if not any((self.min_len, self.max_len)):
+            return
+        with gen.block("if not hasattr(v, '__len__'):"):
+            gen.fail("sized", expected=gen.bind(self.type.__name__))
+        if self.min_len:
+            with gen.block(f"if len(v) < {gen.bind(self.min_len)}:"):
+                gen.fail("min_len", min_len=gen.bind(self.min_len))
+        if self.max_len:
+            with gen.block(f"if len(v) > {gen.bind(self.max_len)}:"):
+                gen.fail("max_len", max_len=gen.bind(self.max_len))
+
+    def _compile(self, gen):
+        if any((self.min_len, self.max_len)):
+            with gen.block("if v is not None:"):
+                self._compile_size(gen)
+        super()._compile(gen)
+
 
 class NumericFieldMixin(FieldMixin):
     """Mixin for numeric fields"""
@@ -49,29 +65,61 @@ class NumericFieldMixin(FieldMixin):
         self,
         min_val: Optional[Number] = None,
         max_val: Optional[Number] = None,
+        max_digits: Optional[int] = None,
         **kwargs,
     ):
         self.min_val = min_val
         self.max_val = max_val
+        self.max_digits = max_digits
         super().__init__(**kwargs)
 
-    def _check_type(self, key, value: Any):
+    def _check_type(self, key, value: Any) -> Any:
+        """Checks the value is a number, returning it as the number compared with `min_val` and `max_val`:
+        the value itself for ints and floats, the value cast to the type of the field otherwise
+        """
+        # Converting a string costs more than linear time in its length, long strings are rejected first
+        if (
+            self.max_digits is not None
+            and type(value) is str
+            and len(value) > self.max_digits
+        ):
+            raise FieldError("max_digits", key, value, {"max_digits": self.max_digits})
         try:
             int(value)
-        except ValueError:
-            raise ValidationError(
-                f"Incorrect type '{type(value).__name__}' for '{key}', expecting a number"
-            )
+            if type(value) is int or type(value) is float:
+                return value
+            return self.type(value)
+        except (TypeError, ValueError, OverflowError):
+            raise FieldError("number", key, value, {})
 
     def validate(self, key, value: Any):
         if value is not None:
-            self._check_type(key, value)
-            if self.min_val and value < self.min_val:
-                raise ValidationError(
-                    f"Value for '{key}' must be at least {self.min_val}"
-                )
-            if self.max_val and value > self.max_val:
-                raise ValidationError(
-                    f"Value for '{key}' must be less than {self.max_val}"
-                )
+            number = self._check_type(key, value)
+            if self.min_val and number < self.min_val:
+                raise FieldError("min_val", key, value, {"min_val": self.min_val})
+            if self.max_val and number > self.max_val:
+                raise FieldError("max_val", key, value, {"max_val": self.max_val})
         return super().validate(key, value)
+
+    def _compile(self, gen):
+        with gen.block("if v is not None:"):
+            if self.max_digits is not None:
+                max_digits = gen.bind(self.max_digits)
+                with gen.block(f"if type(v) is str and len(v) > {max_digits}:"):
+                    gen.fail("max_digits", max_digits=max_digits)
+            number = gen.variable("n")
+            with gen.block("try:"):
+                gen.line("int(v)")
+                if self.min_val or self.max_val:
+                    # Bounds are compared with the number, strings are compared once cast
+                    numeric = "type(v) is int or type(v) is float"
+                    gen.line(f"{number} = v if {numeric} else {gen.bind(self.type)}(v)")
+            with gen.block("except (TypeError, ValueError, OverflowError):"):
+                gen.fail("number")
+            if self.min_val:
+                with gen.block(f"if {number} < {gen.bind(self.min_val)}:"):
+                    gen.fail("min_val", min_val=gen.bind(self.min_val))
+            if self.max_val:
+                with gen.block(f"if {number} > {gen.bind(self.max_val)}:"):
+                    gen.fail("max_val", max_val=gen.bind(self.max_val))
+        super()._compile(gen)
@@ -0,0 +1,97 @@
+from typing import Optional, Any, Sequence, Callable, Union
+
+from .base import Field
+from ..compiler import emit_schema
+from ..nested import validate_nested, make_node, emit_nested, dump_nested
+
+
+class SchemaField(Field):
+    """Field for declaring nested schemas. The value is parsed with the schema and returned as its Namespace.
+
+    A schema can't refer to itself in its own body, so for recursive schemas `schema` can be a function
+    returning the schema class, e.g. `SchemaField(lambda: TreeSchema)`
+    """
+
+    of = None
+
+    def __init__(
+        self,
+        schema: Union[type, Callable[[], type]],
+        required: Optional[bool] = False,
+        default: Optional[Any] = None,
+        choices: Optional[Sequence] = None,
+        validator: Optional[Callable] = None,
+    ):
+        super().__init__(
+            type=dict,
+            input_types=(dict,),
+            required=required,
+            default=default,
+            choices=choices,
+            validator=validator,
+        )
+        self._schema = schema
+
+    @property
+    def schema(self) -> type:
+        if not isinstance(self._schema, type):
+            self._schema = self._schema()
+        return self._schema
+
+    def _inline_plan(self):
+        """Returns the plan of the schema if it's compiled into the plans of parent schemas, None if values
+        are validated by `validate_nested`. Schemas declared as a class without nested or async fields are
+        inlined, so nesting them costs no more than declaring their fields in the parent
+        """
+        schema = self._schema
+        if not isinstance(schema, type) or schema._compiling:
+            return None
+        plan = schema._get_plan()
+        if plan.nested or plan.has_async_validators:
+            return None
+        return plan
+
+    @property
+    def _nested(self) -> bool:
+        return self._inline_plan() is None
+
+    def _compiled_fields(self) -> tuple:
+        plan = self._inline_plan()
+        if plan is None:
+            return (self,)
+        return (self,) + tuple(
+            f for _, field in plan.fields for f in field._compiled_fields()
+        )
+
+    def _nested_schemas(self) -> tuple:
+        return (self.schema,)
+
+    def _validate_self(self, key, value):
+        """Validates the value itself, without parsing it with the schema"""
+        return super().validate(key, value)
+
+    def _compile_self(self, gen):
+        super()._compile(gen)
+
+    def _dump(self, value: Any, skip_none: bool) -> dict:
+        return self.schema.dump(value, skip_none=skip_none)
+
+    def _compile_dump(self, gen, value: str, skip_none: bool) -> str:
+        if self._nested:
+            return f"{gen.bind(dump_nested)}({gen.bind(make_node(self, compiled=False))}, {value}, {skip_none})"
+        return f"{gen.bind(self._dump)}({value}, {skip_none})"
+
+    def _make_node(self, compiled: bool = True):
+        return make_node(self, compiled)
+
+    def validate(self, key, value):
+        return validate_nested(make_node(self, compiled=False), key, value)
+
+    def _compile(self, gen):
+        plan = self._inline_plan()
+        if plan is None:
+            emit_nested(gen, self)
+            return
+        super()._compile(gen)
+        with gen.block("if isinstance(v, dict):"):
+            emit_schema(gen, plan)
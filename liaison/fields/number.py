@@ -1,5 +1,6 @@
 from typing import Optional, Any, Sequence, Callable
 from numbers import Number
+from math import isfinite
 
 from .base import Field
 from .mixins import NumericFieldMixin
@@ -17,6 +18,7 @@ class NumberField(NumericFieldMixin, Field):
         validator: Optional[Callable] = None,
         min_val: Optional[Number] = None,
         max_val: Optional[Number] = None,
+        max_digits: Optional[int] = None,
     ):
         super().__init__(
             type=type,
@@ -27,8 +29,50 @@ class NumberField(NumericFieldMixin, Field):
             validator=validator,
             min_val=min_val,
             max_val=max_val,
+            max_digits=max_digits,
         )
 
+    def _string_converter(self) -> Optional[Callable[[str], Any]]:
+        if self.type not in (int, float):
+            return None
+        if self.max_digits is None:
+            return self.type
+        convert, max_digits = self.type, self.max_digits
+
+        def convert_digits(value: str) -> Any:
+            # Long strings are left for the field to reject
+            if len(value) > max_digits:
+                raise ValueError(value)
+            return convert(value)
+
+        return convert_digits
+
+    def _compile_value_guard(self, gen, value: str) -> Optional[str]:
+        if self.type not in (int, float):
+            return None
+        checks = [f"type({value}) is {gen.bind(self.type)}"]
+        if self.type is float:
+            checks.append(f"{gen.bind(isfinite)}({value})")
+        if self.min_val:
+            checks.append(f"{value} >= {gen.bind(self.min_val)}")
+        if self.max_val:
+            checks.append(f"{value} <= {gen.bind(self.max_val)}")
+        return " and ".join(checks)
+
+    def _compile_items_guard(self, gen, items: str) -> Optional[str]:
+        if self.type not in (int, float):
+            return None
+        checks = [f"set(map(type, {items})) == {{{gen.bind(self.type)}}}"]
+        if self.type is float:
+            # int() rejects NaN and infinity. Their sum isn't finite, nor is a sum which overflows, which
+            # only costs the fast path
+            checks.append(f"{gen.bind(isfinite)}(sum({items}))")
+        if self.min_val:
+            checks.append(f"min({items}) >= {gen.bind(self.min_val)}")
+        if self.max_val:
+            checks.append(f"max({items}) <= {gen.bind(self.max_val)}")
+        return " and ".join(checks)
+
 
 class IntField(NumberField):
     """Integer field"""
@@ -41,6 +85,7 @@ class IntField(NumberField):
         validator: Optional[Callable] = None,
         min_val: Optional[Number] = None,
         max_val: Optional[Number] = None,
+        max_digits: Optional[int] = None,
     ):
         super().__init__(
             type=int,
@@ -50,6 +95,7 @@ class IntField(NumberField):
             validator=validator,
             min_val=min_val,
             max_val=max_val,
+            max_digits=max_digits,
         )
 
 
@@ -64,6 +110,7 @@ class FloatField(NumberField):
         validator: Optional[Callable] = None,
         min_val: Optional[Number] = None,
         max_val: Optional[Number] = None,
+        max_digits: Optional[int] = None,
     ):
         super().__init__(
             type=float,
@@ -73,4 +120,5 @@ class FloatField(NumberField):
             validator=validator,
             min_val=min_val,
             max_val=max_val,
+            max_digits=max_digits,
         )
@@ -1,11 +1,28 @@
 from typing import Optional, Any, Sequence, Callable, Union
+from array import array
 
 from .base import Field
 from .mixins import SizedFieldMixin
-from liaison.exceptions import ValidationError
+from .nested import SchemaField
+from ..compiler import compile_check, items_guard
+from ..nested import (
+    validate_items,
+    validate_nested,
+    make_node,
+    emit_nested,
+    dump_nested,
+)
+from ..exceptions import FieldError, SchemaException
+
+# array.array type codes of the item types which can be stored in arrays
+_TYPECODES = {int: "q", float: "d"}
 
 
 class SequenceField(SizedFieldMixin, Field):
+
+    as_array = False
+    _multi_valued = True
+
     def __init__(
         self,
         type: type,
@@ -15,6 +32,7 @@ class SequenceField(SizedFieldMixin, Field):
         validator: Optional[Callable] = None,
         min_len: Optional[int] = None,
         max_len: Optional[int] = None,
+        of: Optional[Field] = None,
     ):
         super().__init__(
             type=type,
@@ -26,10 +44,101 @@ class SequenceField(SizedFieldMixin, Field):
             min_len=min_len,
             max_len=max_len,
         )
+        self.of = of
+
+    @property
+    def _nested(self) -> bool:
+        return self.of is not None and self.of._nested
+
+    def _compiled_fields(self) -> tuple:
+        if self.of is None:
+            return (self,)
+        return (self,) + self.of._compiled_fields()
+
+    def _nested_schemas(self) -> tuple:
+        return () if self.of is None else self.of._nested_schemas()
+
+    def _compile_dump(self, gen, value: str, skip_none: bool) -> str:
+        if self.as_array:
+            return f"{value}.tolist()"
+        if self._nested:
+            return f"{gen.bind(dump_nested)}({gen.bind(make_node(self, compiled=False))}, {value}, {skip_none})"
+        if self.of is not None:
+            item = gen.variable("item")
+            expr = self.of._compile_dump(gen, item, skip_none)
+            if expr != item:
+                return f"[None if {item} is None else {expr} for {item} in {value}]"
+        return value if self.type is list else f"list({value})"
+
+    def _string_converter(self) -> Optional[Callable[[str], Any]]:
+        # Converts the items, see `liaison.web`
+        return self.of._string_converter() if self.of is not None else None
+
+    def _validate_self(self, key, value):
+        """Validates the sequence itself, without its items"""
+        return super().validate(key, value)
+
+    def _compile_self(self, gen):
+        super()._compile(gen)
+
+    def _make_node(self, compiled: bool = True):
+        return make_node(self, compiled)
+
+    def validate(self, key, value):
+        if self.of is None or self._validator:
+            return super().validate(key, value)
+        if self._nested:
+            return validate_nested(make_node(self, compiled=False), key, value)
+        value = super().validate(key, value)
+        if value is not None:
+            value = validate_items(lambda item: self.of.validate(key, item), key, value)
+            if self.as_array:
+                typecode = _TYPECODES[self.of.type]
+                try:
+                    value = array(typecode, value)
+                except (TypeError, OverflowError):
+                    raise FieldError("array", key, value, {"typecode": typecode})
+            elif self.type is not list:
+                value = self.type(value)
+        return value
+
+    def _compile(self, gen):
+        if self.of is None or self._validator:
+            super()._compile(gen)
+        elif self._nested:
+            emit_nested(gen, self)
+        else:
+            super()._compile(gen)
+            items = f"{gen.bind(validate_items)}({gen.bind(compile_check(gen.name, self.of))}, {gen.key}, v)"
+            # Sequences of items which all pass the checks of the item field unchanged are copied as is
+            guard = items_guard(gen, self.of, "v")
+            with gen.block("if v is not None:"):
+                if guard is None:
+                    gen.line(f"v = {items}")
+                else:
+                    with gen.block(f"if {guard}:"):
+                        # Sets are already a copy, arrays are built below
+                        gen.line(
+                            "v = list(v)"
+                            if self.type is list and not self.as_array
+                            else "pass"
+                        )
+                    with gen.block("else:"):
+                        gen.line(f"v = {items}")
+                if self.as_array:
+                    typecode = gen.bind(_TYPECODES[self.of.type])
+                    with gen.block("try:"):
+                        gen.line(f"v = {gen.bind(array)}({typecode}, v)")
+                    with gen.block("except (TypeError, OverflowError):"):
+                        gen.fail("array", typecode=typecode)
+                elif self.type is not list:
+                    gen.line(f"v = {gen.bind(self.type)}(v)")
 
 
 class ListField(SequenceField):
-    """Field for declaring lists"""
+    """Field for declaring lists. Items are validated with the `of` field, if given. With `as_array`, lists
+    of ints or floats are returned as an `array.array` (of type "q" or "d"), which stores the items unboxed
+    """
 
     def __init__(
         self,
@@ -39,7 +148,14 @@ class ListField(SequenceField):
         validator: Optional[Callable] = None,
         min_len: Optional[int] = None,
         max_len: Optional[int] = None,
+        of: Optional[Field] = None,
+        as_array: Optional[bool] = False,
     ):
+        if as_array and getattr(of, "type", None) not in _TYPECODES:
+            raise SchemaException(
+                "as_array requires an `of` field of type int or float"
+            )
+        self.as_array = as_array
         super().__init__(
             type=list,
             required=required,
@@ -48,11 +164,14 @@ class ListField(SequenceField):
             validator=validator,
             min_len=min_len,
             max_len=max_len,
+            of=of,
         )
 
 
 class SetField(SequenceField):
-    """Field for declaring sets. The list will be parsed and returned as a set"""
+    """Field for declaring sets. The list will be parsed and returned as a set. Items are validated with the
+    `of` field, if given
+    """
 
     def __init__(
         self,
@@ -62,7 +181,12 @@ class SetField(SequenceField):
         validator: Optional[Callable] = None,
         min_len: Optional[int] = None,
         max_len: Optional[int] = None,
+        of: Optional[Field] = None,
     ):
+        if isinstance(of, SchemaField):
+            raise SchemaException(
+                "SetField items must be hashable, nested schemas are not supported"
+            )
         super().__init__(
             type=set,
             required=required,
@@ -71,7 +195,12 @@ class SetField(SequenceField):
             validator=validator,
             min_len=min_len,
             max_len=max_len,
+            of=of,
         )
 
     def _cast_type(self, key, value):
         return super()._cast_type(key, set(value))
+
+    def _compile_cast(self, gen):
+        gen.line("v = set(v)")
+        super()._compile_cast(gen)
@@ -4,7 +4,7 @@ import re
 
 from .base import Field
 from .mixins import SizedFieldMixin
-from ..exceptions import ValidationError
+from ..exceptions import FieldError
 
 
 class StringField(SizedFieldMixin, Field):
@@ -34,21 +34,75 @@ class StringField(SizedFieldMixin, Field):
 
     def validate(self, key, value):
 
-        if self.regex:
+        if self.regex and value is not None:
+            # The length is checked before the regex, so the time spent matching is bounded by max_len
+            self._check_size(key, value)
             if not self.regex.match(value):
-                raise ValidationError(
-                    f"Invalid pattern for '{key}', must match pattern '{self.regex.pattern}'"
-                )
+                raise FieldError("pattern", key, value, {"pattern": self.regex.pattern})
+            return super(SizedFieldMixin, self).validate(key, value)
         return super().validate(key, value)
 
+    def _compile(self, gen):
+        if self.regex:
+            with gen.block("if v is not None:"):
+                self._compile_size(gen)
+                with gen.block(f"if not {gen.bind(self.regex.match)}(v):"):
+                    gen.fail("pattern", pattern=gen.bind(self.regex.pattern))
+            super(SizedFieldMixin, self)._compile(gen)
+            return
+        super()._compile(gen)
+
+    def _compile_value_guard(self, gen, value: str) -> Optional[str]:
+        if self.regex:
+            return None
+        checks = [f"type({value}) is {gen.bind(str)}"]
+        if self.min_len:
+            checks.append(f"len({value}) >= {gen.bind(self.min_len)}")
+        if self.max_len:
+            checks.append(f"len({value}) <= {gen.bind(self.max_len)}")
+        return " and ".join(checks)
+
+    def _compile_items_guard(self, gen, items: str) -> Optional[str]:
+        if self.regex:
+            return None
+        checks = [f"set(map(type, {items})) == {{{gen.bind(str)}}}"]
+        if self.min_len:
+            checks.append(f"min(map(len, {items})) >= {gen.bind(self.min_len)}")
+        if self.max_len:
+            checks.append(f"max(map(len, {items})) <= {gen.bind(self.max_len)}")
+        return " and ".join(checks)
+
+
+_HEX = "[0-9a-fA-F]"
+_CANONICAL_UUID = f"{_HEX}{{8}}-{_HEX}{{4}}-{_HEX}{{4}}-{_HEX}{{4}}-{_HEX}{{12}}"
+
+
+def _uuid_pattern(allow_hex: bool, allow_braces: bool, allow_urn: bool) -> str:
+    """Returns the regular expression matching the accepted forms of a UUID"""
+    uuid_ = f"(?:{_CANONICAL_UUID}|{_HEX}{{32}})" if allow_hex else _CANONICAL_UUID
+    forms = [uuid_]
+    if allow_braces:
+        forms.append(f"\\{{{uuid_}\\}}")
+    if allow_urn:
+        forms.append(f"urn:uuid:{uuid_}")
+    return "|".join(forms)
+
 
 class UUIDField(StringField):
+    """Field for declaring UUIDs. Only the canonical form (e.g. "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c") is
+    accepted unless other forms are allowed
+    """
+
     def __init__(
         self,
         required: Optional[bool] = False,
         default: Optional[Any] = None,
         choices: Optional[Sequence[str]] = None,
         validator: Optional[Callable] = None,
+        as_uuid: Optional[bool] = False,
+        allow_hex: Optional[bool] = False,
+        allow_braces: Optional[bool] = False,
+        allow_urn: Optional[bool] = False,
     ):
         super().__init__(
             required=required,
@@ -57,13 +111,72 @@ class UUIDField(StringField):
             validator=validator,
         )
         self.input_types = (str,)
+        self.as_uuid = as_uuid
+        if as_uuid:
+            self.type = uuid.UUID
+        pattern = _uuid_pattern(allow_hex, allow_braces, allow_urn)
+        self._match = re.compile(pattern).fullmatch
+        self._match_many = re.compile(f"(?:(?:{pattern})\n)*(?:{pattern})").fullmatch
+
+    def _check_uuid(self, key, value):
+        if isinstance(value, str):
+            if self._match(value) is not None:
+                return uuid.UUID(value) if self.as_uuid else value
+        elif self.as_uuid and isinstance(value, uuid.UUID):
+            return value
+        raise FieldError("uuid", key, value, {})
 
     def validate(self, key, value):
+        # The string and length checks of StringField don't apply to a valid UUID and are skipped
         if value is not None:
+            value = self._check_uuid(key, value)
+        return Field.validate(self, key, value)
+
+    def validate_many(self, key: str, values: Sequence[Any]) -> list:
+        """Validates a sequence of values, equivalent to calling `validate` for each value. Sequences of
+        strings are checked in a single pass when the field has no validator or choices
+
+        :param key: The key of the values
+        :param values: The values to validate
+        :returns: A list of the validated values
+        """
+        if values and not (self._validator or self.choices):
             try:
-                uuid.UUID(value)
-            except (ValueError, AttributeError):
-                raise ValidationError(
-                    f"Invalid value for '{key}'. Expecting a valid UUID not '{value}' "
-                )
-        return super().validate(key, value)
+                joined = "\n".join(values)
+            except TypeError:
+                joined = None
+            # A value containing a newline would be matched as two UUIDs, which the newline count rules out
+            if (
+                joined
+                and self._match_many(joined) is not None
+                and joined.count("\n") == len(values) - 1
+            ):
+                if self.as_uuid:
+                    return [uuid.UUID(value) for value in values]
+                return list(values)
+        return [self.validate(key, value) for value in values]
+
+    def _cast_type(self, key, value: Any):
+        # `validate` has already checked the type
+        return value
+
+    def _compile_dump(self, gen, value: str, skip_none: bool) -> str:
+        return f"str({value})" if self.as_uuid else value
+
+    def _compile(self, gen):
+        with gen.block("if v is not None:"):
+            with gen.block("if isinstance(v, str):"):
+                with gen.block(f"if {gen.bind(self._match)}(v) is None:"):
+                    gen.fail("uuid")
+                if self.as_uuid:
+                    gen.line(f"v = {gen.bind(uuid.UUID)}(v)")
+            if self.as_uuid:
+                with gen.block(f"elif not isinstance(v, {gen.bind(uuid.UUID)}):"):
+                    gen.fail("uuid")
+            else:
+                with gen.block("else:"):
+                    gen.fail("uuid")
+        Field._compile(self, gen)
+
+    def _compile_cast(self, gen):
+        gen.line("pass")
@@ -0,0 +1,157 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from bisect import bisect_left
+from weakref import WeakSet
+
+# Upper bounds of the latency histogram buckets in nanoseconds, from 1µs to 10ms. Slower calls are only
+# counted in the implicit +Inf bucket
+DEFAULT_BUCKETS = (
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    250_000,
+    1_000_000,
+    10_000_000,
+)
+
+# Schemas with instrumentation enabled, exported by `export_prometheus`
+_instrumented = WeakSet()
+
+
+class FieldMetrics:
+    """Call counts, latency and rejections of a single field. Updated by the instrumented parse functions
+    of the schema, see `Schema.enable_instrumentation`
+
+    :param buckets: The upper bounds of the latency histogram buckets, in nanoseconds
+    """
+
+    __slots__ = ("bounds", "calls", "total_ns", "buckets", "rejections")
+
+    # The instrumented parse functions also call `record` with the type of each value if True
+    record_types = False
+
+    def __init__(self, buckets: Sequence[int] = DEFAULT_BUCKETS):
+        self.bounds = tuple(buckets)
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.total_ns = 0
+        # One count per bucket plus the +Inf bucket, not cumulative
+        self.buckets = [0] * (len(self.bounds) + 1)
+        # Rejected values by error code
+        self.rejections: Dict[str, int] = {}
+
+    def observe(self, elapsed_ns: int):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.buckets[bisect_left(self.bounds, elapsed_ns)] += 1
+
+    def reject(self, error: Exception, elapsed_ns: int):
+        self.observe(elapsed_ns)
+        # Errors raised by custom validators may not have a code
+        code = getattr(error, "code", None) or "custom"
+        self.rejections[code] = self.rejections.get(code, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "buckets": dict(zip(self.bounds + ("+Inf",), self.buckets)),
+            "rejections": dict(self.rejections),
+        }
+
+
+class SchemaMetrics:
+    """The metrics of the fields of a schema, by field name. Fields of inlined nested schemas are recorded
+    by their path, e.g. `address.city`
+
+    :param schema: The name of the schema
+    :param buckets: The upper bounds of the latency histogram buckets, in nanoseconds
+    """
+
+    def __init__(self, schema: str, buckets: Sequence[int] = DEFAULT_BUCKETS):
+        self.schema = schema
+        self.bounds = tuple(sorted(buckets))
+        self.fields: Dict[str, FieldMetrics] = {}
+
+    def field(self, name: str) -> FieldMetrics:
+        """Returns the metrics of the named field, creating them if needed"""
+        metrics = self.fields.get(name)
+        if metrics is None:
+            metrics = self.fields[name] = FieldMetrics(self.bounds)
+        return metrics
+
+    def reset(self):
+        """Resets the metrics of every field to zero"""
+        # In place, the instrumented parse functions hold the FieldMetrics
+        for metrics in self.fields.values():
+            metrics.reset()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the metrics of each field as a dict of calls, total_ns, buckets and rejections"""
+        return {name: metrics.to_dict() for name, metrics in self.fields.items()}
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+        return _render([self])
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render(schemas: Iterable[SchemaMetrics]) -> str:
+    latency = [
+        "# HELP liaison_field_duration_seconds Time spent validating a field",
+        "# TYPE liaison_field_duration_seconds histogram",
+    ]
+    rejections = [
+        "# HELP liaison_field_rejections_total Values rejected by a field, by error code",
+        "# TYPE liaison_field_rejections_total counter",
+    ]
+    for schema in schemas:
+        for name, metrics in schema.fields.items():
+            labels = f'schema="{_label(schema.schema)}",field="{_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(metrics.bounds + (None,), metrics.buckets):
+                cumulative += count
+                le = "+Inf" if bound is None else repr(bound / 1e9)
+                latency.append(
+                    f'liaison_field_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}'
+                )
+            latency.append(
+                f"liaison_field_duration_seconds_sum{{{labels}}} {metrics.total_ns / 1e9!r}"
+            )
+            latency.append(
+                f"liaison_field_duration_seconds_count{{{labels}}} {metrics.calls}"
+            )
+            for code, count in sorted(metrics.rejections.items()):
+                rejections.append(
+                    f'liaison_field_rejections_total{{{labels},code="{_label(code)}"}} {count}'
+                )
+    return "\n".join(latency + rejections) + "\n"
+
+
+def register(schema: type):
+    _instrumented.add(schema)
+
+
+def unregister(schema: type):
+    _instrumented.discard(schema)
+
+
+def export_prometheus(schemas: Optional[Iterable[type]] = None) -> str:
+    """Returns the metrics of instrumented schemas in the Prometheus text exposition format, e.g. to serve
+    from a `/metrics` endpoint.
+
+    :param schemas: The schemas to export, defaults to every schema with instrumentation enabled
+    :returns: The metrics text
+    """
+    if schemas is None:
+        schemas = sorted(_instrumented, key=lambda schema: schema.__qualname__)
+    metrics: List[SchemaMetrics] = [schema.get_metrics() for schema in schemas]
+    return _render(m for m in metrics if m is not None)
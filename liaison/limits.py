@@ -0,0 +1,21 @@
+from typing import NamedTuple, Optional
+
+# Policies for keys of a payload which aren't fields of the schema
+UNKNOWN_KEYS = ("ignore", "forbid")
+
+
+class Limits(NamedTuple):
+    """Bounds on the input a schema accepts, to keep the cost of hostile payloads bounded. Declared in the
+    schema body and inherited by subclasses:
+
+        class UserSchema(Schema):
+            __limits__ = Limits(max_keys=50, max_size=64 * 1024, unknown_keys="forbid")
+
+    :param max_keys: The maximum number of keys in a payload, including keys which aren't fields
+    :param max_size: The maximum size in bytes of a raw payload passed to `parse_json` or `parse_query`
+    :param unknown_keys: "ignore" keys which aren't fields of the schema, or "forbid" them
+    """
+
+    max_keys: Optional[int] = None
+    max_size: Optional[int] = None
+    unknown_keys: str = "ignore"
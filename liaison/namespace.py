@@ -1,9 +1,14 @@
+from abc import ABCMeta
 from argparse import Namespace as _Namespace
-from typing import Optional, Any, Sequence
+from typing import Optional, Any, Callable, Sequence, Tuple
+from keyword import iskeyword
 
 
-class Namespace(_Namespace):
-    """Simple namespace object returned when parsing a Schema"""
+class Namespace(_Namespace, metaclass=ABCMeta):
+    """Simple namespace object returned when parsing a Schema. The namespace classes generated for each
+    Schema (see `SchemaNamespace`) are registered as virtual subclasses, so `isinstance(result, Namespace)`
+    holds for every parse result
+    """
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """Get an attribute from the namespace, provide an optional default value"""
@@ -16,8 +21,221 @@ class Namespace(_Namespace):
         :param exclude: An optional sequence of values to exclude
         :returns: A dictionary of the Namespace keys and values
         """
-        return {
-            k: getattr(self, k)
-            for k, v in vars(self).items()
-            if k not in set(exclude or [])
-        }
+        exclude = set(exclude or [])
+        return {k: v for k, v in vars(self).items() if k not in exclude}
+
+
+class SchemaNamespace:
+    """Base class of the namespace classes generated for each Schema, see `namespace_class`. Shares the
+    `Namespace` API, but stores the parsed values in `__slots__` rather than a per instance `__dict__`.
+    `vars(result)` returns a new dict of the values (like `to_dict`), changing it doesn't change the namespace
+    """
+
+    __slots__ = ()
+
+    _schema = None
+    _fields: Tuple[str, ...] = ()
+
+    def _values(self) -> tuple:  # pragma: no cover - generated for each subclass
+        raise NotImplementedError
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Get an attribute from the namespace, provide an optional default value"""
+        return getattr(self, key, default)
+
+    def to_dict(self, exclude: Optional[Sequence] = None) -> dict:
+        """Returns the Namespace as a dictionary. An optional `exclude` param can be supplied
+        to exclude values from the response.
+
+        :param exclude: An optional sequence of values to exclude
+        :returns: A dictionary of the Namespace keys and values
+        """
+        if not exclude:
+            return dict(zip(self._fields, self._values()))
+        exclude = set(exclude)
+        return {k: getattr(self, k) for k in self._fields if k not in exclude}
+
+    @property
+    def __dict__(self) -> dict:
+        # For `vars`, as the values are in slots
+        return self.to_dict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SchemaNamespace):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, _Namespace):
+            return self.to_dict() == vars(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in zip(self._fields, self._values()))
+        return f"{type(self).__name__}({args})"
+
+    def __reduce__(self):
+        return _restore, (self._schema, self._fields, self._values())
+
+
+Namespace.register(SchemaNamespace)
+
+
+def _restore(schema, fields: Tuple[str, ...], values: tuple) -> SchemaNamespace:
+    cls = schema._get_plan().result
+    if cls._fields != fields:
+        return Namespace(**dict(zip(fields, values)))
+    return cls(*values)
+
+
+def namespace_class(schema: type, fields: Sequence[str]) -> type:
+    """Creates a SchemaNamespace subclass with a slot for each field. Instances are created with the
+    values passed positionally in field order.
+
+    :param schema: The Schema class the namespace belongs to
+    :param fields: The field names
+    :returns: The namespace class
+    """
+    fields = tuple(fields)
+    namespace = {}
+    if all(name.isidentifier() and not iskeyword(name) for name in fields):
+        params = [f"_{i}" for i in range(len(fields))]
+        source = (
+            f"def __init__(self, {', '.join(params)}):\n"
+            # A schema without fields still needs a body
+            + (
+                "".join(
+                    f"    self.{name} = {param}\n"
+                    for name, param in zip(fields, params)
+                )
+                or "    pass\n"
+            )
+            + "def _values(self):\n"
+            + f"    return ({''.join(f'self.{name}, ' for name in fields)})\n"
+        )
+        exec(source, namespace)
+    else:
+
+        def __init__(self, *values):
+            for name, value in zip(fields, values):
+                setattr(self, name, value)
+
+        def _values(self):
+            return tuple(getattr(self, name) for name in fields)
+
+        namespace.update(__init__=__init__, _values=_values)
+
+    # Fields set on a schema with setattr may not be identifiers, which slots must be
+    slots = fields if all(name.isidentifier() for name in fields) else ("__dict__",)
+
+    return type(
+        f"{schema.__name__}Namespace",
+        (SchemaNamespace,),
+        {
+            "__slots__": slots,
+            "__module__": schema.__module__,
+            "__init__": namespace["__init__"],
+            "_values": namespace["_values"],
+            "_schema": schema,
+            "_fields": fields,
+        },
+    )
+
+
+def frozen_class(cls: type) -> type:
+    """Creates an immutable subclass of a namespace class, whose attributes can't be set or deleted once
+    created. Used for results shared between callers, see `liaison.cache.ParseCache`
+    """
+    fields = cls._fields
+
+    def __init__(self, *values):
+        for name, value in zip(fields, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    return type(
+        f"Frozen{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__init__": __init__,
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+        },
+    )
+
+
+def lazy_class(cls: type, get_check: Callable[[str], Callable[[Any], Any]]) -> type:
+    """Creates a subclass of a namespace class validating each field on first access, see
+    `Schema.parse_lazy`. Instances are created with the input data, validated values are stored in the slots
+    of the namespace class so later accesses don't validate again.
+
+    :param cls: The namespace class
+    :param get_check: Returns the function validating a single value of the named field
+    :returns: The lazy namespace class
+    """
+    fields = cls._fields
+    known = frozenset(fields)
+    values = cls._values
+    checks = {}
+
+    def check(name: str) -> Callable[[Any], Any]:
+        func = checks.get(name)
+        if func is None:
+            func = checks[name] = get_check(name)
+        return func
+
+    def __init__(self, data):
+        self._lazy_data = data
+        # The names of the validated fields, created on first access
+        self._lazy_done = None
+
+    def __getattr__(self, name):
+        # Only called for fields which haven't been set yet
+        if name not in known:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = check(name)(self._lazy_data.get(name))
+        setattr(self, name, value)
+        if self._lazy_done is None:
+            self._lazy_done = set()
+        self._lazy_done.add(name)
+        return value
+
+    def _values(self):
+        self.validate_all()
+        return values(self)
+
+    def validate_all(self):
+        """Validates every field which hasn't been accessed yet, returning the namespace"""
+        data = self._lazy_data
+        if data is not None:
+            done = self._lazy_done or ()
+            get = data.get
+            for name in fields:
+                if name not in done:
+                    setattr(self, name, check(name)(get(name)))
+            self._lazy_data = self._lazy_done = None
+        return self
+
+    return type(
+        f"Lazy{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": ("_lazy_data", "_lazy_done"),
+            "__module__": cls.__module__,
+            "__init__": __init__,
+            "__getattr__": __getattr__,
+            "_values": _values,
+            "validate_all": validate_all,
+        },
+    )
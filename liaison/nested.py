@@ -0,0 +1,256 @@
+from typing import Any, Callable, List, Optional, Tuple
+import asyncio
+
+from .compiler import compile_self_check
+from .exceptions import FieldError, ValidationError
+
+# Paths are built lazily, as linked (parent, segment) nodes, and only rendered when an error is raised.
+# Segments are field names, or list indexes
+_Path = Optional[Tuple[Any, Any]]
+
+
+def render_path(path: _Path) -> str:
+    """Renders a path node as a key, e.g. `orders[3].address.city`"""
+    segments = []
+    while path is not None:
+        path, segment = path
+        segments.append(f"[{segment}]" if type(segment) is int else f".{segment}")
+    return "".join(reversed(segments)).lstrip(".")
+
+
+def relocate(error: ValidationError, key: str) -> ValidationError:
+    """Returns the error with its key replaced by `key`. The key of a FieldError is part of its message, so
+    a new FieldError is returned for them. Other errors have their `key` attribute set
+    """
+    if isinstance(error, FieldError):
+        relocated = FieldError(error.code, key, error.value, error.params)
+        relocated.__traceback__ = error.__traceback__
+        return relocated
+    try:
+        error.key = key
+    except AttributeError:  # pragma: no cover - a read only key on a custom error
+        pass
+    return error
+
+
+def validate_items(check: Callable[[Any], Any], key: str, items) -> list:
+    """Validates each item of a sequence, reporting errors with the item index, e.g. `tags[2]`. Items are
+    checked with the key of the sequence, errors of nested items (keyed e.g. `orders.address.city`) keep
+    their path below the item: `orders[3].address.city`
+    """
+    validated = []
+    append = validated.append
+    try:
+        for item in items:
+            append(check(item))
+    except ValidationError as e:
+        path = f"{key}[{len(validated)}]"
+        nested = e.key
+        if (
+            nested
+            and nested.startswith(key)
+            and nested[len(key) : len(key) + 1] in (".", "[")
+        ):
+            path += nested[len(key) :]
+        raise relocate(e, path) from None
+    return validated
+
+
+class Node:
+    """A nested field prepared for `validate_nested`.
+
+    :param check: Validates a value with the checks of the field itself (required, type, length...)
+    :param field: The field
+    :param item: The Node of the items of a sequence field, None for a SchemaField
+    """
+
+    __slots__ = ("check", "field", "item", "valid_type", "schema")
+
+    def __init__(self, check: Callable[[Any], Any], field, item: Optional["Node"]):
+        self.check = check
+        self.field = field
+        self.item = item
+        # The schema of a SchemaField, resolved on first use as it may be declared with a function
+        self.schema = None
+        # Values of exactly this type pass `check` unchanged, so the check is skipped for them
+        self.valid_type = None
+        if not (field._validator or field.choices or getattr(field, "min_len", None)):
+            if not getattr(field, "max_len", None):
+                self.valid_type = field.type
+
+
+def make_node(field, compiled: bool = True) -> Node:
+    """Prepares a nested field for `validate_nested`. Compiled nodes are built with the plan of a schema and
+    rebuilt with it, uncompiled nodes (used by `Field.validate`) call the fields `_validate_self` method
+    """
+    if compiled:
+        check = compile_self_check(field)
+    else:
+        check = lambda value: field._validate_self(None, value)  # noqa: E731
+    item = None if field.of is None else make_node(field.of, compiled)
+    return Node(check, field, item)
+
+
+def emit_nested(gen, field):
+    """Emits the validation of a nested field with `validate_nested`. In the prepare functions of async
+    parses, fields whose nested schemas have async validators are deferred to `validate_nested_async`.
+    Synchronous parses raise a SchemaException when they reach the async validators of a nested schema
+    """
+    node = gen.bind(make_node(field))
+    if gen.deferred and any(
+        schema._get_plan().is_async for schema in field._nested_schemas()
+    ):
+        gen.call(gen.bind(validate_nested_async), f"{node}, {gen.key}, v", True)
+    else:
+        gen.line(f"v = {gen.bind(validate_nested)}({node}, {gen.key}, v)")
+
+
+async def validate_nested_async(node: Node, key: str, value: Any) -> Any:
+    """Validates a value of a nested field whose nested schemas have async validators, see
+    `Schema.aparse`. Unlike `validate_nested`, this recurses once per level: nested schemas are parsed with
+    `aparse`, and the items of a sequence concurrently. Values of schemas without async validators are
+    validated with `validate_nested`
+
+    :param node: The nested field
+    :param key: The key of the field
+    :param value: The value to validate
+    :returns: The validated value
+    """
+    if node.item is None:
+        schema = node.field.schema
+        if not schema._get_plan().is_async:
+            return validate_nested(node, key, value)
+    try:
+        value = node.check(value)
+    except ValidationError as e:
+        raise relocate(e, key) from None
+    if value is None:
+        return None
+    if node.item is None:
+        if not isinstance(value, dict):
+            return value
+        try:
+            return await schema.aparse(value)
+        except ValidationError as e:
+            raise relocate(e, key if e.key is None else f"{key}.{e.key}") from None
+
+    outcomes = await asyncio.gather(
+        *(
+            validate_nested_async(node.item, f"{key}[{i}]", item)
+            for i, item in enumerate(value)
+        ),
+        return_exceptions=True,
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return outcomes
+
+
+def validate_nested(node: Node, key: str, value: Any) -> Any:
+    """Validates a value of a nested field: a SchemaField, or a sequence field whose items are nested.
+
+    Rather than recursing through the parse functions of the nested schemas, the document is walked with an
+    explicit stack, so the depth of a document is not limited by the recursion limit. Nested schemas are
+    parsed with their `values` function, which validates the flat fields and leaves nested fields for the
+    walk. Namespaces are built once the walk is complete, children before their parents.
+
+    :param node: The nested field
+    :param key: The key of the field
+    :param value: The value to validate
+    :returns: The validated value
+    """
+    root: List[Any] = [None]
+    # (node, value, target, index, parent path, segment): validate value and store the result at
+    # target[index]
+    stack = [(node, value, root, 0, None, key)]
+    pop = stack.pop
+    push = stack.append
+    builds = []
+
+    while stack:
+        node, value, target, index, parent, segment = pop()
+        if type(value) is not node.valid_type:
+            try:
+                value = node.check(value)
+            except ValidationError as e:
+                raise relocate(e, render_path((parent, segment))) from None
+        if value is None:
+            target[index] = None
+            continue
+
+        item = node.item
+        if item is None:
+            # A SchemaField
+            if not isinstance(value, dict):
+                target[index] = value
+                continue
+            schema = node.schema
+            if schema is None:
+                schema = node.schema = node.field.schema
+            plan = schema._plan or schema._compile()
+            try:
+                values = (plan.values or plan.get_values())(value)
+            except ValidationError as e:
+                path = (
+                    (parent, segment) if e.key is None else ((parent, segment), e.key)
+                )
+                raise relocate(e, render_path(path)) from None
+            if not plan.nested:
+                target[index] = plan.result(*values)
+                continue
+            builds.append((plan.result, values, target, index))
+            path = (parent, segment)
+            for position, name, child in reversed(plan.nested):
+                push((child, values[position], values, position, path, name))
+            continue
+
+        path = (parent, segment)
+        items = list(value)
+        target[index] = items
+        for position in range(len(items) - 1, -1, -1):
+            push((item, items[position], items, position, path, position))
+
+    for result, values, target, index in reversed(builds):
+        target[index] = result(*values)
+    return root[0]
+
+
+def dump_nested(node: Node, value: Any, skip_none: bool) -> Any:
+    """Serializes a value of a nested field, see `Schema.dump`. Like `validate_nested`, the results are
+    walked with an explicit stack rather than recursing through the dump functions of the nested schemas, so
+    the depth of a document is not limited by the recursion limit. Nested schemas serialize their results
+    with their walk function (see `SchemaPlan.get_dump_walk`), which leaves nested fields for the walk.
+
+    :param node: The nested field
+    :param value: The value of the field, not None
+    :param skip_none: Leave out fields whose value is None
+    :returns: The serialized value
+    """
+    root: List[Any] = [None]
+    # (node, value, target, index): serialize value and store the result at target[index]
+    stack = [(node, value, root, 0)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node, value, target, index = pop()
+        item = node.item
+        if item is None:
+            # A SchemaField
+            schema = node.schema
+            if schema is None:
+                schema = node.schema = node.field.schema
+            dump, nested = schema._get_dump_walk(value, skip_none)
+            out = target[index] = dump(value)
+            for name, child in nested:
+                child_value = out.get(name)
+                if child_value is not None:
+                    push((child, child_value, out, name))
+            continue
+
+        items = target[index] = list(value)
+        for position, child_value in enumerate(items):
+            if child_value is not None:
+                push((item, child_value, items, position))
+    return root[0]
@@ -0,0 +1,167 @@
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .exceptions import RowError
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # pragma: no cover - Python < 3.8
+    shared_memory = None
+
+# Result columns of fields of these types are returned through shared memory instead of being pickled,
+# mapped to their struct format and item size
+_SHARED_FORMATS = {int: ("q", 8), float: ("d", 8), bool: ("?", 1)}
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _shared_format(field, column: Sequence[Any]) -> Optional[Tuple[str, int]]:
+    """Returns the (format, item size) to share the column with, or None if it must be pickled. Columns
+    are only shared if every value is of exactly the fields type, which custom validators may not honour
+    """
+    shared = _SHARED_FORMATS.get(field.type)
+    if shared is None:
+        return None
+    type_ = field.type
+    for value in column:
+        if value is not None and type(value) is not type_:
+            return None
+    if type_ is int:
+        values = [value for value in column if value is not None]
+        if values and (min(values) < _INT64_MIN or max(values) > _INT64_MAX):
+            return None
+    return shared
+
+
+def _parse_chunk(schema, records: List[dict]):
+    """Runs in a worker process, parses a chunk of records and packs the numeric and boolean columns into
+    a shared memory segment. Returns (row count, segment name, layout, pickled columns, errors)
+    """
+    plan = schema._get_plan()
+    rows, errors = plan.get_parse_rows()(records)
+    empty = (None,) * len(plan.fields)
+    columns = list(zip(*[row or empty for row in rows])) or [()] * len(plan.fields)
+    n = len(rows)
+
+    layout = []
+    pickled = {}
+    for index, ((_, field), column) in enumerate(zip(plan.fields, columns)):
+        shared = _shared_format(field, column) if shared_memory and n else None
+        if shared is None:
+            pickled[index] = column
+        else:
+            layout.append((index, shared))
+
+    if not layout:
+        return n, None, [], pickled, errors
+
+    # 8 byte columns first, keeping every column aligned to its item size
+    layout.sort(key=lambda item: -item[1][1])
+    size = sum(
+        n * item_size + (n if None in columns[index] else 0)
+        for index, (_, item_size) in layout
+    )
+    segment = shared_memory.SharedMemory(create=True, size=size)
+    # The parent process unlinks the segment once read
+    resource_tracker.unregister(segment._name, "shared_memory")
+
+    placed = []
+    offset = 0
+    masks = []
+    for index, (fmt, item_size) in layout:
+        column = columns[index]
+        if fmt == "?":
+            data = bytes([value or 0 for value in column])
+        else:
+            data = memoryview(array(fmt, [value or 0 for value in column])).cast("B")
+        segment.buf[offset : offset + len(data)] = data
+        if None in column:
+            masks.append((len(placed), bytes([value is None for value in column])))
+        placed.append([index, fmt, item_size, offset, None])
+        offset += len(data)
+    for position, mask in masks:
+        segment.buf[offset : offset + n] = mask
+        placed[position][4] = offset
+        offset += n
+
+    name = segment.name
+    segment.close()
+    return n, name, placed, pickled, errors
+
+
+def _read_shared(name: str, layout: List[list], n: int, columns: List[Any]):
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        for index, fmt, item_size, offset, mask_offset in layout:
+            with segment.buf[offset : offset + n * item_size] as view:
+                with view.cast(fmt) as values:
+                    column = values.tolist()
+            if mask_offset is not None:
+                mask = bytes(segment.buf[mask_offset : mask_offset + n])
+                column = [None if null else value for value, null in zip(column, mask)]
+            columns[index] = column
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _release(future):
+    """Unlinks the shared memory segment of a chunk result which will not be read"""
+    if future.cancel() or future.exception() is not None:
+        return
+    name = future.result()[1]
+    if name is not None:
+        segment = shared_memory.SharedMemory(name=name)
+        segment.close()
+        segment.unlink()
+
+
+def _chunks(records: Iterable[dict], chunksize: int) -> Iterator[List[dict]]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_parallel(
+    schema,
+    records: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: int = 10_000,
+) -> Tuple[list, List[RowError]]:
+    """Parses records across a pool of worker processes. See `Schema.parse_parallel`"""
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    plan = schema._get_plan()
+    build_rows = plan.get_build_rows()
+    results = []
+    row_errors = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_parse_chunk, schema, chunk)
+            for chunk in _chunks(records, chunksize)
+        ]
+        consumed = 0
+        try:
+            for future in futures:
+                n, name, layout, pickled, errors = future.result()
+                consumed += 1
+                columns = [pickled.get(index) for index in range(len(plan.fields))]
+                if name is not None:
+                    _read_shared(name, layout, n, columns)
+                start = len(results)
+                results.extend(build_rows(columns, errors, n))
+                row_errors.extend(
+                    RowError(start + index, error)
+                    for index, error in sorted(errors.items())
+                )
+        finally:
+            for future in futures[consumed:]:
+                _release(future)
+
+    return results, row_errors
@@ -1,29 +1,607 @@
-from typing import Tuple, List
+from typing import (
+    Tuple,
+    List,
+    Iterable,
+    Optional,
+    Iterator,
+    Union,
+    IO,
+    Mapping,
+    Any,
+    Sequence,
+    Callable,
+)
 from inspect import getmembers
+import json
+import mmap
 
-from .namespace import Namespace
+from .namespace import Namespace, SchemaNamespace
 from .fields.base import Field
+from .compiler import SchemaPlan
+from .exceptions import RowError, ValidationError, SchemaException
+from .stream import iter_lines, DEFAULT_CHUNK_SIZE
+from .parallel import parse_parallel
+from .aio import resolve
+from .columnar import parse_columns, ColumnResult
+from .instrumentation import SchemaMetrics, DEFAULT_BUCKETS, register, unregister
+from .cache import ParseCache
+from .adaptive import SchemaProfile
+from .decoding import decode
+from .encoding import encode, write_many
 
 
-class Schema:
-    """Schema class. Inherit and define your own schemas"""
+class SchemaMeta(type):
+    """Metaclass of schemas. Setting or deleting a field of a schema after the class is created invalidates
+    the compiled plans of the schema, its subclasses and the schemas it's inlined into, or raises a
+    SchemaException if one of them is frozen
+    """
+
+    def __setattr__(cls, name: str, value: Any):
+        if not (
+            isinstance(value, Field) or isinstance(getattr(cls, name, None), Field)
+        ):
+            super().__setattr__(name, value)
+            return
+        schemas = cls._dependent_schemas()
+        super().__setattr__(name, value)
+        for schema in schemas:
+            schema._invalidate()
+
+    def __delattr__(cls, name: str):
+        if not isinstance(vars(cls).get(name), Field):
+            super().__delattr__(name)
+            return
+        schemas = cls._dependent_schemas()
+        super().__delattr__(name)
+        for schema in schemas:
+            schema._invalidate()
+
+    def _dependent_schemas(cls) -> list:
+        """Returns the schemas whose plans include the fields of the schema: the schema, its subclasses and
+        the schemas it's inlined into. Raises a SchemaException if any of them is frozen
+        """
+        schemas = [cls]
+        for schema in schemas:
+            schemas.extend(
+                subclass
+                for subclass in schema.__subclasses__()
+                if subclass not in schemas
+            )
+        for _, field in cls._get_fields():
+            schemas.extend(schema for schema in field._schemas if schema not in schemas)
+        for schema in schemas:
+            if schema.is_frozen():
+                raise SchemaException(
+                    f"fields of the frozen schema {schema.__name__} can't be changed"
+                )
+        return schemas
+
+
+class Schema(metaclass=SchemaMeta):
+    """Schema class. Inherit and define your own schemas. Fields can be added, replaced or deleted after the
+    class is created, like other class attributes
+    """
+
+    _plan = None
+    # Set while the plan is built, so schemas nested in each other aren't inlined into each other
+    _compiling = False
+    # The SchemaMetrics of the schema while instrumentation is enabled, read from the class itself so
+    # subclasses aren't instrumented with their parent
+    _metrics = None
+    # The ParseCache of the schema while caching is enabled, like `_metrics` it isn't inherited
+    _cache = None
+    # The SchemaProfile of the schema while adaptive mode is enabled, like `_metrics` it isn't inherited
+    _profile = None
+    # True once the schema is frozen, see `freeze`. Not inherited either
+    _frozen = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compile()
 
     @classmethod
     def _get_fields(cls) -> List[Tuple[str, Field]]:
         return getmembers(cls, predicate=lambda x: isinstance(x, Field))
 
     @classmethod
-    def parse(cls, data: dict) -> Namespace:
+    def _compile(cls) -> SchemaPlan:
+        """Builds the validation plan of the schema and registers the schema with its fields, so changing a
+        field (for example via `Field.validator` or `strict_types`) invalidates the plan
+        """
+        fields = cls._get_fields()
+        cls._compiling = True
+        try:
+            for _, field in fields:
+                # Including the item fields of sequence fields and the fields of inlined schemas, which are
+                # compiled into the plan
+                for compiled in field._compiled_fields():
+                    compiled._schemas.add(cls)
+            plan = cls._plan = SchemaPlan(cls, fields)
+        finally:
+            cls._compiling = False
+        return plan
+
+    @classmethod
+    def _invalidate(cls):
+        cls._plan = None
+
+    @classmethod
+    def _get_plan(cls) -> SchemaPlan:
+        return cls._plan or cls._compile()
+
+    @classmethod
+    def _check_mutable(cls):
+        if vars(cls).get("_frozen"):
+            raise SchemaException(f"{cls.__name__} is frozen and can't be changed")
+
+    @classmethod
+    def freeze(cls) -> type:
+        """Makes the schema immutable so it can be parsed from many threads at once, including on
+        free-threaded builds of Python. Changing a field of a frozen schema (directly, with
+        `Field.validator` or with `strict_types`) or enabling and disabling features raises a
+        SchemaException. Schemas nested in it with a SchemaField are frozen too, and an adaptive profile
+        stops sampling, see `freeze_profile`. The `choices` of the fields become a frozenset (or a tuple).
+
+        Parsing a frozen schema doesn't change the schema's own state, so schemas with a ParseCache or
+        instrumentation, which update shared state, can't be frozen. Memoized validators (`cache=`) and
+        DateTimeField's `cache_size` are kept: their `lru_cache` is thread-safe, but takes an internal lock on
+        each call, which threads parsing those fields contend for. Does nothing if the schema is already
+        frozen.
+
+        :returns: The schema
+        """
+        if vars(cls).get("_frozen"):
+            return cls
+        # The schema and the schemas nested in it, found first as resolving the schema of a SchemaField
+        # declared with a function sets the field
+        schemas = [cls]
+        for schema in schemas:
+            for _, field in schema._get_fields():
+                schemas.extend(s for s in field._nested_schemas() if s not in schemas)
+        schemas = [schema for schema in schemas if not vars(schema).get("_frozen")]
+        for schema in schemas:
+            if (
+                vars(schema).get("_cache") is not None
+                or vars(schema).get("_metrics") is not None
+            ):
+                raise SchemaException(
+                    f"{schema.__name__} can't be frozen with caching or instrumentation enabled, which update "
+                    f"shared state when parsing"
+                )
+        for schema in schemas:
+            # Choices given as a set or list are frozen too, choice tables are read-only already
+            for _, field in schema._get_fields():
+                for compiled in field._compiled_fields():
+                    if isinstance(compiled.choices, set):
+                        compiled.choices = frozenset(compiled.choices)
+                    elif isinstance(compiled.choices, list):
+                        compiled.choices = tuple(compiled.choices)
+        for schema in schemas:
+            profile = vars(schema).get("_profile")
+            if profile is not None and not profile.frozen:
+                schema.freeze_profile()
+            schema._get_plan().get_values()
+        for schema in schemas:
+            schema._frozen = True
+        return cls
+
+    @classmethod
+    def is_frozen(cls) -> bool:
+        """Returns True if the schema is frozen, see `freeze`"""
+        return vars(cls).get("_frozen", False)
+
+    @classmethod
+    def enable_instrumentation(
+        cls, buckets: Sequence[int] = DEFAULT_BUCKETS
+    ) -> SchemaMetrics:
+        """Records the call count, latency histogram and rejections (by error code) of each field of the
+        schema when parsing. The schema is recompiled with timed checks, disabling instrumentation restores
+        the uninstrumented parse functions. Does nothing if instrumentation is already enabled.
+
+        :param buckets: The upper bounds of the latency histogram buckets, in nanoseconds
+        :returns: The SchemaMetrics of the schema
+        """
+        cls._check_mutable()
+        metrics = vars(cls).get("_metrics")
+        if metrics is None:
+            metrics = cls._metrics = SchemaMetrics(cls.__name__, buckets)
+            register(cls)
+            cls._invalidate()
+        return metrics
+
+    @classmethod
+    def disable_instrumentation(cls):
+        """Stops recording metrics, the metrics recorded so far are discarded"""
+        cls._check_mutable()
+        if vars(cls).get("_metrics") is not None:
+            cls._metrics = None
+            unregister(cls)
+            cls._invalidate()
+
+    @classmethod
+    def get_metrics(cls) -> Optional[SchemaMetrics]:
+        """Returns the SchemaMetrics of the schema, or None if instrumentation isn't enabled"""
+        return vars(cls).get("_metrics")
+
+    @classmethod
+    def enable_cache(
+        cls,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        cache_errors: bool = False,
+    ) -> ParseCache:
+        """Caches the results of `parse`, keyed by the types and values of the fields of the schema in the
+        input, so parsing a repeated input returns the stored result. Cached results are immutable and
+        shared between callers. Schemas with non-deterministic validators (see
+        `liaison.cache.non_deterministic`) or callable defaults other than types aren't cached. Replaces
+        any existing cache.
+
+        :param maxsize: The maximum number of results to keep, the least recently used are evicted first
+        :param ttl: An optional number of seconds after which results expire
+        :param cache_errors: Cache ValidationErrors too, so repeated invalid inputs are rejected without
+            being validated again
+        :returns: The ParseCache, see `ParseCache.cache_info` for hit and miss statistics
+        """
+        cls._check_mutable()
+        cache = cls._cache = ParseCache(
+            maxsize=maxsize, ttl=ttl, cache_errors=cache_errors
+        )
+        cls._invalidate()
+        return cache
+
+    @classmethod
+    def disable_cache(cls):
+        """Stops caching parse results and discards the cached results"""
+        cls._check_mutable()
+        if vars(cls).get("_cache") is not None:
+            cls._cache = None
+            cls._invalidate()
+
+    @classmethod
+    def get_cache(cls) -> Optional[ParseCache]:
+        """Returns the ParseCache of the schema, or None if caching isn't enabled"""
+        return vars(cls).get("_cache")
+
+    @classmethod
+    def enable_adaptive(
+        cls, sample_rate: int = 100, min_samples: int = 1000
+    ) -> SchemaProfile:
+        """Profiles `parse` on live traffic and adapts it to the profile. One parse out of `sample_rate`
+        validates every field, recording its rejection rate, latency and value types. After each
+        `min_samples` samples, `parse` is recompiled to check the fields most likely to fail per unit of
+        cost first, and to skip the checks of values of the field's own type which pass a guard (e.g. an
+        int within `min_val` and `max_val`). The fields are still returned in order, but a payload with
+        several invalid fields may raise the error of another field than without adaptive mode. Does
+        nothing if adaptive mode is already enabled.
+
+        :param sample_rate: Sample one parse out of this many
+        :param min_samples: The number of samples between adaptations
+        :returns: The SchemaProfile of the schema
+        """
+        cls._check_mutable()
+        profile = vars(cls).get("_profile")
+        if profile is None:
+            profile = cls._profile = SchemaProfile(
+                cls.__name__, sample_rate, min_samples
+            )
+            cls._invalidate()
+        return profile
+
+    @classmethod
+    def freeze_profile(cls) -> SchemaProfile:
+        """Stops sampling and compiles `parse` with the plan adapted so far, which no longer changes"""
+        cls._check_mutable()
+        profile = vars(cls).get("_profile")
+        if profile is None:
+            raise SchemaException(f"adaptive mode isn't enabled for {cls.__name__}")
+        profile.frozen = True
+        cls._invalidate()
+        return profile
+
+    @classmethod
+    def disable_adaptive(cls):
+        """Restores the default parse function, discarding the profile"""
+        cls._check_mutable()
+        if vars(cls).get("_profile") is not None:
+            cls._profile = None
+            cls._invalidate()
+
+    @classmethod
+    def get_profile(cls) -> Optional[SchemaProfile]:
+        """Returns the SchemaProfile of the schema, or None if adaptive mode isn't enabled"""
+        return vars(cls).get("_profile")
+
+    @classmethod
+    def parse(
+        cls,
+        data: dict,
+        collect_errors: bool = False,
+        only: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+    ) -> SchemaNamespace:
         """Given a dictionary (data), parses and returns a Namespace containing attributes defined
         as Fields on the Schema.
 
         :param data: A dict or dict like object to parse
+        :param collect_errors: Validate every field and raise the errors of all failed fields together as a
+            ValidationErrors, rather than raising the first ValidationError
+        :param only: An optional sequence of field names to parse, other fields aren't validated or returned.
+            A string raises a TypeError rather than being read as a sequence of characters
+        :param exclude: An optional sequence of field names not to validate or return
+        :returns: A Namespace object
+        """
+        plan = cls._plan or cls._compile()
+        if only is not None or exclude:
+            plan = plan.get_projection(only, exclude)
+        if collect_errors:
+            return plan.get_parse_collect()(data)
+        return plan.parse(data)
+
+    @classmethod
+    def parse_json(
+        cls,
+        raw: Union[bytes, bytearray, memoryview, str],
+        max_bytes: Optional[int] = None,
+        decoder: Optional[Callable[[Any], Any]] = None,
+    ) -> SchemaNamespace:
+        """Decodes a JSON object and parses it. Uses orjson if it's installed, the standard library json
+        module otherwise. Only the declared fields are read from the decoded object.
+
+        :param raw: The JSON document as bytes, a memoryview or a string
+        :param max_bytes: An optional maximum size of the document in bytes, larger documents are rejected
+            with a ValidationError before being decoded. Defaults to the `max_size` of the schema's limits
+        :param decoder: An optional JSON decoder to use instead, such as `json.loads`
+        :returns: A Namespace object
+        """
+        plan = cls._plan or cls._compile()
+        if max_bytes is None and plan.limits is not None:
+            max_bytes = plan.limits.max_size
+        return plan.parse(decode(raw, max_bytes, decoder))
+
+    @classmethod
+    def parse_query(cls, data: Union[str, bytes, Mapping[str, Any]]) -> SchemaNamespace:
+        """Parses a query string or form, given as a raw query string, the output of
+        `urllib.parse.parse_qs` or a multi-dict (werkzeug, Django, Starlette or aiohttp). Strings are
+        converted for int, float and bool fields ("true"/"false", "1"/"0", "yes"/"no", "on"/"off"), empty
+        strings are missing values. Repeated keys are read into ListField and SetField fields, other fields
+        read the last value. Raw query strings larger than the `max_size` of the schema's limits are
+        rejected, and every key of the query counts towards its `max_keys` and `unknown_keys`.
+
+        :param data: The query string or form
+        :returns: A Namespace object
+        """
+        return (cls._plan or cls._compile()).get_parse_query()(data)
+
+    @classmethod
+    def parse_headers(
+        cls, headers: Union[Mapping, Iterable[Tuple[Any, Any]]]
+    ) -> SchemaNamespace:
+        """Parses HTTP headers, given as a mapping or headers object with `items()`, or as (name, value)
+        pairs of strings or bytes (such as the headers of an ASGI scope). Header names are matched case
+        insensitively, with underscores in field names matching dashes (`user_agent` reads `User-Agent`).
+        Values are converted like `parse_query`, ListField and SetField fields read every value of repeated
+        and comma separated headers. Every header counts towards the `max_keys` and `unknown_keys` of the
+        schema's limits.
+
+        :param headers: The headers
+        :returns: A Namespace object
+        """
+        return (cls._plan or cls._compile()).get_parse_headers()(headers)
+
+    @classmethod
+    def parse_lazy(cls, data: dict) -> SchemaNamespace:
+        """Parses a dictionary lazily: only the presence of required fields is checked, each field is
+        validated the first time it's accessed (raising its ValidationError then) and the value is kept.
+        `to_dict` validates the fields it returns, `validate_all()` validates every field.
+
+        The namespace reads from `data` until every field has been accessed, so `data` must not be modified
+        in the meantime.
+
+        :param data: A dict or dict like object to parse
+        :returns: A lazy Namespace object
+        """
+        plan = cls._plan or cls._compile()
+        if plan.is_async:
+            raise SchemaException(
+                f"{cls.__name__} has async validators, use {cls.__name__}.aparse"
+            )
+        return plan.get_parse_lazy()(data)
+
+    @classmethod
+    def _get_dump(cls, result: Any, skip_none: bool) -> Callable[[Any], dict]:
+        plan = cls._plan or cls._compile()
+        return plan.get_dump(cls._dump_names(plan, result), skip_none)
+
+    @classmethod
+    def _get_dump_walk(
+        cls, result: Any, skip_none: bool
+    ) -> Tuple[Callable[[Any], dict], tuple]:
+        plan = cls._plan or cls._compile()
+        return plan.get_dump_walk(cls._dump_names(plan, result), skip_none)
+
+    @staticmethod
+    def _dump_names(plan: SchemaPlan, result: Any) -> Optional[Tuple[str, ...]]:
+        """Returns the names of the fields of a result, None if it has every field of the schema"""
+        names = getattr(result, "_fields", None)
+        if names is None:
+            # A Namespace, returned when unpickling a result of a schema whose fields have changed
+            names = tuple(vars(result))
+        return None if names == plan.names else names
+
+    @classmethod
+    def dump(
+        cls, result: Union[SchemaNamespace, Namespace], skip_none: bool = False
+    ) -> dict:
+        """Serializes a result of the schema to a dict of JSON compatible values. DateTimeField values are
+        formatted with their `date_format`, sets and arrays are returned as lists, UUIDs as strings and
+        nested results as dicts. The serializer of the schema is compiled on first use.
+
+        :param result: A Namespace returned by parsing with the schema
+        :param skip_none: Leave out fields whose value is None
+        :returns: A dictionary of the field names and serialized values
+        """
+        return cls._get_dump(result, skip_none)(result)
+
+    @classmethod
+    def dump_json(
+        cls,
+        result: Union[SchemaNamespace, Namespace],
+        skip_none: bool = False,
+        encoder: Optional[Callable[[Any], Any]] = None,
+    ) -> bytes:
+        """Serializes a result of the schema like `dump` and encodes it as UTF-8 JSON. Uses orjson if it's
+        installed, the standard library json module otherwise.
+
+        Unlike `dump`, the depth of the document is limited: JSON encoders recurse once per level, orjson
+        encodes at most 254 levels and the json module about as many as the recursion limit allows. A deeper
+        result raises a ValueError.
+
+        :param result: A Namespace returned by parsing with the schema
+        :param skip_none: Leave out fields whose value is None
+        :param encoder: An optional JSON encoder to use instead, such as `json.dumps`
+        :returns: The JSON document
+        """
+        return encode(cls._get_dump(result, skip_none)(result), encoder)
+
+    @classmethod
+    def dump_many(
+        cls,
+        results: Iterable[Union[SchemaNamespace, Namespace]],
+        fileobj: IO,
+        ndjson: bool = False,
+        skip_none: bool = False,
+        encoder: Optional[Callable[[Any], Any]] = None,
+    ) -> int:
+        """Serializes results of the schema like `dump_json`, writing them one at a time to a text or binary
+        file object as a JSON array, or as JSON Lines (NDJSON). Results nested deeper than the encoder
+        supports raise a ValueError, see `dump_json`.
+
+        :param results: An iterable of Namespaces returned by parsing with the schema
+        :param fileobj: A text or binary file object
+        :param ndjson: Write one JSON object per line rather than a JSON array
+        :param skip_none: Leave out fields whose value is None
+        :param encoder: An optional JSON encoder to use instead, such as `json.dumps`
+        :returns: The number of results written
+        """
+        dumps = {}
+
+        def dump(result):
+            # Results are usually of the same namespace class, whose serializer is looked up once
+            func = dumps.get(type(result))
+            if func is None:
+                func = dumps[type(result)] = cls._get_dump(result, skip_none)
+            return func(result)
+
+        return write_many(dump, results, fileobj, ndjson, encoder)
+
+    @classmethod
+    def parse_many(
+        cls, records: Iterable[dict]
+    ) -> Tuple[List[Optional[SchemaNamespace]], List[RowError]]:
+        """Parses a batch of dictionaries. Unlike calling `parse` in a loop, the schema setup is done once
+        and a failing record does not abort the batch.
+
+        :param records: An iterable of dicts or dict like objects to parse
+        :returns: A tuple of the parsed Namespaces, aligned with `records` (None for rejected records), and
+            a list of RowErrors for the rejected records
+        """
+        if not isinstance(records, (list, tuple)):
+            records = list(records)
+        results, errors = (cls._plan or cls._compile()).get_parse_many()(records)
+        return results, [
+            RowError(index, error) for index, error in sorted(errors.items())
+        ]
+
+    @classmethod
+    def iter_parse(
+        cls, fileobj: Union[IO, mmap.mmap], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Union[SchemaNamespace, RowError]]:
+        """Parses a JSON Lines (NDJSON) file, yielding a Namespace for each valid line and a RowError for
+        each invalid one. The file is read in chunks so memory use does not grow with the file size. Blank
+        lines are skipped.
+
+        :param fileobj: A text or binary file object, or an mmap object
+        :param chunk_size: The number of bytes or characters to read at a time
+        :returns: An iterator of Namespaces and RowErrors, the RowError index is the line number
+        """
+        parse = (cls._plan or cls._compile()).parse
+        loads = json.loads
+
+        for lineno, line in iter_lines(fileobj, chunk_size):
+            if not line.strip():
+                continue
+            try:
+                data = loads(line)
+            except ValueError as e:
+                yield RowError(
+                    lineno, ValidationError(f"Invalid JSON on line {lineno}: {e}")
+                )
+                continue
+            if not isinstance(data, dict):
+                yield RowError(
+                    lineno, ValidationError(f"Expected a JSON object on line {lineno}")
+                )
+                continue
+            try:
+                yield parse(data)
+            except ValidationError as e:
+                yield RowError(lineno, e)
+
+    @classmethod
+    def parse_parallel(
+        cls,
+        records: Iterable[dict],
+        workers: Optional[int] = None,
+        chunksize: int = 10_000,
+    ) -> Tuple[List[Optional[SchemaNamespace]], List[RowError]]:
+        """Parses a batch of dictionaries across a pool of worker processes, for CPU bound schemas. Numeric
+        and boolean results are returned from the workers through shared memory rather than pickled.
+
+        The schema is sent to the workers by reference, so it must be importable (defined at module level).
+
+        :param records: An iterable of dicts to parse
+        :param workers: The number of worker processes, defaults to the number of CPUs
+        :param chunksize: The number of records sent to a worker at a time
+        :returns: A tuple of the parsed Namespaces, aligned with `records` (None for rejected records), and
+            a list of RowErrors for the rejected records
+        """
+        return parse_parallel(cls, records, workers=workers, chunksize=chunksize)
+
+    @classmethod
+    async def aparse(
+        cls,
+        data: dict,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> SchemaNamespace:
+        """Parses a dictionary like `parse`, supporting `async def` validators. Every other check runs
+        first, then the async validators of all fields run concurrently. Schemas without async validators
+        use the `parse` fast path.
+
+        :param data: A dict or dict like object to parse
+        :param concurrency: An optional maximum number of async validators to run at once
+        :param timeout: An optional timeout in seconds for each async validator
         :returns: A Namespace object
         """
-        ns_kwargs = {}
+        plan = cls._plan or cls._compile()
+        if not plan.is_async:
+            return plan.parse(data)
+        values, pending = plan.get_prepare()(data)
+        if pending:
+            await resolve(values, pending, concurrency=concurrency, timeout=timeout)
+        return plan.get_build()(values)
 
-        for key, field in cls._get_fields():
-            raw_value = data.get(key)
-            ns_kwargs[key] = field.validate(key, raw_value)
+    @classmethod
+    def parse_columns(cls, columns: Mapping[str, Any]) -> ColumnResult:
+        """Validates columnar data, given as a mapping of field names to numpy arrays or sequences of equal
+        length. Int, float and bool columns of fields without a custom validator are checked with vectorized
+        numpy operations (type casts, `min_val`/`max_val`, `required`, `choices` and defaults). Other
+        columns are validated one value at a time. Requires numpy.
+
+        Missing values are None in object arrays, NaN in float arrays or the masked entries of masked arrays.
 
-        return Namespace(**ns_kwargs)
+        :param columns: A mapping of field names to columns
+        :returns: A ColumnResult of the validated columns, a boolean mask of the failed rows and the indexes
+            of the failed rows
+        """
+        return parse_columns(cls, columns)
@@ -0,0 +1,60 @@
+from typing import Iterator, Tuple, Union, IO, List
+import mmap
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_lines(
+    fileobj: Union[IO, mmap.mmap], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[int, Union[str, bytes]]]:
+    """Yields (line number, line) pairs from a text or binary file object, or an mmap object. Files are
+    read in chunks of `chunk_size`, so memory use is bounded by the chunk size and the longest line.
+
+    :param fileobj: A text or binary file object, or an mmap object
+    :param chunk_size: The number of bytes or characters to read at a time
+    :returns: An iterator of (line number, line) pairs, line numbers start at 1
+    """
+    if isinstance(fileobj, mmap.mmap):
+        yield from _iter_mmap_lines(fileobj)
+        return
+
+    read = fileobj.read
+    lineno = 0
+    # Parts of the current, unterminated line. Kept as a list so lines spanning many chunks are joined once
+    tail: List[Union[str, bytes]] = []
+
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n" if isinstance(chunk, bytes) else "\n")
+        if len(lines) == 1:
+            tail.append(chunk)
+            continue
+        if tail:
+            tail.append(lines[0])
+            lines[0] = chunk[:0].join(tail)
+            tail.clear()
+        tail.append(lines.pop())
+        for line in lines:
+            lineno += 1
+            yield lineno, line
+
+    if tail:
+        line = tail[0][:0].join(tail)
+        if line:
+            yield lineno + 1, line
+
+
+def _iter_mmap_lines(mm: mmap.mmap) -> Iterator[Tuple[int, bytes]]:
+    find = mm.find
+    size = len(mm)
+    pos = 0
+    lineno = 0
+    while pos < size:
+        end = find(b"\n", pos)
+        if end == -1:
+            end = size
+        lineno += 1
+        yield lineno, mm[pos:end]
+        pos = end + 1
@@ -0,0 +1,183 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs
+
+from .decoding import check_size
+
+# The maximum number of distinct header names remembered by a header parse function, see
+# `make_parse_headers`. Header names repeat between requests, so they are normalized once
+MAX_HEADER_NAMES = 1024
+
+_MISSING = object()
+
+
+def make_converter(field) -> Optional[Callable[[Any], Any]]:
+    """Returns a function converting the string value of a field, or the list of values of a multi valued
+    field, with the string converter of the field (see `Field._string_converter`). Values which can't be
+    converted are returned unchanged to be rejected by the field. Empty strings are missing values (or
+    items), except for fields validating strings as they are. None if values are passed to the field
+    unchanged
+    """
+    convert = field._string_converter()
+    if field._multi_valued:
+        if convert is None:
+            return list
+
+        def convert_item(value: Any) -> Any:
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                return value
+
+        def convert_items(values: Sequence) -> Any:
+            if "" in values:
+                values = [value for value in values if value != ""]
+                if not values:
+                    return None
+            try:
+                return list(map(convert, values))
+            except (TypeError, ValueError):
+                # The items which can't be converted are rejected by the field
+                return list(map(convert_item, values))
+
+        return convert_items
+
+    if convert is None:
+        return None
+
+    def convert_value(value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        if not value:
+            return None
+        try:
+            return convert(value)
+        except ValueError:
+            return value
+
+    return convert_value
+
+
+def make_parse_query(
+    fields: Sequence[Tuple[str, Any]],
+    parse: Callable[[dict], Any],
+    max_size: Optional[int] = None,
+    check_limits: Optional[Callable[[Any], None]] = None,
+) -> Callable:
+    """Returns a function parsing a query string or form with `parse`, see `Schema.parse_query`
+
+    :param fields: The (name, field) table of the schema
+    :param parse: The parse function of the schema
+    :param max_size: An optional maximum size in bytes of raw query strings
+    :param check_limits: An optional function checking the keys of the query, see
+        `liaison.compiler.compile_limits`. Only the keys of fields are passed to `parse`, so the keys are
+        checked before
+    """
+    readers = [
+        (name, make_converter(field), field._multi_valued) for name, field in fields
+    ]
+
+    def parse_query(data: Union[str, bytes, Any]) -> Any:
+        if max_size is not None and isinstance(data, (str, bytes)):
+            check_size(data, max_size)
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "replace")
+        if isinstance(data, str):
+            data = parse_qs(data, keep_blank_values=True)
+        if check_limits is not None:
+            check_limits(data)
+
+        values = {}
+        # Multi-dicts: werkzeug, Django and Starlette have getlist, multidict (aiohttp) has getall
+        getlist = getattr(data, "getlist", None)
+        if getlist is None and hasattr(data, "getall"):
+            getall = data.getall
+
+            def getlist(key):
+                return getall(key, ())
+
+        if getlist is not None:
+            for name, convert, multi in readers:
+                items = getlist(name)
+                if items:
+                    value = items if multi else items[-1]
+                    values[name] = convert(value) if convert is not None else value
+            return parse(values)
+
+        # Mappings of keys to a value or a list of values, such as the output of parse_qs
+        get = data.get
+        for name, convert, multi in readers:
+            value = get(name)
+            if value is None:
+                continue
+            if type(value) is list or type(value) is tuple:
+                if not multi:
+                    if not value:
+                        continue
+                    value = value[-1]
+            elif multi:
+                value = [value]
+            values[name] = convert(value) if convert is not None else value
+        return parse(values)
+
+    return parse_query
+
+
+def normalize_header(name: Union[str, bytes]) -> str:
+    """Returns the lower case form of a header or field name, with underscores replaced by dashes"""
+    if isinstance(name, bytes):
+        name = name.decode("latin-1")
+    return name.lower().replace("_", "-")
+
+
+def make_parse_headers(
+    fields: Sequence[Tuple[str, Any]],
+    parse: Callable[[dict], Any],
+    check_limits: Optional[Callable[[Any], None]] = None,
+) -> Callable:
+    """Returns a function parsing HTTP headers with `parse`, see `Schema.parse_headers`
+
+    :param fields: The (name, field) table of the schema
+    :param parse: The parse function of the schema
+    :param check_limits: An optional function checking the header names, normalized with
+        `normalize_header`, before the headers of fields are read. See `liaison.compiler.compile_limits`
+    """
+    readers = {
+        normalize_header(name): (name, make_converter(field), field._multi_valued)
+        for name, field in fields
+    }
+    # Header names as received, mapped to their reader or None
+    names: Dict[Union[str, bytes], Optional[tuple]] = {}
+
+    def parse_headers(
+        headers: Union[Any, Iterable[Tuple[Union[str, bytes], Union[str, bytes]]]],
+    ) -> Any:
+        pairs = headers.items() if hasattr(headers, "items") else headers
+        if check_limits is not None:
+            pairs = list(pairs)
+            check_limits({normalize_header(key): value for key, value in pairs})
+        collected = {}
+        for key, value in pairs:
+            reader = names.get(key, _MISSING)
+            if reader is _MISSING:
+                reader = readers.get(normalize_header(key))
+                if len(names) < MAX_HEADER_NAMES:
+                    names[key] = reader
+            if reader is None:
+                continue
+            if type(value) is bytes:
+                value = value.decode("latin-1")
+            if reader[2]:
+                # Repeated headers are equivalent to a comma separated list
+                items = collected.get(reader)
+                if items is None:
+                    items = collected[reader] = []
+                items.extend(item.strip() for item in value.split(","))
+            else:
+                collected[reader] = value
+
+        values = {}
+        for (name, convert, _), value in collected.items():
+            values[name] = convert(value) if convert is not None else value
+        return parse(values)
+
+    return parse_headers
@@ -10,7 +10,7 @@ setuptools.setup(
     version="0.1",
     description="Liaison is a Python library for defining schemas, parsing and validating payloads",
     long_description=long_description,
-    long_description_content_type='text/markdown',
+    long_description_content_type="text/markdown",
     keywords="python schema parser",
     url="https://github.com/Julian-Nash/liaison",
     project_urls={
@@ -19,16 +19,18 @@ setuptools.setup(
         "Source Code": "https://github.com/Julian-Nash/liaison",
     },
     classifiers=[
-        'Intended Audience :: Developers',
-        'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: 3.10',
+        "Intended Audience :: Developers",
+        "License :: OSI Approved :: MIT License",
+        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
     ],
     extras_require={
         "dev": ["pytest", "black", "coverage"],
         "test": ["pytest", "coverage"],
-    }
-)
\ No newline at end of file
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
+    },
+)
@@ -0,0 +1,108 @@
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, StringField, DateTimeField
+from liaison.exceptions import ValidationError, SchemaException
+
+
+def make_schema():
+    class TestSchema(Schema):
+        created = DateTimeField(date_format="%d/%m/%Y %H:%M")
+        email = StringField(regex=r"^[a-z]+@[a-z]+\.com$")
+        age = IntField(min_val=1, max_val=150)
+        token = StringField(required=True)
+
+    return TestSchema
+
+
+VALID = {
+    "created": "09/10/2021 08:30",
+    "email": "foo@bar.com",
+    "age": 30,
+    "token": "abc",
+}
+
+
+def run(schema, count=200):
+    for i in range(count):
+        try:
+            schema.parse(dict(VALID, token=None) if i % 2 else VALID)
+        except ValidationError:
+            pass
+
+
+def test_adaptive_reorders_checks():
+    schema = make_schema()
+    profile = schema.enable_adaptive(sample_rate=2, min_samples=20)
+    run(schema)
+    assert profile.samples == 100
+    assert profile.order[0] == "token"
+    assert profile.specialized == {"age": int}
+    assert profile.fields["token"].rejection_rate == pytest.approx(1.0)
+    assert profile.fields["age"].types == {int: 100}
+
+    data = profile.to_dict()
+    assert data["order"][0] == "token"
+    assert data["specialized"] == {"age": "int"}
+    assert data["fields"]["age"]["types"] == {"int": 100}
+
+    # The fields are still returned in order, the first failed check of the adapted order is raised.
+    # Frozen, so the parses below aren't sampled
+    schema.freeze_profile()
+    assert schema.parse(VALID).to_dict() == make_schema().parse(VALID).to_dict()
+    with pytest.raises(ValidationError) as e:
+        schema.parse({"email": "invalid"})
+    assert e.value.key == "token"
+
+
+def test_adaptive_specialized_fields_are_validated():
+    schema = make_schema()
+    schema.enable_adaptive(sample_rate=1, min_samples=10)
+    run(schema, 20)
+    for age in (0, 151, "30", 30.0, True):
+        expected = _outcome(make_schema(), dict(VALID, age=age))
+        assert _outcome(schema, dict(VALID, age=age)) == expected
+
+
+def _outcome(schema, data):
+    try:
+        return schema.parse(data).to_dict()
+    except ValidationError as e:
+        return str(e)
+    except TypeError as e:
+        # Strings compared with min_val
+        return type(e)
+
+
+def test_freeze_profile():
+    schema = make_schema()
+    with pytest.raises(SchemaException):
+        schema.freeze_profile()
+
+    profile = schema.enable_adaptive(sample_rate=2, min_samples=20)
+    run(schema)
+    assert schema.freeze_profile() is profile
+    order = profile.order
+    run(schema)
+    assert profile.samples == 100
+    assert profile.order == order
+
+    # Recompiled with the frozen plan when a field changes
+    schema.age.max_val = 40
+    with pytest.raises(ValidationError) as e:
+        schema.parse(dict(VALID, age=50, token=None))
+    assert e.value.key == "token"
+
+
+def test_disable_adaptive():
+    schema = make_schema()
+    schema.enable_adaptive(sample_rate=1, min_samples=10)
+    run(schema, 20)
+    schema.disable_adaptive()
+    assert schema.get_profile() is None
+
+    class ChildSchema(schema):
+        pass
+
+    schema.enable_adaptive()
+    assert ChildSchema.get_profile() is None
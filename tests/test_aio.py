@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import StringField, IntField, ListField, SchemaField
+from liaison.fields.base import Field
+from liaison.exceptions import ValidationError, SchemaException
+
+
+class FakeStore:
+    """In-process async datastore, tracking how many lookups run at once"""
+
+    def __init__(self, names, delay=0.01):
+        self.names = set(names)
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def exists(self, name):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return name in self.names
+        finally:
+            self.running -= 1
+
+
+def make_schema(store):
+    async def unique(field, key, value):
+        if await store.exists(value):
+            raise ValidationError(f"'{value}' is already taken for '{key}'")
+        return value
+
+    class UserSchema(Schema):
+        username = StringField(required=True, min_len=3, validator=unique)
+        email = StringField(validator=unique)
+        age = IntField(min_val=18)
+
+    return UserSchema
+
+
+def test_aparse():
+    store = FakeStore(["taken"])
+    UserSchema = make_schema(store)
+
+    ns = asyncio.run(
+        UserSchema.aparse({"username": "foo", "email": "foo@bar.com", "age": 30})
+    )
+
+    assert ns.to_dict() == {"age": 30, "email": "foo@bar.com", "username": "foo"}
+    assert store.max_running == 2
+
+
+def test_aparse_raises_first_error_in_field_order():
+    UserSchema = make_schema(FakeStore(["taken", "taken@bar.com"]))
+
+    with pytest.raises(ValidationError) as e:
+        asyncio.run(UserSchema.aparse({"username": "taken", "email": "taken@bar.com"}))
+    assert str(e.value) == "'taken@bar.com' is already taken for 'email'"
+
+
+def test_aparse_runs_sync_checks_before_async_validators():
+    store = FakeStore([])
+    UserSchema = make_schema(store)
+
+    with pytest.raises(ValidationError) as e:
+        asyncio.run(UserSchema.aparse({"username": "fo", "age": 30}))
+    assert str(e.value) == "Value for 'username' did not meet required length of 3"
+    assert store.max_running == 0
+
+
+def test_aparse_with_concurrency_limit():
+    store = FakeStore([])
+    UserSchema = make_schema(store)
+
+    asyncio.run(
+        UserSchema.aparse({"username": "foo", "email": "foo@bar.com"}, concurrency=1)
+    )
+    assert store.max_running == 1
+
+
+def test_aparse_with_timeout():
+    UserSchema = make_schema(FakeStore([], delay=1))
+
+    with pytest.raises(ValidationError) as e:
+        asyncio.run(UserSchema.aparse({"username": "foo"}, timeout=0.01))
+    assert str(e.value).startswith("Validation of 'email' timed out")
+
+
+def test_aparse_without_async_validators():
+    class TestSchema(Schema):
+        name = StringField()
+
+    assert asyncio.run(TestSchema.aparse({"name": "foo"})).name == "foo"
+
+
+def test_aparse_with_async_validator_decorator():
+    class TestSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        async def validate_name(field, key, value):
+            await asyncio.sleep(0)
+            return value.upper()
+
+    assert asyncio.run(TestSchema.aparse({"name": "foo"})).name == "FOO"
+
+
+def test_aparse_with_custom_field():
+    class ShoutingField(Field):
+        def validate(self, key, value):
+            return super().validate(key, value)
+
+    async def shout(field, key, value):
+        return value.upper()
+
+    class TestSchema(Schema):
+        name = ShoutingField(type=str, input_types=(str,), validator=shout)
+
+    assert asyncio.run(TestSchema.aparse({"name": "foo"})).name == "FOO"
+
+
+def test_parse_rejects_async_validators():
+    UserSchema = make_schema(FakeStore([]))
+
+    with pytest.raises(SchemaException):
+        UserSchema.parse({"username": "foo"})
+
+
+def test_aparse_nested_async_validators():
+    store = FakeStore(["taken"])
+    UserSchema = make_schema(store)
+
+    class TeamSchema(Schema):
+        name = StringField(required=True)
+        owner = SchemaField(UserSchema)
+        members = ListField(of=SchemaField(UserSchema))
+        parent = SchemaField(lambda: TeamSchema)
+
+    data = {
+        "name": "core",
+        "owner": {"username": "foo"},
+        "members": [{"username": "bar"}, {"username": "baz", "age": 20}],
+        "parent": {"name": "all", "owner": {"username": "qux"}},
+    }
+    ns = asyncio.run(TeamSchema.aparse(data))
+    assert ns.owner.username == "foo" and [
+        member.username for member in ns.members
+    ] == ["bar", "baz"]
+    assert ns.parent.owner.username == "qux" and ns.parent.members is None
+    assert store.max_running > 2
+
+    for data, key in [
+        # Errors of custom validators have no key, they're located at the nested field
+        (
+            {"name": "core", "members": [{"username": "bar"}, {"username": "taken"}]},
+            "members[1]",
+        ),
+        (
+            {"name": "core", "parent": {"name": "all", "owner": {"username": "taken"}}},
+            "parent.owner",
+        ),
+        (
+            {"name": "core", "parent": {"name": "all", "owner": {"username": "x"}}},
+            "parent.owner.username",
+        ),
+        ({"name": "core", "owner": {"username": "foo", "age": 3}}, "owner.age"),
+        ({"name": "core", "owner": 5}, "owner"),
+    ]:
+        with pytest.raises(ValidationError) as e:
+            asyncio.run(TeamSchema.aparse(data))
+        assert e.value.key == key
+    with pytest.raises(SchemaException, match="use Schema.aparse"):
+        TeamSchema.parse({"name": "core", "owner": {"username": "foo"}})
+    with pytest.raises(SchemaException, match="use TeamSchema.aparse"):
+        TeamSchema.parse_lazy({"name": "core"})
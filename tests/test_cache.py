@@ -0,0 +1,168 @@
+import pytest
+
+from liaison import Schema, ValidationError
+from liaison.cache import non_deterministic
+from liaison.fields import IntField, StringField, ListField, SetField, BoolField
+
+
+def _schema(**fields):
+    fields = fields or {"name": StringField(required=True), "age": IntField(min_val=18)}
+    return type("TestSchema", (Schema,), fields)
+
+
+def test_cache_hit():
+    schema = _schema()
+    cache = schema.enable_cache()
+    first = schema.parse({"name": "foo", "age": 21})
+    second = schema.parse({"age": 21, "name": "foo", "other": 1})
+    assert second is first
+    assert (cache.cache_info().hits, cache.cache_info().misses) == (1, 1)
+    assert schema.parse({"name": "foo", "age": 22}) is not first
+
+
+def test_cache_results_are_immutable():
+    schema = _schema()
+    schema.enable_cache()
+    result = schema.parse({"name": "foo"})
+    with pytest.raises(AttributeError):
+        result.name = "bar"
+    with pytest.raises(AttributeError):
+        del result.name
+    assert result.to_dict() == {"age": None, "name": "foo"}
+
+
+def test_cache_results_do_not_share_containers():
+    schema = _schema(tags=ListField(of=IntField()), meta=ListField())
+    schema.enable_cache()
+    payload = {"tags": [1, 2], "meta": [{"a": [1]}]}
+    first = schema.parse(payload)
+    first.tags.append(99)
+    payload["tags"].append(98)
+    first.meta[0]["a"].append(2)
+    second = schema.parse({"tags": [1, 2], "meta": [{"a": [1]}]})
+    assert second.to_dict() == {"tags": [1, 2], "meta": [{"a": [1]}]}
+    second.tags.append(97)
+    assert schema.parse({"tags": [1, 2], "meta": [{"a": [1]}]}).tags == [1, 2]
+
+
+def test_cache_key_includes_types():
+    schema = _schema(value=BoolField())
+    schema.enable_cache()
+    assert schema.parse({"value": True}).value is True
+    with pytest.raises(ValidationError):
+        schema.parse({"value": 1})
+
+
+def test_cache_unhashable_values():
+    schema = _schema(tags=ListField(), ids=SetField())
+    cache = schema.enable_cache()
+    first = schema.parse({"tags": ["a", {"b": [1]}]})
+    # Results holding containers are copied on each hit
+    assert schema.parse({"tags": ["a", {"b": [1]}]}) == first
+    assert cache.cache_info().hits == 1
+    assert schema.parse({"tags": ["a", {"b": [True]}]}).tags[1]["b"][0] is True
+    # Sets can't be frozen, they're parsed without the cache
+    assert schema.parse({"ids": {1}}).ids == {1}
+    assert cache.cache_info() == (1, 2, 1024, 2)
+
+
+def test_cache_lru_eviction():
+    schema = _schema()
+    cache = schema.enable_cache(maxsize=2)
+    first = schema.parse({"name": "a"})
+    schema.parse({"name": "b"})
+    assert schema.parse({"name": "a"}) is first
+    schema.parse({"name": "c"})  # Evicts "b", the least recently used
+    assert schema.parse({"name": "a"}) is first
+    assert cache.cache_info().currsize == 2
+    schema.parse({"name": "b"})
+    assert cache.cache_info().misses == 4
+
+
+def test_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("liaison.cache.time.monotonic", lambda: now[0])
+    schema = _schema()
+    schema.enable_cache(ttl=10)
+    first = schema.parse({"name": "a"})
+    now[0] += 5
+    assert schema.parse({"name": "a"}) is first
+    now[0] += 10
+    assert schema.parse({"name": "a"}) is not first
+
+
+def test_cache_errors():
+    schema = _schema()
+    cache = schema.enable_cache(cache_errors=True)
+    for _ in range(2):
+        with pytest.raises(ValidationError) as e:
+            schema.parse({"age": 21})
+        assert e.value.code == "required"
+    assert cache.cache_info().hits == 1
+
+    schema = _schema()
+    cache = schema.enable_cache()
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            schema.parse({"age": 21})
+    assert cache.cache_info().hits == 0
+
+
+def test_cache_errors_are_not_shared():
+    schema = _schema()
+    schema.enable_cache(cache_errors=True)
+    errors = []
+    for _ in range(3):
+        with pytest.raises(ValidationError) as e:
+            schema.parse({"name": "foo", "age": 1})
+        errors.append(e.value)
+        # Callers may change the errors they catch
+        assert not hasattr(e.value, "extra")
+        e.value.extra = True
+    assert len({id(error) for error in errors}) == 3
+    assert [(error.code, error.key) for error in errors] == [("min_val", "age")] * 3
+
+
+def test_cache_bypassed_by_non_deterministic_validator():
+    class TestSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        @non_deterministic
+        def validate_name(self, key, value):
+            return value
+
+    cache = TestSchema.enable_cache()
+    assert TestSchema.parse({"name": "a"}) is not TestSchema.parse({"name": "a"})
+    assert cache.cache_info().misses == 0
+
+
+def test_cache_bypassed_by_callable_default():
+    schema = _schema(
+        name=StringField(default=lambda: "default"), tags=ListField(default=list)
+    )
+    schema.enable_cache()
+    assert schema.parse({}) is not schema.parse({})
+
+    schema = _schema(tags=ListField(default=list))
+    cache = schema.enable_cache()
+    first, second = schema.parse({}), schema.parse({})
+    assert first == second and first.tags is not second.tags
+    assert cache.cache_info().hits == 1
+
+
+def test_cache_cleared_when_field_changes():
+    schema = _schema(name=StringField(), age=IntField())
+    schema.enable_cache()
+    schema.parse({"name": "foo", "age": 16})
+    schema.age.min_val = 18
+    with pytest.raises(ValidationError):
+        schema.parse({"name": "foo", "age": 16})
+
+
+def test_disable_cache():
+    schema = _schema()
+    schema.enable_cache()
+    schema.disable_cache()
+    assert schema.get_cache() is None
+    assert schema.parse({"name": "a"}) is not schema.parse({"name": "a"})
@@ -0,0 +1,144 @@
+import pickle
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, StringField
+from liaison.exceptions import ValidationError, SchemaException
+from liaison.choices import SortedTable, MappedTable, BloomFilter, BLOCK_SIZE
+
+SKUS = [f"SKU-{i * 7:06d}" for i in range(1000)]
+MISSES = [f"SKU-{i * 7 + 3:06d}" for i in range(1000)] + [
+    "",
+    "A",
+    "ZZZ",
+    "SKU-",
+    "SKU-0000000",
+    "é",
+]
+
+
+@pytest.fixture(params=["sorted", "sorted_prefilter", "mapped", "mapped_prefilter"])
+def table(request, tmp_path):
+    sorted_table = SortedTable(
+        reversed(SKUS), prefilter=request.param.endswith("prefilter")
+    )
+    if request.param.startswith("sorted"):
+        return sorted_table
+    path = tmp_path / "skus.txt"
+    sorted_table.save(path)
+    return MappedTable(path, prefilter=request.param.endswith("prefilter"))
+
+
+def test_table_lookup(table):
+    assert all(sku in table for sku in SKUS)
+    assert not any(sku in table for sku in MISSES)
+    assert 7 not in table and None not in table
+
+
+def test_table_len_and_iter(table):
+    assert len(table) == len(SKUS)
+    assert list(table) == sorted(SKUS)
+
+
+def test_table_pickle(table):
+    table = pickle.loads(pickle.dumps(table))
+    assert SKUS[500] in table and MISSES[500] not in table
+
+
+def test_int_table(tmp_path):
+    values = [-5, 0, 3, 12, 100, 2**40]
+    table = SortedTable(values, kind=int)
+    table.save(tmp_path / "ints.txt")
+    for table in (table, MappedTable(tmp_path / "ints.txt", kind=int)):
+        assert all(value in table for value in values)
+        assert True not in table and 1 not in table and 3.0 not in table
+        # Strings are converted like IntField converts them
+        assert "3" in table and "003" in table and " 12 " in table and "-05" in table
+        assert "1" not in table and "3.0" not in table and "a" not in table
+        assert list(table) == sorted(values, key=lambda value: str(value).encode())
+    assert list(SortedTable(["007", 7, "12"], kind=int)) == [12, 7]
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "codes.txt"
+    path.write_text("b\n\na\r\nc\n")
+    table = SortedTable.from_file(path)
+    assert list(table) == ["a", "b", "c"]
+
+
+def test_mapped_table_crlf(tmp_path):
+    path = tmp_path / "codes.txt"
+    path.write_bytes(b"a\r\nb\r\nc\r\n")
+    table = MappedTable(path)
+    assert (
+        all(value in table for value in "abc")
+        and "b\r" not in table
+        and "d" not in table
+    )
+    assert list(table) == ["a", "b", "c"] and len(table) == 3
+
+
+@pytest.mark.parametrize(
+    "content, kind",
+    [
+        (b"9\n10\n", int),
+        (b"007\n7\n", int),
+        (b"1\na\n", int),
+        (b"a\nc\nb\n", str),
+        (b"a\na\n", str),
+        (b"a\n\nb\n", str),
+    ],
+)
+def test_mapped_table_rejects_unsorted_file(tmp_path, content, kind):
+    path = tmp_path / "codes.txt"
+    path.write_bytes(content)
+    with pytest.raises(SchemaException):
+        MappedTable(path, kind=kind)
+    MappedTable(path, kind=kind, check=False)
+
+
+def test_empty_tables(tmp_path):
+    SortedTable([]).save(tmp_path / "empty.txt")
+    for table in (SortedTable([]), MappedTable(tmp_path / "empty.txt")):
+        assert not table and len(table) == 0 and "a" not in table
+    assert StringField(choices=SortedTable([])).choices is None
+
+
+def test_table_spanning_many_blocks():
+    values = [f"{i:08d}" for i in range(BLOCK_SIZE * 5 + 3)]
+    table = SortedTable(values)
+    assert all(value in table for value in values)
+    assert "99999999" not in table
+
+
+@pytest.mark.parametrize("value", [b"bytes", "new\nline", 1.5])
+def test_invalid_values(value):
+    with pytest.raises(SchemaException):
+        SortedTable(["a", value])
+
+
+def test_invalid_kind():
+    with pytest.raises(SchemaException):
+        SortedTable([1.5], kind=float)
+
+
+def test_bloom_filter():
+    keys = [sku.encode() for sku in SKUS]
+    bloom = BloomFilter(keys, len(keys))
+    assert all(key in bloom for key in keys)
+    false_positives = sum(sku.encode() in bloom for sku in MISSES)
+    assert false_positives < len(MISSES) * 0.1
+
+
+def test_field_choices_table(table):
+    class OrderSchema(Schema):
+        sku = StringField(choices=table)
+        quantity = IntField(choices=SortedTable(range(1, 11), kind=int))
+
+    assert OrderSchema.parse({"sku": SKUS[3], "quantity": 2}).sku == SKUS[3]
+    assert OrderSchema.sku.validate("sku", SKUS[4]) == SKUS[4]
+    for data in ({"sku": MISSES[3]}, {"sku": SKUS[3], "quantity": 11}):
+        with pytest.raises(ValidationError) as e:
+            OrderSchema.parse(data)
+        assert e.value.code == "choice"
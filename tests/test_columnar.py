@@ -0,0 +1,138 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from liaison.schema import Schema
+from liaison.fields import IntField, FloatField, BoolField, StringField
+from liaison.exceptions import ValidationError
+
+
+def _scalar(field, value):
+    try:
+        return True, field.validate("foo", value)
+    except ValidationError:
+        return False, None
+
+
+FIELDS = [
+    IntField(),
+    IntField(min_val=5, max_val=10),
+    IntField(required=True),
+    IntField(default=7),
+    IntField(choices=[1, 2, 3]),
+    FloatField(min_val=1.5),
+    FloatField(default=0.5),
+    BoolField(),
+    BoolField(default=True),
+]
+
+COLUMNS = [
+    np.array([1, 5, 7, 10, 11, -3], dtype=np.int64),
+    np.array([0.5, 1.5, 5.7, -5.7, 12.0, 3.0]),
+    np.array([1.0, np.nan, 6.0, np.nan, 2.0, 3.0]),
+    np.array([True, False, True, True, False, False]),
+    np.ma.masked_array([1, 2, 3, 7, 8, 9], mask=[0, 1, 0, 0, 1, 0]),
+    np.array([1e20, -1e19, 3.0, np.inf, 2.0**63, np.nan]),
+]
+
+
+def _to_scalars(column):
+    values = column.tolist()
+    return [None if isinstance(v, float) and math.isnan(v) else v for v in values]
+
+
+@pytest.mark.parametrize("field", FIELDS, ids=lambda f: type(f).__name__)
+@pytest.mark.parametrize("column", COLUMNS, ids=lambda c: str(c.dtype))
+def test_parse_columns_matches_scalar_validation(field, column):
+    class TestSchema(Schema):
+        pass
+
+    TestSchema.foo = field
+    TestSchema._invalidate()
+
+    result = TestSchema.parse_columns({"foo": column})
+    validated = result.columns["foo"]
+
+    for index, value in enumerate(_to_scalars(column)):
+        ok, expected = _scalar(field, value)
+        assert result.mask[index] == (not ok), (index, value)
+        if ok:
+            actual = validated[index]
+            if actual is np.ma.masked:
+                actual = None
+            elif hasattr(actual, "item"):
+                actual = actual.item()
+            assert actual == expected, (index, value)
+            if expected is not None:
+                assert type(actual) is type(expected), (index, value)
+
+
+def test_parse_columns():
+    class TestSchema(Schema):
+        age = IntField(min_val=18, required=True)
+        score = FloatField(max_val=100)
+        active = BoolField()
+        name = StringField(min_len=2)
+
+    result = TestSchema.parse_columns(
+        {
+            "age": np.array([20, 17, 30, 40]),
+            "score": np.array([10, 50, 101, 20]),
+            "active": np.array([True, False, True, False]),
+            "name": ["foo", "bar", "baz", "x"],
+        }
+    )
+
+    assert result.mask.tolist() == [False, True, True, True]
+    assert result.failures.tolist() == [1, 2, 3]
+    assert result.columns["score"].dtype == np.float64
+    assert result.columns["name"].tolist() == ["foo", "bar", "baz", None]
+
+
+def test_parse_columns_strict_type():
+    class TestSchema(Schema):
+        age = IntField()
+
+    TestSchema.age.strict_type = True
+    result = TestSchema.parse_columns({"age": np.array([1.0, 2.0])})
+    assert result.mask.tolist() == [True, True]
+
+
+def test_parse_columns_missing_column():
+    class TestSchema(Schema):
+        age = IntField(required=True)
+        name = StringField()
+
+    result = TestSchema.parse_columns({"name": ["foo", "bar"]})
+    assert result.mask.tolist() == [True, True]
+
+
+def test_parse_columns_mixed_sequence_not_coerced():
+    class TestSchema(Schema):
+        name = StringField(choices=["1"])
+
+    result = TestSchema.parse_columns({"name": [1, "a"]})
+    assert result.mask.tolist() == [False, True]
+    assert result.columns["name"].tolist() == ["1", None]
+
+
+def test_parse_columns_int_overflow():
+    class TestSchema(Schema):
+        age = IntField(min_val=1)
+
+    result = TestSchema.parse_columns(
+        {"age": np.array([1e20, 2.0, 0.0, np.inf, np.nan])}
+    )
+    assert result.mask.tolist() == [False, False, True, True, False]
+    assert result.columns["age"].tolist() == [10**20, 2, None, None, None]
+
+
+def test_parse_columns_length_mismatch():
+    class TestSchema(Schema):
+        age = IntField()
+        name = StringField()
+
+    with pytest.raises(ValidationError):
+        TestSchema.parse_columns({"age": np.array([1, 2]), "name": ["foo"]})
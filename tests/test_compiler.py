@@ -0,0 +1,151 @@
+import uuid
+
+import pytest
+
+from liaison.compiler import compile_check, compile_parse, is_inlinable
+from liaison.fields import (
+    StringField,
+    UUIDField,
+    IntField,
+    FloatField,
+    BoolField,
+    ListField,
+    SetField,
+    DictField,
+    DateTimeField,
+)
+from liaison.fields.base import Field
+from liaison.exceptions import ValidationError
+
+FIELDS = [
+    Field(type=str, input_types=(str,)),
+    StringField(),
+    StringField(required=True, min_len=2, max_len=5),
+    StringField(regex="^[a-z]+$"),
+    StringField(choices=["a", "b"], default="a"),
+    StringField(default=lambda: "DEFAULT"),
+    UUIDField(),
+    UUIDField(as_uuid=True, allow_hex=True, choices=[uuid.UUID(int=1)]),
+    IntField(),
+    IntField(min_val=5, max_val=10),
+    IntField(choices=[1, 2]),
+    FloatField(min_val=1.5),
+    BoolField(),
+    BoolField(default=True),
+    ListField(min_len=1, max_len=3),
+    SetField(max_len=4),
+    ListField(of=IntField(min_val=1, max_val=10)),
+    ListField(of=FloatField(min_val=1.5)),
+    ListField(of=StringField(min_len=2, max_len=3)),
+    ListField(of=BoolField(required=True)),
+    ListField(of=UUIDField()),
+    ListField(of=IntField(), as_array=True),
+    ListField(of=FloatField(max_val=5), as_array=True),
+    SetField(of=IntField(max_val=2)),
+    DictField(min_len=1),
+    DateTimeField(date_format="%d-%m-%Y"),
+]
+
+VALUES = [
+    None,
+    "",
+    "a",
+    "abc",
+    "abcdefg",
+    "7",
+    "1.5",
+    0,
+    1,
+    7,
+    12,
+    2.5,
+    True,
+    False,
+    [1, 2],
+    [1, 1, 2, 2, 3],
+    [1, 2.5, 3],
+    [1.5, 2.5],
+    [0.5, 2.5],
+    [1.5, float("nan")],
+    [1.5, float("inf")],
+    [1e308, 1e308],
+    [1, None],
+    [2**70],
+    ["ab", "abc"],
+    ["ab", "abcd"],
+    ["ab", 12],
+    [True, False],
+    [True, None],
+    [str(uuid.UUID(int=1))],
+    [],
+    {"a": 1},
+    {},
+    "09-10-2021",
+    str(uuid.UUID(int=1)),
+    uuid.UUID(int=1).hex,
+    uuid.UUID(int=2),
+]
+
+
+def _outcome(func, value):
+    try:
+        return "ok", func(value)
+    except ValidationError as e:
+        return "error", str(e)
+    except Exception as e:
+        return "exception", type(e)
+
+
+@pytest.mark.parametrize("field", FIELDS, ids=lambda f: type(f).__name__)
+def test_compiled_check_matches_validate(field):
+    check = compile_check("foo", field)
+    for value in VALUES:
+        expected = _outcome(lambda v: field.validate("foo", v), value)
+        assert _outcome(check, value) == expected, value
+
+
+@pytest.mark.parametrize("field", FIELDS, ids=lambda f: type(f).__name__)
+def test_specialized_parse_matches_validate(field):
+    parse = compile_parse(
+        "Test", [("foo", field)], lambda v: v, specialized={"foo": field.type}
+    )
+    for value in VALUES:
+        expected = _outcome(lambda v: field.validate("foo", v), value)
+        assert _outcome(lambda v: parse({"foo": v}), value) == expected, value
+
+
+def test_compiled_check_matches_validate_with_strict_type():
+    field = IntField(min_val=5)
+    field.strict_type = True
+    check = compile_check("foo", field)
+    for value in VALUES:
+        expected = _outcome(lambda v: field.validate("foo", v), value)
+        assert _outcome(check, value) == expected, value
+
+
+def test_compiled_check_uses_validator():
+    def my_validator(field_cls, key, value):
+        return f"{key}={value}"
+
+    field = StringField(min_len=2, validator=my_validator)
+    check = compile_check("foo", field)
+
+    assert check("bar") == "foo=bar"
+    with pytest.raises(ValidationError):
+        check("b")
+
+
+def test_custom_field_is_not_inlined():
+    class PasswordField(StringField):
+        def validate(self, key, value):  # pragma: no cover
+            value = super().validate(key, value)
+            if len(value) < 9:
+                raise ValidationError("Too short")
+            return value
+
+    assert is_inlinable(StringField())
+    assert is_inlinable(DateTimeField(date_format="%Y"))
+    assert not is_inlinable(PasswordField())
+
+    with pytest.raises(ValidationError):
+        compile_check("password", PasswordField())("password")
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 
 import pytest
 
@@ -17,3 +18,81 @@ def test_field_raises_validation_error():
     field = DateTimeField(date_format="%d-%m-%Y")
     with pytest.raises(ValidationError):
         value = field.validate("date", "2021-10-09")
+
+
+FORMATS = [
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%H:%M",
+    "%Y%m%d",
+    "%d %b %Y",
+]
+
+VALUES = [
+    "2021-10-09",
+    "09-10-2021",
+    "9-10-2021",
+    "09/10/2021",
+    "2021-1-9",
+    "2021-02-30",
+    "0000-01-01",
+    "2021-10-09T12:30:45",
+    "2021-10-09t12:30:45",
+    "2021-10-09T24:00:00",
+    "2021-10-09 12:30:45",
+    "2021-10-09  12:30:45",
+    "2021-10-09T12:30:45.123456",
+    "2021-10-09T12:30:45.123",
+    "12:30",
+    "20211009",
+    "09 Oct 2021",
+    "２０２１-10-09",
+    "",
+    "2021-10-09Z",
+]
+
+
+@pytest.mark.parametrize("date_format", FORMATS)
+@pytest.mark.parametrize("cache_size", [None, 8])
+def test_field_matches_strptime(date_format, cache_size):
+    field = DateTimeField(date_format=date_format, cache_size=cache_size)
+    for value in VALUES * 2:
+        try:
+            expected = datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            with pytest.raises(ValidationError):
+                field.validate("date", value)
+        else:
+            assert field.validate("date", value) == expected, value
+
+
+def test_field_datetime_passthrough():
+    field = DateTimeField(date_format="%Y-%m-%d")
+    value = datetime.datetime(2021, 10, 9, 12, 30)
+    assert field.validate("date", value) is value
+
+
+def test_field_cache():
+    field = DateTimeField(date_format="%d-%m-%Y", cache_size=2)
+    for _ in range(3):
+        field.validate("date", "09-10-2021")
+    info = field.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (2, 1, 2)
+    assert DateTimeField(date_format="%d-%m-%Y").cache_info() is None
+
+
+def test_field_date_format_changed():
+    field = DateTimeField(date_format="%d-%m-%Y")
+    field.date_format = "%Y-%m-%d"
+    assert field.validate("date", "2021-10-09") == datetime.datetime(2021, 10, 9)
+
+
+def test_field_pickle():
+    field = DateTimeField(date_format="%d-%m-%Y", cache_size=16)
+    field = pickle.loads(pickle.dumps(field))
+    assert field.validate("date", "09-10-2021") == datetime.datetime(2021, 10, 9)
+    assert field.cache_info().misses == 1
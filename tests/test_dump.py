@@ -0,0 +1,167 @@
+from array import array
+import io
+import json
+import uuid
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import (
+    StringField,
+    FloatField,
+    ListField,
+    SetField,
+    DictField,
+    DateTimeField,
+    UUIDField,
+    SchemaField,
+)
+
+ID = "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c"
+
+
+class AddressSchema(Schema):
+    city = StringField()
+    since = DateTimeField(date_format="%Y-%m-%d")
+
+
+class UserSchema(Schema):
+    name = StringField(required=True)
+    born = DateTimeField(date_format="%d/%m/%Y")
+    tags = SetField()
+    scores = ListField(of=FloatField(), as_array=True)
+    id = UUIDField(as_uuid=True)
+    meta = DictField()
+    address = SchemaField(AddressSchema)
+    history = ListField(of=SchemaField(AddressSchema))
+    dates = ListField(of=DateTimeField(date_format="%Y"))
+
+
+DATA = {
+    "name": "foo",
+    "born": "09/10/1990",
+    "tags": ["a"],
+    "scores": [1.5],
+    "id": ID,
+    "meta": {"a": 1},
+    "address": {"city": "Paris", "since": "2020-01-31"},
+    "history": [{"city": "Lyon"}],
+    "dates": ["2001"],
+}
+EXPECTED = {
+    "name": "foo",
+    "born": "09/10/1990",
+    "tags": ["a"],
+    "scores": [1.5],
+    "id": ID,
+    "meta": {"a": 1},
+    "address": {"city": "Paris", "since": "2020-01-31"},
+    "history": [{"city": "Lyon", "since": None}],
+    "dates": ["2001"],
+}
+
+
+def test_dump():
+    result = UserSchema.parse(DATA)
+    assert isinstance(result.id, uuid.UUID) and isinstance(result.scores, array)
+    assert UserSchema.dump(result) == EXPECTED
+    assert UserSchema.parse(UserSchema.dump(result)) == result
+
+
+def test_dump_skip_none():
+    result = UserSchema.parse({"name": "foo", "history": [{"city": "Lyon"}]})
+    assert UserSchema.dump(result, skip_none=True) == {
+        "name": "foo",
+        "history": [{"city": "Lyon"}],
+    }
+    assert UserSchema.dump(result)["born"] is None
+
+
+def test_dump_projection_and_lazy_results():
+    result = UserSchema.parse(DATA, only=["name", "born"])
+    assert UserSchema.dump(result) == {"name": "foo", "born": "09/10/1990"}
+    assert UserSchema.dump(UserSchema.parse_lazy(DATA)) == EXPECTED
+
+
+def test_dump_follows_field_changes():
+    class EventSchema(Schema):
+        at = DateTimeField(date_format="%Y-%m-%d")
+
+    result = EventSchema.parse({"at": "2021-10-09"})
+    EventSchema.at.date_format = "%d/%m/%Y"
+    assert EventSchema.dump(result) == {"at": "09/10/2021"}
+
+
+class TreeSchema(Schema):
+    value = StringField()
+    parent = SchemaField(lambda: TreeSchema)
+    children = ListField(of=SchemaField(lambda: TreeSchema))
+
+
+@pytest.mark.parametrize("skip_none", [False, True])
+def test_dump_deep_document(skip_none):
+    document = {"value": "leaf"}
+    for _ in range(5000):
+        document = {"value": "node", "children": [document, {"parent": {"value": "p"}}]}
+
+    dumped = TreeSchema.dump(TreeSchema.parse(document), skip_none=skip_none)
+
+    depth = 0
+    while dumped.get("children"):
+        sibling = dumped["children"][1]
+        assert sibling["parent"]["value"] == "p"
+        assert ("value" in sibling) is not skip_none
+        dumped = dumped["children"][0]
+        depth += 1
+    assert depth == 5000
+    assert dumped["value"] == "leaf"
+
+
+@pytest.mark.parametrize("encoder", [None, json.dumps])
+def test_dump_json_too_deep(encoder):
+    document = {"value": "leaf"}
+    for _ in range(100_000):
+        document = {"value": "node", "parent": document}
+    result = TreeSchema.parse(document)
+    assert TreeSchema.dump(result)["parent"]["value"] == "node"
+    with pytest.raises(ValueError, match="nested too deeply"):
+        TreeSchema.dump_json(result, encoder=encoder)
+    # Documents within the limit of the encoder are encoded
+    shallow = TreeSchema.parse({"value": "a", "parent": {"value": "b"}})
+    assert json.loads(
+        TreeSchema.dump_json(shallow, skip_none=True, encoder=encoder)
+    ) == {
+        "value": "a",
+        "parent": {"value": "b"},
+    }
+
+
+@pytest.mark.parametrize("encoder", [None, json.dumps])
+def test_dump_json(encoder):
+    result = UserSchema.parse(DATA)
+    assert json.loads(UserSchema.dump_json(result, encoder=encoder)) == EXPECTED
+    result = UserSchema.parse({"name": "é"})
+    assert json.loads(UserSchema.dump_json(result, skip_none=True)) == {"name": "é"}
+
+
+@pytest.mark.parametrize("fileobj", [io.StringIO, io.BytesIO])
+def test_dump_many(fileobj):
+    results = [UserSchema.parse(DATA), UserSchema.parse({"name": "bar"})]
+
+    f = fileobj()
+    assert UserSchema.dump_many(iter(results), f, skip_none=True) == 2
+    assert json.loads(f.getvalue()) == [
+        UserSchema.dump(results[0], skip_none=True),
+        {"name": "bar"},
+    ]
+
+    f = fileobj()
+    UserSchema.dump_many(results, f, ndjson=True)
+    lines = f.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        UserSchema.dump(result) for result in results
+    ]
+
+    f = fileobj()
+    assert UserSchema.dump_many([], f) == 0
+    assert json.loads(f.getvalue()) == []
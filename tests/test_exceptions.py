@@ -0,0 +1,70 @@
+import pickle
+
+import pytest
+
+from liaison.exceptions import ValidationError, FieldError, ValidationErrors
+from liaison.fields import StringField, IntField, DateTimeField
+
+
+def test_field_error_message():
+    error = FieldError("min_len", "name", "a", {"min_len": 2})
+    assert error.message == "Value for 'name' did not meet required length of 2"
+    assert str(error) == error.message
+    assert error.to_dict() == {
+        "code": "min_len",
+        "key": "name",
+        "message": error.message,
+        "params": {"min_len": 2},
+    }
+
+
+def test_validation_error_with_message():
+    error = ValidationError("Not allowed")
+    assert str(error) == error.message == "Not allowed"
+    assert (error.code, error.key, error.value, error.params) == (None, None, None, {})
+
+
+@pytest.mark.parametrize(
+    "field, value, code, params",
+    [
+        (StringField(min_len=2), "a", "min_len", {"min_len": 2}),
+        (StringField(max_len=2), "abc", "max_len", {"max_len": 2}),
+        (StringField(regex="^[a-z]+$"), "123", "pattern", {"pattern": "^[a-z]+$"}),
+        (StringField(choices=["a"]), "b", "choice", {}),
+        (StringField(required=True), None, "required", {}),
+        (IntField(min_val=5), 1, "min_val", {"min_val": 5}),
+        (IntField(max_val=5), 10, "max_val", {"max_val": 5}),
+        (IntField(), "a", "number", {}),
+        (StringField(), [1], "type", {"expected": "str"}),
+        (DateTimeField(date_format="%Y"), "a", "date_format", {"date_format": "%Y"}),
+    ],
+)
+def test_field_errors_are_structured(field, value, code, params):
+    with pytest.raises(ValidationError) as e:
+        field.validate("foo", value)
+    assert (e.value.code, e.value.key, e.value.value, e.value.params) == (
+        code,
+        "foo",
+        value,
+        params,
+    )
+
+
+def test_validation_errors():
+    errors = ValidationErrors(
+        [FieldError("required", "name", None, {}), ValidationError("Not allowed")]
+    )
+    assert len(errors) == 2
+    assert str(errors) == "Missing required value for 'name'; Not allowed"
+
+
+def test_validation_error_pickle():
+    error = pickle.loads(pickle.dumps(FieldError("min_val", "age", 1, {"min_val": 5})))
+    assert (error.code, error.key, error.value, error.params) == (
+        "min_val",
+        "age",
+        1,
+        {"min_val": 5},
+    )
+    errors = pickle.loads(pickle.dumps(ValidationErrors([error])))
+    assert str(errors) == "Value for 'age' must be at least 5"
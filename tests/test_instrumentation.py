@@ -0,0 +1,116 @@
+from liaison import Schema, ValidationError
+from liaison.fields import IntField, StringField
+from liaison.instrumentation import export_prometheus
+
+
+def _schema():
+    class UserSchema(Schema):
+        name = StringField(required=True)
+        age = IntField(min_val=18)
+
+    return UserSchema
+
+
+def _parse(schema, data):
+    try:
+        schema.parse(data)
+    except ValidationError:
+        pass
+
+
+def test_instrumentation_disabled_by_default():
+    schema = _schema()
+    assert schema.get_metrics() is None
+    assert schema._get_plan().metrics is None
+
+
+def test_instrumentation_records_calls_and_rejections():
+    schema = _schema()
+    metrics = schema.enable_instrumentation()
+    assert schema.enable_instrumentation() is metrics
+
+    _parse(schema, {"name": "foo", "age": 21})
+    _parse(schema, {"name": "foo", "age": 16})
+    _parse(schema, {"age": 21})
+    schema.parse_many([{"name": "foo"}, {"age": 21}])
+
+    # Fields are validated in name order, the name isn't validated once the age is rejected
+    stats = metrics.to_dict()
+    assert stats["age"]["calls"] == 5
+    assert stats["age"]["rejections"] == {"min_val": 1}
+    assert stats["name"]["calls"] == 4
+    assert stats["name"]["rejections"] == {"required": 2}
+    assert sum(stats["age"]["buckets"].values()) == 5
+    assert stats["age"]["total_ns"] > 0
+
+
+def test_instrumentation_custom_validator_rejection():
+    class TestSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        def validate_name(self, key, value):
+            raise ValidationError("Not allowed")
+
+    metrics = TestSchema.enable_instrumentation()
+    _parse(TestSchema, {"name": "foo"})
+    assert metrics.to_dict()["name"]["rejections"] == {"custom": 1}
+
+
+def test_disable_instrumentation():
+    schema = _schema()
+    schema.enable_instrumentation()
+    schema.disable_instrumentation()
+    assert schema.get_metrics() is None
+    assert schema._get_plan().metrics is None
+    assert schema.parse({"name": "foo"}).name == "foo"
+
+
+def test_instrumentation_not_inherited():
+    schema = _schema()
+    schema.enable_instrumentation()
+
+    class ChildSchema(schema):
+        pass
+
+    assert ChildSchema.get_metrics() is None
+    ChildSchema.parse({"name": "foo"})
+    assert schema.get_metrics().to_dict() == {}
+
+
+def test_instrumentation_reset():
+    schema = _schema()
+    metrics = schema.enable_instrumentation()
+    _parse(schema, {"name": "foo"})
+    metrics.reset()
+    assert metrics.to_dict()["name"]["calls"] == 0
+    _parse(schema, {"name": "foo"})
+    assert metrics.to_dict()["name"]["calls"] == 1
+
+
+def test_instrumentation_prometheus():
+    schema = _schema()
+    metrics = schema.enable_instrumentation(buckets=(10**12,))
+    _parse(schema, {"name": "foo", "age": 16})
+    _parse(schema, {"name": "foo", "age": 21})
+
+    lines = metrics.to_prometheus().splitlines()
+    assert "# TYPE liaison_field_duration_seconds histogram" in lines
+    assert (
+        'liaison_field_duration_seconds_bucket{schema="UserSchema",field="age",le="1000.0"} 2'
+        in lines
+    )
+    assert (
+        'liaison_field_duration_seconds_bucket{schema="UserSchema",field="age",le="+Inf"} 2'
+        in lines
+    )
+    assert (
+        'liaison_field_duration_seconds_count{schema="UserSchema",field="age"} 2'
+        in lines
+    )
+    assert (
+        'liaison_field_rejections_total{schema="UserSchema",field="age",code="min_val"} 1'
+        in lines
+    )
+    assert export_prometheus([schema]) == metrics.to_prometheus()
+    assert lines[-1] in export_prometheus().splitlines()
@@ -0,0 +1,274 @@
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, FloatField, StringField, ListField, SchemaField
+from liaison.exceptions import ValidationError, ValidationErrors, SchemaException
+from liaison.limits import Limits
+
+
+class LimitedSchema(Schema):
+    __limits__ = Limits(max_keys=3, max_size=64, unknown_keys="forbid")
+
+    id = IntField(required=True)
+    name = StringField()
+
+
+class ParentSchema(Schema):
+    child = SchemaField(LimitedSchema)
+    children = ListField(of=SchemaField(LimitedSchema))
+
+
+def test_limits_accept_payload():
+    assert LimitedSchema.parse({"id": 1, "name": "foo"}).to_dict() == {
+        "id": 1,
+        "name": "foo",
+    }
+
+
+def test_max_keys():
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse({"id": 1, "name": "foo", "a": 1, "b": 2})
+    assert e.value.code == "max_keys"
+    assert e.value.params == {"max_keys": 3, "count": 4}
+
+
+def test_max_keys_counts_every_key_before_validating():
+    class Schema2(Schema):
+        __limits__ = Limits(max_keys=2)
+
+        id = IntField(required=True)
+
+    assert Schema2.parse({"id": 1, "other": 2}).id == 1
+    with pytest.raises(ValidationError) as e:
+        Schema2.parse({"a": 1, "b": 2, "c": 3})
+    assert e.value.code == "max_keys"
+
+
+def test_unknown_keys_forbidden():
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse({"id": 1, "other": 2})
+    assert e.value.code == "unknown"
+    assert e.value.key == "other"
+    assert str(e.value) == "Unknown key 'other'"
+
+
+def test_unknown_keys_ignored_by_default():
+    class Schema2(Schema):
+        __limits__ = Limits(max_keys=10)
+
+        id = IntField()
+
+    assert Schema2.parse({"id": 1, "other": 2}).to_dict() == {"id": 1}
+
+
+def test_invalid_unknown_keys_policy():
+    with pytest.raises(SchemaException):
+
+        class Schema2(Schema):
+            __limits__ = Limits(unknown_keys="allow")
+
+            id = IntField()
+
+        Schema2.parse({"id": 1})
+
+
+def test_limits_are_inherited():
+    class ChildSchema(LimitedSchema):
+        extra = IntField()
+
+    assert ChildSchema.parse({"id": 1, "extra": 2}).extra == 2
+    with pytest.raises(ValidationError) as e:
+        ChildSchema.parse({"id": 1, "other": 2})
+    assert e.value.code == "unknown"
+
+
+@pytest.mark.parametrize(
+    "parse",
+    [
+        lambda data: LimitedSchema.parse(data),
+        lambda data: LimitedSchema.parse(data, only=["id"]),
+        lambda data: LimitedSchema.parse_lazy(data),
+    ],
+)
+def test_every_parse_function_checks_limits(parse):
+    with pytest.raises(ValidationError) as e:
+        parse({"id": 1, "other": 2})
+    assert e.value.code == "unknown"
+
+
+def test_parse_many_checks_limits_per_record():
+    results, errors = LimitedSchema.parse_many([{"id": 1}, {"id": 2, "other": 2}])
+    assert results[0].id == 1 and results[1] is None
+    assert [(error.index, error.error.code) for error in errors] == [(1, "unknown")]
+
+
+def test_projection_knows_every_field():
+    assert LimitedSchema.parse({"id": 1, "name": "foo"}, only=["id"]).to_dict() == {
+        "id": 1
+    }
+
+
+def test_collect_errors_checks_limits_first():
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse({"id": "x", "other": 2}, collect_errors=True)
+    assert not isinstance(e.value, ValidationErrors)
+    assert e.value.code == "unknown"
+
+
+def test_nested_limits():
+    assert ParentSchema.parse({"child": {"id": 1}}).child.id == 1
+    with pytest.raises(ValidationError) as e:
+        ParentSchema.parse({"child": {"id": 1, "other": 2}})
+    assert e.value.key == "child.other"
+    with pytest.raises(ValidationError) as e:
+        ParentSchema.parse({"children": [{"id": 1}, {"id": 1, "a": 1, "b": 2, "c": 3}]})
+    assert e.value.code == "max_keys"
+    assert e.value.key == "children[1]"
+
+
+def test_max_size_parse_json():
+    assert LimitedSchema.parse_json(b'{"id": 1}').id == 1
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse_json(b'{"id": 1, "name": "' + b"x" * 64 + b'"}')
+    assert e.value.code == "max_size"
+    # An explicit max_bytes takes precedence
+    assert (
+        LimitedSchema.parse_json(
+            b'{"id": 1, "name": "' + b"x" * 64 + b'"}', max_bytes=1024
+        ).id
+        == 1
+    )
+
+
+def test_max_size_parse_query():
+    assert LimitedSchema.parse_query("id=1&name=foo").id == 1
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse_query("id=1&name=" + "x" * 64)
+    assert e.value.code == "max_size"
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["id=1&name=foo&a=1&b=2", {"id": ["1"], "a": ["1"], "b": ["2"], "c": ["3"]}],
+)
+def test_max_keys_parse_query(query):
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse_query(query)
+    assert e.value.code == "max_keys"
+    assert e.value.params == {"max_keys": 3, "count": 4}
+
+
+def test_unknown_keys_parse_query():
+    with pytest.raises(ValidationError) as e:
+        LimitedSchema.parse_query("id=1&other=2")
+    assert e.value.code == "unknown"
+    assert e.value.key == "other"
+
+
+def test_limits_parse_headers():
+    class HeaderSchema(Schema):
+        __limits__ = Limits(max_keys=2, unknown_keys="forbid")
+
+        user_agent = StringField()
+        x_count = IntField()
+
+    headers = [(b"User-Agent", b"curl"), (b"X-Count", b"3")]
+    assert HeaderSchema.parse_headers(iter(headers)).to_dict() == {
+        "user_agent": "curl",
+        "x_count": 3,
+    }
+    with pytest.raises(ValidationError) as e:
+        HeaderSchema.parse_headers({"User-Agent": "curl", "Host": "example.com"})
+    assert e.value.code == "unknown"
+    assert e.value.key == "host"
+    with pytest.raises(ValidationError) as e:
+        HeaderSchema.parse_headers(headers + [(b"Cookie", b"a=1")])
+    assert e.value.code == "max_keys"
+
+
+@pytest.mark.parametrize("field_type", [IntField, FloatField])
+def test_max_digits(field_type):
+    class Schema2(Schema):
+        value = field_type(max_digits=5)
+
+    assert Schema2.parse({"value": 12345}).value == 12345
+    assert Schema2.parse_query("value=12345").value == 12345
+    for parse in (Schema2.parse, Schema2.parse_lazy):
+        with pytest.raises(ValidationError) as e:
+            parse({"value": "1" * 6}).value
+        assert e.value.code == "max_digits"
+    with pytest.raises(ValidationError) as e:
+        Schema2.parse_query("value=" + "1" * 6)
+    assert e.value.code == "max_digits"
+
+
+def test_max_digits_validate():
+    field = IntField(max_digits=3)
+    with pytest.raises(ValidationError) as e:
+        field.validate("foo", "1234")
+    assert e.value.code == "max_digits"
+
+
+def test_max_len_checked_before_regex():
+    calls = []
+
+    class Pattern:
+        pattern = "a+"
+
+        def match(self, value):
+            calls.append(value)
+            return True
+
+    field = StringField(max_len=5, regex="a+")
+    field.regex = Pattern()
+
+    class Schema2(Schema):
+        value = field
+
+    for validate in (
+        lambda v: field.validate("value", v),
+        lambda v: Schema2.parse({"value": v}),
+    ):
+        with pytest.raises(ValidationError) as e:
+            validate("a" * 6)
+        assert e.value.code == "max_len"
+    assert calls == []
+
+
+def test_regex_skips_missing_values():
+    class Schema2(Schema):
+        value = StringField(regex="a+")
+
+    assert Schema2.parse({}).value is None
+    assert StringField(regex="a+").validate("value", None) is None
+
+
+def test_limits_without_bounds_parse_unchanged():
+    class Schema2(Schema):
+        __limits__ = Limits()
+
+        id = IntField()
+
+    assert Schema2._compile().check_limits is None
+    assert Schema2.parse({"id": 1, "other": 2}).to_dict() == {"id": 1}
+
+
+@pytest.mark.parametrize("cache_errors", [False, True])
+@pytest.mark.parametrize("valid_first", [True, False])
+def test_limits_checked_with_cache(cache_errors, valid_first):
+    class CachedSchema(Schema):
+        __limits__ = Limits(unknown_keys="forbid")
+
+        a = IntField()
+
+    CachedSchema.enable_cache(cache_errors=cache_errors)
+    # Both payloads have the same cache key, as only the values of fields are keyed
+    payloads = [{"a": 1}, {"a": 1, "evil": 1}]
+    for _ in range(2):
+        for data in payloads if valid_first else reversed(payloads):
+            if "evil" in data:
+                with pytest.raises(ValidationError) as e:
+                    CachedSchema.parse(data)
+                assert e.value.code == "unknown"
+            else:
+                assert CachedSchema.parse(data).a == 1
@@ -1,7 +1,17 @@
+from array import array
+
 import pytest
 
-from liaison.fields import ListField, SetField
-from liaison.exceptions import ValidationError
+from liaison.schema import Schema
+from liaison.fields import (
+    ListField,
+    SetField,
+    IntField,
+    FloatField,
+    StringField,
+    SchemaField,
+)
+from liaison.exceptions import ValidationError, SchemaException
 
 
 def test_field():
@@ -32,3 +42,77 @@ def test_set_field():
     field = SetField()
     value = field.validate("foo", [1, 1, 2, 3, 3])
     assert value == {1, 2, 3}
+
+
+def test_field_of():
+    field = ListField(of=IntField(min_val=1))
+    assert field.validate("foo", [1, 2, 3.0]) == [1, 2, 3]
+    with pytest.raises(ValidationError) as e:
+        field.validate("foo", [1, 2, 0])
+    assert e.value.key == "foo[2]"
+    assert str(e.value) == "Value for 'foo[2]' must be at least 1"
+
+
+def test_set_field_of():
+    field = SetField(of=IntField())
+    assert field.validate("foo", [1, "1", 2]) == {1, 2}
+
+
+def test_set_field_of_schema_raises_schema_exception():
+    class TestSchema(Schema):
+        name = StringField()
+
+    with pytest.raises(SchemaException):
+        SetField(of=SchemaField(TestSchema))
+
+
+def test_field_of_in_schema():
+    class TestSchema(Schema):
+        tags = ListField(of=StringField(max_len=3), default=list)
+
+    assert TestSchema.parse({"tags": ["a", "b"]}).tags == ["a", "b"]
+    assert TestSchema.parse({}).tags == []
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse({"tags": ["a", "long"]})
+    assert e.value.key == "tags[1]"
+
+    TestSchema.tags.of.max_len = 4
+    assert TestSchema.parse({"tags": ["a", "long"]}).tags == ["a", "long"]
+
+
+def test_field_as_array():
+    field = ListField(of=IntField(), as_array=True)
+    assert field.validate("foo", [1, 2, "3"]) == array("q", [1, 2, 3])
+    assert ListField(of=FloatField(), as_array=True).validate("foo", [1, 2.5]) == array(
+        "d", [1.0, 2.5]
+    )
+    with pytest.raises(ValidationError) as e:
+        field.validate("foo", [1, None])
+    assert e.value.code == "array"
+
+
+def test_field_as_array_requires_number_items():
+    with pytest.raises(SchemaException):
+        ListField(as_array=True)
+    with pytest.raises(SchemaException):
+        ListField(of=StringField(), as_array=True)
+
+
+def test_field_of_homogeneous_in_schema():
+    class TestSchema(Schema):
+        ids = ListField(of=IntField(min_val=1))
+        values = ListField(of=FloatField(), as_array=True)
+
+    ids = list(range(1, 1000))
+    result = TestSchema.parse({"ids": ids, "values": [0.5] * 10})
+    assert result.ids == ids and result.ids is not ids
+    assert result.values == array("d", [0.5] * 10)
+
+    # Items failing the fast path are validated one by one
+    assert TestSchema.parse({"ids": [1, 2.0, 3.0]}).ids == [1, 2, 3]
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse({"ids": ids + [0]})
+    assert e.value.key == "ids[999]"
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse({"values": [1.0, "x"]})
+    assert e.value.key == "values[1]"
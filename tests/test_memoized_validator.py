@@ -0,0 +1,121 @@
+import pickle
+
+import pytest
+
+from liaison import Schema, ValidationError
+from liaison.cache import MemoizedValidator, non_deterministic
+from liaison.exceptions import SchemaException
+from liaison.fields import StringField, ListField
+
+CALLS = []
+
+
+def normalize(field, key, value):
+    CALLS.append(value)
+    if value == "bad":
+        raise ValidationError(f"Invalid value for '{key}'")
+    return value.upper() if isinstance(value, str) else value
+
+
+class CountrySchema(Schema):
+    country = StringField()
+
+    @country.validator(cache=2)
+    def validate_country(self, key, value):
+        return normalize(self, key, value)
+
+
+def test_validator_cache():
+    CALLS.clear()
+    CountrySchema.country._validator.cache_clear()
+    assert [CountrySchema.parse({"country": "gb"}).country for _ in range(3)] == [
+        "GB"
+    ] * 3
+    assert CALLS == ["gb"]
+    info = CountrySchema.country.validator_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (
+        2,
+        1,
+        0,
+        2,
+        1,
+    )
+
+
+def test_validator_cache_errors():
+    CALLS.clear()
+    field = StringField(validator=MemoizedValidator(normalize, maxsize=8))
+    for _ in range(2):
+        with pytest.raises(ValidationError) as e:
+            field.validate("country", "bad")
+        assert str(e.value) == "Invalid value for 'country'"
+    assert CALLS == ["bad"]
+
+
+def test_validator_cache_eviction():
+    field = StringField(validator=MemoizedValidator(normalize, maxsize=2))
+    for value in ["a", "b", "c", "a"]:
+        field.validate("country", value)
+    assert field.validator_cache_info().evictions == 2
+
+
+def test_validator_cache_types_and_unhashable_values():
+    CALLS.clear()
+    field = ListField(validator=MemoizedValidator(normalize, maxsize=8))
+    field.validate("tags", 1)
+    field.validate("tags", True)
+    field.validate("tags", ["a"])
+    field.validate("tags", ["a"])
+    assert CALLS == [1, True, ["a"], ["a"]]
+    assert field.validator_cache_info().currsize == 2
+
+
+def test_validator_cache_rejects_non_memoizable():
+    async def async_validator(field, key, value):
+        return value
+
+    with pytest.raises(SchemaException):
+        StringField().validator(async_validator, cache=8)
+    with pytest.raises(SchemaException):
+        StringField().validator(
+            non_deterministic(lambda field, key, value: value), cache=8
+        )
+
+
+def test_validator_cache_info_without_cache():
+    assert StringField().validator_cache_info() is None
+    assert CountrySchema.validate_country.__name__ == "validate_country"
+
+
+def test_validator_cache_pickle():
+    field = pickle.loads(
+        pickle.dumps(StringField(validator=MemoizedValidator(normalize, maxsize=8)))
+    )
+    assert field.validate("country", "gb") == "GB"
+    assert field.validator_cache_info().misses == 1
+
+
+def test_validator_cache_errors_are_not_shared():
+    class TagsSchema(Schema):
+        tags = ListField(
+            of=StringField(validator=MemoizedValidator(normalize, maxsize=8))
+        )
+        groups = ListField(
+            of=ListField(
+                of=StringField(validator=MemoizedValidator(normalize, maxsize=8))
+            )
+        )
+
+    for _ in range(3):
+        with pytest.raises(ValidationError) as e:
+            TagsSchema.parse({"tags": ["a", "b", "bad"]})
+        assert e.value.key == "tags[2]"
+        with pytest.raises(ValidationError) as e:
+            TagsSchema.parse({"groups": [["a"], ["b", "bad"]]})
+        assert e.value.key == "groups[1][1]"
+    error = CountrySchema.country._validator._lookup(
+        CountrySchema.country, "country", "bad"
+    )[1]
+    with pytest.raises(ValidationError) as e:
+        CountrySchema.parse({"country": "bad"})
+    assert e.value is not error
@@ -1,4 +1,12 @@
-from liaison.schema import Namespace
+import pickle
+
+from liaison.schema import Namespace, Schema
+from liaison.namespace import SchemaNamespace, namespace_class
+from liaison.fields import StringField
+
+
+class PickleSchema(Schema):
+    name = StringField()
 
 
 def test_namespace_attrs():
@@ -18,3 +26,90 @@ def test_namespace_dict_method():
     ns = Namespace(**{"foo": "bar", "age": 22})
     assert ns.to_dict() == {"foo": "bar", "age": 22}
     assert ns.to_dict(exclude=["foo"]) == {"age": 22}
+
+
+def test_namespace_dict_method_with_exclude_set():
+    ns = Namespace(**{"foo": "bar", "age": 22, "name": "baz"})
+    assert ns.to_dict(exclude={"foo", "age"}) == {"name": "baz"}
+
+
+def _schema_namespace():
+    from liaison.fields import StringField, IntField
+
+    class UserSchema(Schema):
+        name = StringField()
+        age = IntField()
+        get_ = StringField()
+
+    return UserSchema, UserSchema.parse({"name": "foo", "age": 22})
+
+
+def test_schema_namespace_class():
+    UserSchema, ns = _schema_namespace()
+    assert isinstance(ns, SchemaNamespace)
+    assert type(ns).__name__ == "UserSchemaNamespace"
+    assert type(ns).__slots__ == ("age", "get_", "name")
+    # No per instance dict, `__dict__` is a copy of the values for `vars`
+    assert type(ns).__dictoffset__ == 0
+
+
+def test_schema_namespace_namespace_compatibility():
+    _, ns = _schema_namespace()
+    assert isinstance(ns, Namespace) and not issubclass(Namespace, SchemaNamespace)
+    assert vars(ns) == {"age": 22, "get_": None, "name": "foo"}
+    vars(ns)["age"] = 30
+    assert ns.age == 22
+
+
+def test_schema_without_fields():
+    class EmptySchema(Schema):
+        pass
+
+    assert EmptySchema.parse({"a": 1}).to_dict() == {}
+
+
+def test_schema_namespace_attrs():
+    _, ns = _schema_namespace()
+    assert ns.name == "foo"
+    assert ns.age == 22
+    assert "name" in ns
+    assert "nope" not in ns
+
+    ns.age = 23
+    assert ns.age == 23
+
+
+def test_schema_namespace_get_method():
+    _, ns = _schema_namespace()
+    assert ns.get("name") == "foo"
+    assert ns.get("nope", "default") == "default"
+
+
+def test_schema_namespace_dict_method():
+    _, ns = _schema_namespace()
+    assert ns.to_dict() == {"age": 22, "get_": None, "name": "foo"}
+    assert list(ns.to_dict()) == ["age", "get_", "name"]
+    assert ns.to_dict(exclude=["age", "get_"]) == {"name": "foo"}
+
+
+def test_schema_namespace_equality_and_repr():
+    _, ns = _schema_namespace()
+    assert ns == Namespace(age=22, get_=None, name="foo")
+    assert ns != Namespace(age=23, get_=None, name="foo")
+    assert repr(ns) == "UserSchemaNamespace(age=22, get_=None, name='foo')"
+
+
+def test_schema_namespace_pickle():
+    assert pickle.loads(
+        pickle.dumps(PickleSchema.parse({"name": "foo"}))
+    ) == PickleSchema.parse({"name": "foo"})
+
+
+def test_namespace_class_with_non_identifier_fields():
+    class TestSchema(Schema):
+        pass
+
+    cls = namespace_class(TestSchema, ["a-b", "c"])
+    ns = cls(1, 2)
+    assert getattr(ns, "a-b") == 1
+    assert ns.to_dict() == {"a-b": 1, "c": 2}
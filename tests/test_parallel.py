@@ -0,0 +1,106 @@
+import pickle
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import StringField, IntField, FloatField, BoolField, DateTimeField
+from liaison.exceptions import ValidationError
+from liaison.parallel import _shared_format
+
+
+def shout(field, key, value):
+    return value.upper() if value else value
+
+
+class OrderSchema(Schema):
+    name = StringField(required=True, validator=shout)
+    code = StringField(regex="^[A-Z]{3}$")
+    quantity = IntField(min_val=1)
+    price = FloatField()
+    gift = BoolField()
+    big = IntField()
+    created = DateTimeField(date_format="%Y-%m-%d")
+
+    @code.validator
+    def validate_code(field, key, value):
+        if value == "BAD":
+            raise ValidationError("Bad code")
+        return value
+
+
+RECORDS = [
+    {
+        "name": "a",
+        "code": "ABC",
+        "quantity": 1,
+        "price": 1.5,
+        "gift": True,
+        "big": 1 << 70,
+    },
+    {"name": "b", "code": "BAD", "quantity": 2},
+    {"code": "ABC", "quantity": 3},
+    {
+        "name": "c",
+        "code": "DEF",
+        "quantity": 4,
+        "price": 2,
+        "gift": False,
+        "created": "2021-10-09",
+    },
+    {"name": "d", "code": "GHI", "quantity": 0},
+] * 5
+
+
+def test_fields_pickle():
+    field = pickle.loads(pickle.dumps(OrderSchema.code))
+    assert field._validator is OrderSchema.validate_code
+    assert field.regex.pattern == "^[A-Z]{3}$"
+    assert pickle.loads(pickle.dumps(OrderSchema.name))._validator is shout
+
+
+def test_schema_pickles_by_reference():
+    assert pickle.loads(pickle.dumps(OrderSchema)) is OrderSchema
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_parse_parallel_matches_parse_many(chunksize):
+    expected_results, expected_errors = OrderSchema.parse_many(RECORDS)
+
+    results, errors = OrderSchema.parse_parallel(
+        RECORDS, workers=2, chunksize=chunksize
+    )
+
+    assert results == expected_results
+    assert [(i, str(e)) for i, e in errors] == [(i, str(e)) for i, e in expected_errors]
+
+
+def test_parse_parallel_with_iterator():
+    results, errors = OrderSchema.parse_parallel(iter(RECORDS[:5]), workers=1)
+    assert [r.name if r else None for r in results] == ["A", None, None, "C", None]
+    assert [i for i, _ in errors] == [1, 4]
+
+
+def test_parse_parallel_reports_non_numeric_values():
+    records = [
+        {"name": "a", "quantity": [1]},
+        {"name": "b", "quantity": "0"},
+        {"name": "c", "quantity": "2", "price": {"a": 1}},
+        {"name": "d", "quantity": 3},
+    ] * 3
+
+    results, errors = OrderSchema.parse_parallel(records, workers=2, chunksize=2)
+
+    assert [r.name if r else None for r in results] == [None, None, None, "D"] * 3
+    codes = ["number", "min_val", "number"]
+    assert [(i, e.code) for i, e in errors] == [
+        (i + j, codes[j]) for i in (0, 4, 8) for j in range(3)
+    ]
+
+
+def test_shared_format():
+    assert _shared_format(IntField(), [1, None, 3]) == ("q", 8)
+    assert _shared_format(IntField(), [1, 1 << 70]) is None
+    assert _shared_format(IntField(), [1, True]) is None
+    assert _shared_format(FloatField(), [1.0, None]) == ("d", 8)
+    assert _shared_format(BoolField(), [True, None]) == ("?", 1)
+    assert _shared_format(StringField(), ["a"]) is None
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, StringField, DictField
+from liaison.exceptions import ValidationError
+from liaison.decoding import _stdlib_loads
+
+
+class TestSchema(Schema):
+    id = IntField(required=True)
+    name = StringField()
+    meta = DictField()
+
+
+DOCUMENT = '{"id": 1, "name": "foo", "meta": {"a": 1}, "unknown": [1, 2]}'
+
+
+@pytest.mark.parametrize("decoder", [None, _stdlib_loads])
+@pytest.mark.parametrize(
+    "raw", [DOCUMENT, DOCUMENT.encode(), memoryview(DOCUMENT.encode())]
+)
+def test_parse_json(decoder, raw):
+    result = TestSchema.parse_json(raw, decoder=decoder)
+    assert result.to_dict() == {"id": 1, "name": "foo", "meta": {"a": 1}}
+
+
+def test_parse_json_decoder():
+    assert TestSchema.parse_json(DOCUMENT, decoder=json.loads).id == 1
+
+
+def test_parse_json_validates():
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse_json(b'{"name": "foo"}')
+    assert e.value.code == "required"
+
+
+@pytest.mark.parametrize("raw", [b'{"id": 1', b"[1, 2]", b"\xff"])
+def test_parse_json_invalid_json_raises_validation_error(raw):
+    with pytest.raises(ValidationError):
+        TestSchema.parse_json(raw)
+
+
+def test_parse_json_max_bytes():
+    raw = DOCUMENT.encode()
+    assert TestSchema.parse_json(raw, max_bytes=len(raw)).id == 1
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse_json(raw, max_bytes=len(raw) - 1)
+    assert "exceeds the maximum" in str(e.value)
+
+    # Strings are measured in UTF-8 bytes
+    document = '{"id": 1, "name": "' + "é" * 10 + '"}'
+    with pytest.raises(ValidationError):
+        TestSchema.parse_json(document, max_bytes=len(document))
+    assert (
+        TestSchema.parse_json(document, max_bytes=len(document.encode())).name
+        == "é" * 10
+    )
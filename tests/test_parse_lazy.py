@@ -0,0 +1,84 @@
+import pickle
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, StringField, SchemaField
+from liaison.exceptions import ValidationError, SchemaException
+
+
+class AddressSchema(Schema):
+    city = StringField(required=True)
+
+
+class TestSchema(Schema):
+    id = IntField(required=True)
+    name = StringField(max_len=3)
+    count = IntField(default=5)
+    address = SchemaField(AddressSchema)
+
+
+def test_parse_lazy_validates_on_access():
+    result = TestSchema.parse_lazy({"id": "1", "name": "toolong"})
+    assert result.id == 1
+    assert result.count == 5
+    with pytest.raises(ValidationError) as e:
+        result.name
+    assert e.value.key == "name"
+
+
+def test_parse_lazy_checks_required_fields():
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse_lazy({"name": "foo"})
+    assert e.value.code == "required"
+    assert e.value.key == "id"
+
+
+def test_parse_lazy_caches_values():
+    data = {"id": "1"}
+    result = TestSchema.parse_lazy(data)
+    assert result.id == 1
+    data["id"] = "2"
+    assert result.id == 1
+
+
+def test_parse_lazy_validate_all():
+    result = TestSchema.parse_lazy(
+        {"id": 1, "name": "foo", "address": {"city": "Paris"}}
+    )
+    assert result.validate_all() is result
+    assert result == TestSchema.parse(
+        {"id": 1, "name": "foo", "address": {"city": "Paris"}}
+    )
+
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse_lazy({"id": 1, "address": {}}).validate_all()
+    assert e.value.key == "address.city"
+
+
+def test_parse_lazy_to_dict_validates_output_fields():
+    result = TestSchema.parse_lazy({"id": 1, "name": "toolong"})
+    assert result.to_dict(exclude=["name"]) == {"id": 1, "count": 5, "address": None}
+    with pytest.raises(ValidationError):
+        result.to_dict()
+
+
+def test_parse_lazy_namespace():
+    result = TestSchema.parse_lazy({"id": 1})
+    assert "id" in result
+    assert result.get("missing", 3) == 3
+    with pytest.raises(AttributeError):
+        result.missing
+    assert pickle.loads(pickle.dumps(result)) == TestSchema.parse({"id": 1})
+
+
+def test_parse_lazy_async_validator_raises_schema_exception():
+    class AsyncSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        async def validate_name(self, key, value):
+            return value
+
+    with pytest.raises(SchemaException):
+        AsyncSchema.parse_lazy({"name": "foo"})
@@ -0,0 +1,68 @@
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import IntField, StringField
+from liaison.exceptions import ValidationError, ValidationErrors
+
+
+class TestSchema(Schema):
+    id = IntField(required=True)
+    name = StringField(max_len=3)
+    count = IntField(default=5)
+
+
+def test_parse_only():
+    result = TestSchema.parse({"id": "1", "name": "toolong", "count": "x"}, only=["id"])
+    assert result.to_dict() == {"id": 1}
+    assert "name" not in result
+    with pytest.raises(AttributeError):
+        result.name
+
+
+def test_parse_exclude():
+    result = TestSchema.parse({"name": "foo"}, exclude=["id"])
+    assert result.to_dict() == {"count": 5, "name": "foo"}
+    with pytest.raises(ValidationError):
+        TestSchema.parse({"id": 1, "name": "toolong"}, exclude=["count"])
+
+
+def test_parse_only_and_exclude():
+    result = TestSchema.parse(
+        {"id": 1, "name": "foo"}, only=["id", "name", "unknown"], exclude=["id"]
+    )
+    assert result.to_dict() == {"name": "foo"}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"only": "name"}, {"exclude": "name"}, {"only": ["id"], "exclude": b"id"}],
+)
+def test_parse_projection_rejects_strings(kwargs):
+    with pytest.raises(TypeError):
+        TestSchema.parse({"id": 1, "name": "foo"}, **kwargs)
+
+
+def test_parse_projection_collect_errors():
+    with pytest.raises(ValidationErrors) as e:
+        TestSchema.parse(
+            {"name": "toolong", "count": "x"},
+            collect_errors=True,
+            only=["name", "count"],
+        )
+    assert sorted(error.key for error in e.value.errors) == ["count", "name"]
+
+
+def test_parse_projection_plans_are_cached():
+    plan = TestSchema._get_plan()
+    TestSchema.parse({"id": 1}, only=["id"])
+    projection = plan.projections[(("id",), ())]
+    TestSchema.parse({"id": 2}, only=["id"])
+    assert plan.projections[(("id",), ())] is projection
+
+    # Changing a field rebuilds the plan and its projections
+    TestSchema.name.max_len = 10
+    try:
+        assert TestSchema.parse({"name": "toolong"}, only=["name"]).name == "toolong"
+        assert TestSchema._get_plan() is not plan
+    finally:
+        TestSchema.name.max_len = 3
@@ -1,9 +1,9 @@
 import pytest
 
 from liaison.schema import Schema
-from liaison.fields import StringField, IntField
+from liaison.fields import StringField, IntField, FloatField, SchemaField
 from liaison.decorators import strict_types
-from liaison.exceptions import ValidationError
+from liaison.exceptions import ValidationError, ValidationErrors, SchemaException
 
 
 def test_schema_get_fields():
@@ -48,3 +48,273 @@ def test_schema_with_strict_decorator():
 
     with pytest.raises(ValidationError):
         TestSchemaStrict.parse(data)
+
+
+def test_schema_plan_is_built_at_class_creation():
+    class TestSchema(Schema):
+        name = StringField()
+        age = IntField()
+
+    assert TestSchema._plan is not None
+    assert TestSchema._plan.names == ("age", "name")
+
+
+def test_schema_plan_includes_inherited_fields():
+    class BaseSchema(Schema):
+        offset = IntField(min_val=0, default=20)
+        limit = IntField(max_val=100)
+
+    class ChildSchema(BaseSchema):
+        category = StringField()
+
+    assert ChildSchema._plan.names == ("category", "limit", "offset")
+    ns = ChildSchema.parse({"category": "shoes", "limit": 10})
+    assert ns.to_dict() == {"category": "shoes", "limit": 10, "offset": 20}
+
+    with pytest.raises(ValidationError):
+        ChildSchema.parse({"limit": 101})
+
+
+def test_schema_plan_rebuilt_when_validator_is_attached():
+    class TestSchema(Schema):
+        name = StringField()
+
+    assert TestSchema.parse({"name": "foo"}).name == "foo"
+
+    @TestSchema.name.validator
+    def validate_name(field, key, value):
+        return value.upper()
+
+    assert TestSchema.parse({"name": "foo"}).name == "FOO"
+
+
+def test_schema_plan_rebuilt_when_strict_types_applied():
+    class TestSchema(Schema):
+        age = IntField()
+
+    assert TestSchema.parse({"age": "30"}).age == 30
+
+    strict_types(TestSchema)
+
+    with pytest.raises(ValidationError):
+        TestSchema.parse({"age": "30"})
+
+
+def test_schema_plan_rebuilt_for_subclasses_when_base_field_changes():
+    class BaseSchema(Schema):
+        name = StringField()
+
+    class ChildSchema(BaseSchema):
+        age = IntField()
+
+    ChildSchema.parse({"name": "foo"})
+    BaseSchema.name.required = True
+
+    with pytest.raises(ValidationError):
+        ChildSchema.parse({"age": 1})
+
+
+def test_schema_plan_rebuilt_when_field_is_assigned():
+    class ParentSchema(Schema):
+        name = StringField()
+
+    class ChildSchema(ParentSchema):
+        age = IntField()
+
+    ParentSchema.extra = StringField(required=True)
+    assert ParentSchema.parse({"extra": "foo"}).extra == "foo"
+    assert ChildSchema.parse({"extra": "foo", "age": 1}).to_dict() == {
+        "age": 1,
+        "extra": "foo",
+        "name": None,
+    }
+    with pytest.raises(ValidationError):
+        ChildSchema.parse({})
+
+    ParentSchema.name = IntField()
+    assert ParentSchema.parse({"extra": "foo", "name": "12"}).name == 12
+    del ParentSchema.extra
+    assert ParentSchema.parse({"extra": "foo"}).to_dict() == {"name": None}
+    ChildSchema.age = None
+    assert ChildSchema.parse({"age": 1}).to_dict() == {"name": None}
+
+
+def test_schema_plan_rebuilt_when_field_is_assigned_to_inlined_schema():
+    class AddressSchema(Schema):
+        city = StringField()
+
+    class UserSchema(Schema):
+        address = SchemaField(AddressSchema)
+
+    assert UserSchema.parse(
+        {"address": {"city": "Paris", "zip": 75001}}
+    ).address.to_dict() == {"city": "Paris"}
+    AddressSchema.zip = IntField(required=True)
+    assert (
+        UserSchema.parse({"address": {"city": "Paris", "zip": "75001"}}).address.zip
+        == 75001
+    )
+    with pytest.raises(ValidationError):
+        UserSchema.parse({"address": {"city": "Paris"}})
+
+
+def test_frozen_schema_fields_can_not_be_assigned():
+    class FrozenSchema(Schema):
+        name = StringField()
+
+    FrozenSchema.freeze()
+    with pytest.raises(SchemaException):
+        FrozenSchema.extra = StringField()
+    with pytest.raises(SchemaException):
+        del FrozenSchema.name
+    assert [name for name, _ in FrozenSchema._get_fields()] == ["name"]
+
+
+def test_schema_with_custom_field():
+    class ShoutingField(StringField):
+        def validate(self, key, value):
+            return super().validate(key, value).upper()
+
+    class TestSchema(Schema):
+        name = ShoutingField()
+
+    assert TestSchema.parse({"name": "foo"}).name == "FOO"
+
+
+def test_schema_parse_many():
+    class TestSchema(Schema):
+        name = StringField(required=True)
+        age = IntField(min_val=18)
+
+    records = [
+        {"name": "foo", "age": 30},
+        {"age": 30},
+        {"name": "bar", "age": 16},
+        {"name": "baz"},
+    ]
+    results, errors = TestSchema.parse_many(records)
+
+    assert [r.to_dict() if r else None for r in results] == [
+        {"age": 30, "name": "foo"},
+        None,
+        None,
+        {"age": None, "name": "baz"},
+    ]
+    assert [index for index, _ in errors] == [1, 2]
+    assert str(errors[0].error) == "Missing required value for 'name'"
+    assert str(errors[1].error) == "Value for 'age' must be at least 18"
+
+
+def test_schema_parse_many_matches_parse():
+    class TestSchema(Schema):
+        name = StringField(min_len=2)
+        age = IntField(max_val=99)
+
+    records = [{"name": "foo", "age": 1}, {"name": "f", "age": 1000}, {"age": 7}]
+
+    results, errors = TestSchema.parse_many(iter(records))
+
+    for index, record in enumerate(records):
+        try:
+            expected = TestSchema.parse(record)
+        except ValidationError as e:
+            assert results[index] is None
+            assert str(dict(errors)[index]) == str(e)
+        else:
+            assert results[index] == expected
+
+
+def test_schema_parse_many_reports_non_numeric_values():
+    class TestSchema(Schema):
+        age = IntField(min_val=1)
+        score = FloatField(max_val=10)
+
+    records = [
+        {"age": [1]},
+        {"age": "5", "score": "2"},
+        {"age": "0"},
+        {"score": {"a": 1}},
+        {"age": float("inf")},
+        {"score": "11"},
+        {"age": 3},
+    ]
+    results, errors = TestSchema.parse_many(records)
+
+    assert [r.to_dict() if r else None for r in results] == [
+        None,
+        {"age": 5, "score": 2.0},
+        None,
+        None,
+        None,
+        None,
+        {"age": 3, "score": None},
+    ]
+    assert [(index, error.code) for index, error in errors] == [
+        (0, "number"),
+        (2, "min_val"),
+        (3, "number"),
+        (4, "number"),
+        (5, "max_val"),
+    ]
+
+
+def test_schema_parse_many_empty():
+    class TestSchema(Schema):
+        name = StringField()
+
+    assert TestSchema.parse_many([]) == ([], [])
+
+
+def test_schema_parse_collect_errors():
+    class TestSchema(Schema):
+        name = StringField(required=True)
+        age = IntField(min_val=18)
+        email = StringField(min_len=3)
+
+    with pytest.raises(ValidationErrors) as e:
+        TestSchema.parse({"age": 10, "email": "a"}, collect_errors=True)
+
+    assert [(error.code, error.key) for error in e.value] == [
+        ("min_val", "age"),
+        ("min_len", "email"),
+        ("required", "name"),
+    ]
+    assert e.value.errors[0].value == 10
+    assert e.value.errors[0].params == {"min_val": 18}
+    assert isinstance(e.value, ValidationError)
+
+    ns = TestSchema.parse({"name": "foo", "age": 20}, collect_errors=True)
+    assert ns.to_dict() == {"name": "foo", "age": 20, "email": None}
+
+
+def test_schema_parse_collect_errors_with_non_numeric_values():
+    class TestSchema(Schema):
+        age = IntField(min_val=18)
+        score = FloatField(max_val=10)
+        name = StringField(required=True)
+
+    with pytest.raises(ValidationErrors) as e:
+        TestSchema.parse({"age": [18], "score": "11"}, collect_errors=True)
+    assert [(error.code, error.key) for error in e.value] == [
+        ("number", "age"),
+        ("required", "name"),
+        ("max_val", "score"),
+    ]
+
+
+def test_schema_parse_collect_errors_sets_key_of_validator_errors():
+    class TestSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        def validate_name(self, key, value):
+            raise ValidationError("Not allowed")
+
+    with pytest.raises(ValidationErrors) as e:
+        TestSchema.parse({"name": "foo"}, collect_errors=True)
+
+    assert e.value.to_dict() == {
+        "errors": [
+            {"code": None, "key": "name", "message": "Not allowed", "params": {}}
+        ]
+    }
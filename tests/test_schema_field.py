@@ -0,0 +1,196 @@
+from collections import OrderedDict, defaultdict
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import StringField, IntField, ListField, SchemaField
+from liaison.exceptions import ValidationError, ValidationErrors
+
+
+class AddressSchema(Schema):
+    city = StringField(required=True)
+    zip_code = StringField(max_len=8)
+
+
+class OrderSchema(Schema):
+    order_id = IntField(required=True)
+    address = SchemaField(AddressSchema, required=True)
+    tags = ListField(of=StringField(max_len=5))
+
+
+class CustomerSchema(Schema):
+    name = StringField()
+    orders = ListField(of=SchemaField(OrderSchema))
+
+
+class TreeSchema(Schema):
+    value = IntField()
+    children = ListField(of=SchemaField(lambda: TreeSchema))
+
+
+def _order(order_id, city="London", tags=None):
+    return {"order_id": order_id, "address": {"city": city}, "tags": tags or []}
+
+
+def test_field():
+    field = SchemaField(AddressSchema)
+    value = field.validate("address", {"city": "London"})
+    assert value == AddressSchema.parse({"city": "London"})
+
+
+def test_field_none():
+    assert SchemaField(AddressSchema).validate("address", None) is None
+    with pytest.raises(ValidationError):
+        SchemaField(AddressSchema, required=True).validate("address", None)
+
+
+def test_field_incorrect_type_raises_validation_error():
+    with pytest.raises(ValidationError):
+        SchemaField(AddressSchema).validate("address", ["London"])
+
+
+def test_schema_parse_nested():
+    ns = CustomerSchema.parse(
+        {"name": "foo", "orders": [_order(1), _order(2, "Paris", ["a"])]}
+    )
+
+    assert ns.name == "foo"
+    assert [order.order_id for order in ns.orders] == [1, 2]
+    assert ns.orders[1].address.city == "Paris"
+    assert ns.orders[1].tags == ["a"]
+
+
+@pytest.mark.parametrize(
+    "orders, key, code",
+    [
+        (
+            [_order(1), _order(2), _order(3), {"order_id": 4, "address": {}}],
+            "orders[3].address.city",
+            "required",
+        ),
+        ([_order(1), {"order_id": 2}], "orders[1].address", "required"),
+        ([_order(1), _order(2, tags=["a", "toolong"])], "orders[1].tags[1]", "max_len"),
+        ([_order(1), "foo"], "orders[1]", "type"),
+        ([{"address": {"city": "London"}}], "orders[0].order_id", "required"),
+    ],
+)
+def test_schema_parse_nested_error_paths(orders, key, code):
+    with pytest.raises(ValidationError) as e:
+        CustomerSchema.parse({"orders": orders})
+    assert (e.value.key, e.value.code) == (key, code)
+    assert f"'{key}'" in str(e.value)
+
+
+def test_schema_parse_nested_validator_error_path():
+    class ItemSchema(Schema):
+        name = StringField()
+
+        @name.validator
+        def validate_name(self, key, value):
+            raise ValidationError("Not allowed")
+
+    class TestSchema(Schema):
+        items = ListField(of=SchemaField(ItemSchema))
+
+    with pytest.raises(ValidationError) as e:
+        TestSchema.parse({"items": [{"name": "foo"}]})
+    assert e.value.key == "items[0].name"
+    assert str(e.value) == "Not allowed"
+
+
+def test_schema_parse_deep_document():
+    document = None
+    for value in range(5000):
+        document = {"value": value, "children": [document] if document else []}
+
+    ns = TreeSchema.parse(document)
+
+    depth = 0
+    while ns.children:
+        ns = ns.children[0]
+        depth += 1
+    assert depth == 4999
+    assert ns.value == 0
+
+
+def test_schema_parse_deep_document_error_path():
+    document = {"value": "a"}
+    for _ in range(3):
+        document = {"value": 1, "children": [{"value": 2}, document]}
+
+    with pytest.raises(ValidationError) as e:
+        TreeSchema.parse(document)
+    assert e.value.key == "children[1].children[1].children[1].value"
+
+
+def test_schema_parse_many_nested():
+    results, errors = CustomerSchema.parse_many(
+        [{"orders": [_order(1)]}, {"orders": [{"order_id": 1}]}]
+    )
+    assert results[0].orders[0].address.city == "London"
+    assert [(index, error.key) for index, error in errors] == [(1, "orders[0].address")]
+
+
+def test_schema_parse_nested_collect_errors():
+    with pytest.raises(ValidationErrors) as e:
+        CustomerSchema.parse(
+            {"name": ["foo"], "orders": [{"order_id": 1}]}, collect_errors=True
+        )
+    assert [error.key for error in e.value] == ["name", "orders[0].address"]
+
+
+def test_schema_parse_nested_input_not_modified():
+    orders = [_order(1)]
+    CustomerSchema.parse({"orders": orders})
+    assert orders == [_order(1)]
+
+
+def test_schema_parse_nested_schema_changed():
+    class ItemSchema(Schema):
+        name = StringField()
+
+    class TestSchema(Schema):
+        item = SchemaField(ItemSchema)
+
+    assert TestSchema.parse({"item": {"name": "foo"}}).item.name == "foo"
+    ItemSchema.name.max_len = 2
+    with pytest.raises(ValidationError):
+        TestSchema.parse({"item": {"name": "foo"}})
+
+
+def test_field_validate_nested_error_path():
+    field = ListField(of=SchemaField(OrderSchema))
+    with pytest.raises(ValidationError) as e:
+        field.validate("orders", [_order(1), {"order_id": 2, "address": {}}])
+    assert e.value.key == "orders[1].address.city"
+
+
+def test_schema_parse_recursive_with_nested_error_path():
+    class LocatedTreeSchema(Schema):
+        address = SchemaField(AddressSchema)
+        children = ListField(of=SchemaField(lambda: LocatedTreeSchema))
+
+    document = {"children": [{}, {"children": [{"address": {"zip_code": "N1"}}]}]}
+    with pytest.raises(ValidationError) as e:
+        LocatedTreeSchema.parse(document)
+    assert (e.value.key, e.value.code) == (
+        "children[1].children[0].address.city",
+        "required",
+    )
+
+
+@pytest.mark.parametrize("mapping", [OrderedDict, lambda data: defaultdict(list, data)])
+def test_dict_subclass_is_validated(mapping):
+    order = {"order_id": 1, "address": mapping({"zip_code": "E1"})}
+    for parse, data in (
+        (OrderSchema.parse, order),
+        (CustomerSchema.parse, {"orders": [order]}),
+    ):
+        with pytest.raises(ValidationError) as e:
+            parse(data)
+        assert e.value.code == "required"
+    result = OrderSchema.parse({"order_id": 1, "address": mapping({"city": "London"})})
+    assert result.address == AddressSchema.parse({"city": "London"})
+    with pytest.raises(ValidationError) as e:
+        TreeSchema.parse({"children": [mapping({"value": "x"})]})
+    assert e.value.key == "children[0].value"
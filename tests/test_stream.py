@@ -0,0 +1,81 @@
+import io
+import mmap
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import StringField, IntField
+from liaison.exceptions import RowError, ValidationError
+from liaison.stream import iter_lines
+
+
+class UserSchema(Schema):
+    name = StringField(required=True)
+    age = IntField(min_val=18)
+
+
+LINES = [
+    '{"name": "foo", "age": 30}',
+    '{"age": 30}',
+    "",
+    "not json",
+    "[1, 2]",
+    '{"name": "bar", "age": 16}',
+    '{"name": "baz"}',
+]
+
+
+def _check_results(results):
+    assert [r.to_dict() for r in results if not isinstance(r, RowError)] == [
+        {"age": 30, "name": "foo"},
+        {"age": None, "name": "baz"},
+    ]
+    errors = [r for r in results if isinstance(r, RowError)]
+    assert [e.index for e in errors] == [2, 4, 5, 6]
+    assert all(isinstance(e.error, ValidationError) for e in errors)
+    assert str(errors[0].error) == "Missing required value for 'name'"
+    assert str(errors[2].error) == "Expected a JSON object on line 5"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_iter_parse_text(chunk_size):
+    fileobj = io.StringIO("\n".join(LINES))
+    _check_results(list(UserSchema.iter_parse(fileobj, chunk_size=chunk_size)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_iter_parse_binary(chunk_size):
+    fileobj = io.BytesIO(("\r\n".join(LINES) + "\r\n").encode())
+    _check_results(list(UserSchema.iter_parse(fileobj, chunk_size=chunk_size)))
+
+
+def test_iter_parse_mmap(tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(LINES) + "\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        _check_results(list(UserSchema.iter_parse(mm)))
+
+
+def test_iter_parse_continues_after_non_numeric_values():
+    lines = [
+        '{"name": "foo", "age": [1]}',
+        '{"name": "bar", "age": "5"}',
+        '{"name": "baz", "age": "30"}',
+    ]
+    results = list(UserSchema.iter_parse(io.StringIO("\n".join(lines))))
+
+    assert [(r.index, r.error.code) for r in results if isinstance(r, RowError)] == [
+        (1, "number"),
+        (2, "min_val"),
+    ]
+    assert results[2].to_dict() == {"age": 30, "name": "baz"}
+
+
+def test_iter_lines_keeps_long_lines_whole():
+    line = "x" * 1000
+    fileobj = io.StringIO(f"{line}\n{line}")
+    assert list(iter_lines(fileobj, chunk_size=3)) == [(1, line), (2, line)]
+
+
+def test_iter_lines_empty_file():
+    assert list(iter_lines(io.BytesIO(b""))) == []
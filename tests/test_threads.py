@@ -0,0 +1,209 @@
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from liaison.schema import Schema
+from liaison.decorators import strict_types
+from liaison.fields import (
+    IntField,
+    FloatField,
+    StringField,
+    BoolField,
+    ListField,
+    SchemaField,
+    DateTimeField,
+)
+from liaison.exceptions import ValidationError, SchemaException
+
+THREADS = 16
+
+
+class ItemSchema(Schema):
+    sku = StringField(required=True, regex="^[A-Z]{3}-[0-9]+$", max_len=12)
+    quantity = IntField(required=True, min_val=1, max_val=100)
+
+
+class OrderSchema(Schema):
+    id = IntField(required=True)
+    customer = StringField(min_len=2)
+    total = FloatField()
+    gift = BoolField()
+    currency = StringField(choices=["EUR", "USD"])
+    created = DateTimeField(date_format="%Y-%m-%d")
+    items = ListField(of=SchemaField(ItemSchema))
+    tags = ListField(of=StringField(max_len=5))
+    parent = SchemaField(lambda: OrderSchema)
+
+    @customer.validator(cache=64)
+    def validate_customer(field, key, value):
+        if value is not None and value.startswith("x"):
+            raise ValidationError(f"Invalid customer {value}")
+        return value
+
+
+def _payload(rng: random.Random, depth: int = 0) -> dict:
+    data = {
+        "id": rng.choice([1, 2, "3", 2**70, 4, 5, None]),
+        "customer": rng.choice(["alice", "bob", "carol", "xavier", None]),
+        "total": rng.choice([1.5, 2, "3.25", "nan", None]),
+        "gift": rng.choice([True, False, None]),
+        "currency": rng.choice(["EUR", "USD", "GBP", None]),
+        "created": rng.choice(["2021-10-09", "2022-01-01", "2021-13-09", None]),
+        "items": [
+            {
+                "sku": rng.choice(["ABC-1", "ABC-12", "DEF-7", "abc-1"]),
+                "quantity": rng.randint(1, 101),
+            }
+            for _ in range(rng.randint(0, 3))
+        ],
+        "tags": rng.sample(["a", "bb", "c", "dd", "toolong"], rng.randint(0, 2)),
+    }
+    if depth < 2 and rng.random() < 0.3:
+        data["parent"] = _payload(rng, depth + 1)
+    return data
+
+
+PAYLOADS = [_payload(random.Random(seed)) for seed in range(300)]
+
+
+def _outcome(func, data):
+    try:
+        return "ok", json.dumps(OrderSchema.dump(func(data)), sort_keys=True)
+    except ValidationError as e:
+        return type(e).__name__, str(e)
+
+
+PARSERS = [
+    lambda data: OrderSchema.parse(data),
+    lambda data: OrderSchema.parse(data, collect_errors=True),
+    lambda data: OrderSchema.parse(data, only=["id", "items", "parent"]),
+    lambda data: OrderSchema.parse_lazy(data).validate_all(),
+    lambda data: OrderSchema.parse_json(json.dumps(data)),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen():
+    OrderSchema.freeze()
+
+
+def test_freeze_freezes_nested_schemas():
+    assert OrderSchema.is_frozen() and ItemSchema.is_frozen()
+    assert isinstance(OrderSchema.parent._schema, type)
+
+
+def test_frozen_fields_are_immutable():
+    with pytest.raises(SchemaException):
+        OrderSchema.id.min_val = 5
+    with pytest.raises(SchemaException):
+        ItemSchema.quantity.max_val = 5
+    with pytest.raises(SchemaException):
+
+        @OrderSchema.total.validator
+        def validate_total(field, key, value):
+            return value
+
+    with pytest.raises(SchemaException):
+        strict_types(OrderSchema)
+    assert OrderSchema.id.min_val is None and not OrderSchema.id.strict_type
+
+
+def test_frozen_choices_are_immutable():
+    assert OrderSchema.currency.choices == frozenset(["EUR", "USD"])
+    with pytest.raises(AttributeError):
+        OrderSchema.currency.choices.add("GBP")
+    assert OrderSchema.parse({"id": 1, "currency": "EUR"}).currency == "EUR"
+    with pytest.raises(ValidationError):
+        OrderSchema.parse({"id": 1, "currency": "GBP"})
+
+    class ChoiceSchema(Schema):
+        tags = ListField(of=IntField(choices=[1, 2]))
+
+    ChoiceSchema.tags.of.choices = [1, 2, 3]
+    ChoiceSchema.freeze()
+    assert ChoiceSchema.tags.of.choices == (1, 2, 3)
+    assert ChoiceSchema.parse({"tags": [3]}).tags == [3]
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        lambda schema: schema.enable_cache(),
+        lambda schema: schema.disable_cache(),
+        lambda schema: schema.enable_instrumentation(),
+        lambda schema: schema.enable_adaptive(),
+        lambda schema: schema.disable_adaptive(),
+    ],
+)
+def test_frozen_schema_features_can_not_change(method):
+    with pytest.raises(SchemaException):
+        method(OrderSchema)
+
+
+def test_freeze_twice():
+    assert OrderSchema.freeze() is OrderSchema
+
+
+def test_freeze_is_not_inherited():
+    class ChildSchema(ItemSchema):
+        note = StringField()
+
+    assert not ChildSchema.is_frozen()
+    assert ChildSchema.parse({"sku": "ABC-1", "quantity": 1, "note": "x"}).note == "x"
+
+
+def test_freeze_rejects_cache_and_instrumentation():
+    class CachedSchema(Schema):
+        id = IntField()
+
+    CachedSchema.enable_cache()
+    with pytest.raises(SchemaException):
+        CachedSchema.freeze()
+    assert not CachedSchema.is_frozen()
+    CachedSchema.disable_cache()
+    CachedSchema.enable_instrumentation()
+    with pytest.raises(SchemaException):
+        CachedSchema.freeze()
+    CachedSchema.disable_instrumentation()
+    assert CachedSchema.freeze().is_frozen()
+
+
+def test_freeze_freezes_adaptive_profile():
+    class AdaptiveSchema(Schema):
+        id = IntField()
+
+    profile = AdaptiveSchema.enable_adaptive()
+    AdaptiveSchema.freeze()
+    assert profile.frozen
+    assert AdaptiveSchema.parse({"id": 1}).id == 1
+
+
+@pytest.mark.parametrize("index", range(len(PARSERS)))
+def test_parse_from_many_threads_matches_single_thread(index):
+    parse = PARSERS[index]
+    expected = [_outcome(parse, data) for data in PAYLOADS]
+    # Both results and errors are compared
+    assert 0 < sum(outcome[0] == "ok" for outcome in expected) < len(PAYLOADS)
+    barrier = threading.Barrier(THREADS)
+
+    def run(offset: int) -> list:
+        barrier.wait()
+        # Each thread starts at a different payload so threads parse different inputs at the same time
+        order = list(range(offset, len(PAYLOADS))) + list(range(offset))
+        outcomes = [None] * len(PAYLOADS)
+        for _ in range(3):
+            for i in order:
+                outcomes[i] = _outcome(parse, PAYLOADS[i])
+        return outcomes
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        results = list(
+            executor.map(
+                run, range(0, len(PAYLOADS), len(PAYLOADS) // THREADS)[:THREADS]
+            )
+        )
+    for outcomes in results:
+        assert outcomes == expected
@@ -1,4 +1,5 @@
 import uuid
+import pickle
 
 import pytest
 
@@ -29,3 +30,87 @@ def test_field_raises_validation_error_with_str():
     field = UUIDField()
     with pytest.raises(ValidationError):
         value = field.validate("foo", "1")
+
+
+VALUE = "6f1d5d6c-6bd5-4c1b-a2c6-1b6f5e1e4d2c"
+
+
+def test_field_uppercase():
+    field = UUIDField()
+    assert field.validate("uuid", VALUE.upper()) == VALUE.upper()
+
+
+@pytest.mark.parametrize(
+    "value, option",
+    [
+        (VALUE.replace("-", ""), "allow_hex"),
+        ("{" + VALUE + "}", "allow_braces"),
+        ("urn:uuid:" + VALUE, "allow_urn"),
+    ],
+)
+def test_field_other_forms(value, option):
+    with pytest.raises(ValidationError):
+        UUIDField().validate("uuid", value)
+    assert UUIDField(**{option: True}).validate("uuid", value) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        VALUE[:-1],
+        VALUE + "0",
+        VALUE.replace("-", "", 1),
+        VALUE.replace("6", "g", 1),
+        VALUE + "\n",
+        b"0" * 32,
+    ],
+)
+def test_field_invalid(value):
+    with pytest.raises(ValidationError):
+        UUIDField(allow_hex=True, allow_braces=True, allow_urn=True).validate(
+            "uuid", value
+        )
+
+
+def test_field_as_uuid():
+    field = UUIDField(as_uuid=True, allow_urn=True)
+    assert field.validate("uuid", VALUE) == uuid.UUID(VALUE)
+    assert field.validate("uuid", "urn:uuid:" + VALUE) == uuid.UUID(VALUE)
+    assert field.validate("uuid", uuid.UUID(VALUE)) == uuid.UUID(VALUE)
+    with pytest.raises(ValidationError):
+        UUIDField().validate("uuid", uuid.UUID(VALUE))
+
+
+def test_field_validate_many():
+    values = [str(uuid.uuid4()) for _ in range(5)]
+    field = UUIDField()
+    assert field.validate_many("uuid", values) == values
+    assert UUIDField(as_uuid=True).validate_many("uuid", values) == [
+        uuid.UUID(v) for v in values
+    ]
+    assert field.validate_many("uuid", []) == []
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [VALUE, "1"],
+        [VALUE + "\n" + VALUE],
+        [VALUE + "\n" + VALUE, ""],
+        [VALUE, None],
+    ],
+)
+def test_field_validate_many_invalid(values):
+    field = UUIDField(required=True)
+    with pytest.raises(ValidationError):
+        field.validate_many("uuid", values)
+
+
+def test_field_validate_many_none():
+    field = UUIDField(default=VALUE)
+    assert field.validate_many("uuid", [None, VALUE]) == [VALUE, VALUE]
+
+
+def test_field_pickle():
+    field = pickle.loads(pickle.dumps(UUIDField(allow_hex=True)))
+    assert field.validate("uuid", VALUE.replace("-", ""))
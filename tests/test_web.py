@@ -0,0 +1,160 @@
+import pytest
+
+from liaison.schema import Schema
+from liaison.fields import (
+    IntField,
+    FloatField,
+    BoolField,
+    StringField,
+    ListField,
+    SetField,
+)
+from liaison.exceptions import ValidationError
+
+
+class QuerySchema(Schema):
+    page = IntField(default=1, min_val=1)
+    active = BoolField()
+    ids = ListField(of=IntField())
+    tags = SetField()
+    search = StringField()
+    ratio = FloatField()
+
+
+class GetListMultiDict:
+    """A multi-dict like werkzeug's MultiDict and Django's QueryDict"""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+
+    def getlist(self, key):
+        return [value for k, value in self.pairs if k == key]
+
+
+class GetAllMultiDict(GetListMultiDict):
+    """A multi-dict like multidict's MultiDict, used by aiohttp"""
+
+    getlist = None
+
+    def getall(self, key, default):
+        return [value for k, value in self.pairs if k == key] or default
+
+
+EXPECTED = {
+    "page": 2,
+    "active": True,
+    "ids": [1, 2],
+    "tags": {"a"},
+    "search": "",
+    "ratio": 1.5,
+}
+PAIRS = [
+    ("page", "1"),
+    ("page", "2"),
+    ("active", "true"),
+    ("ids", "1"),
+    ("ids", "2"),
+    ("tags", "a"),
+    ("search", ""),
+    ("ratio", "1.5"),
+    ("unknown", "x"),
+]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "page=1&page=2&active=true&ids=1&ids=2&tags=a&search=&ratio=1.5&unknown=x",
+        b"page=1&page=2&active=true&ids=1&ids=2&tags=a&search=&ratio=1.5&unknown=x",
+        {
+            "page": ["1", "2"],
+            "active": ["true"],
+            "ids": ["1", "2"],
+            "tags": ["a"],
+            "search": [""],
+            "ratio": ["1.5"],
+        },
+        {
+            "page": "2",
+            "active": "true",
+            "ids": ["1", "2"],
+            "tags": "a",
+            "search": "",
+            "ratio": "1.5",
+        },
+        GetListMultiDict(PAIRS),
+        GetAllMultiDict(PAIRS),
+    ],
+)
+def test_parse_query(data):
+    assert QuerySchema.parse_query(data).to_dict() == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("1", True), ("Yes", True), ("off", False), ("FALSE", False)]
+)
+def test_parse_query_bool(value, expected):
+    assert QuerySchema.parse_query({"active": value}).active is expected
+
+
+def test_parse_query_empty_values_are_missing():
+    result = QuerySchema.parse_query("page=&active=&ids=")
+    assert result.page == 1
+    assert result.active is None
+
+
+@pytest.mark.parametrize(
+    "query, key, code",
+    [
+        ("active=maybe", "active", "type"),
+        ("page=x", "page", "number"),
+        ("page=0", "page", "min_val"),
+        ("ids=1&ids=x", "ids[1]", "number"),
+    ],
+)
+def test_parse_query_invalid(query, key, code):
+    with pytest.raises(ValidationError) as e:
+        QuerySchema.parse_query(query)
+    assert e.value.key == key
+    assert e.value.code == code
+
+
+class HeaderSchema(Schema):
+    user_agent = StringField(required=True)
+    x_request_count = IntField()
+    accept = ListField()
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {
+            "User-Agent": "curl",
+            "X-Request-Count": "3",
+            "Accept": "text/html, application/json",
+        },
+        [
+            (b"user-agent", b"curl"),
+            (b"x-request-count", b"3"),
+            (b"accept", b"text/html"),
+            (b"accept", b"application/json"),
+        ],
+        [
+            ("USER-AGENT", "curl"),
+            ("X-Request-Count", "3"),
+            ("Accept", "text/html,application/json"),
+        ],
+    ],
+)
+def test_parse_headers(headers):
+    assert HeaderSchema.parse_headers(headers).to_dict() == {
+        "user_agent": "curl",
+        "x_request_count": 3,
+        "accept": ["text/html", "application/json"],
+    }
+
+
+def test_parse_headers_required():
+    with pytest.raises(ValidationError) as e:
+        HeaderSchema.parse_headers({"Accept": "text/html"})
+    assert e.value.key == "user_agent"